@@ -0,0 +1,96 @@
+"""
+Benchmark response compression: size savings and per-request CPU cost.
+
+For a full-range /prices body the size of the Brent history and a /metrics
+body, reports the compressed size and compression time of gzip and brotli
+(when installed) at several settings, then the per-request cost of serving
+/prices through ``ResponseCache`` uncompressed, compressing on every
+request, and from the cached compressed variant.
+
+Usage:
+    python benchmarks/bench_api_compression.py [--n N] [--repeat N]
+"""
+
+import argparse
+import gzip
+import json
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "dashboard" / "backend"))
+
+from flask import Flask, Response  # noqa: E402
+
+from compression import GZIP, SUPPORTED_ENCODINGS, brotli, compress  # noqa: E402
+from metrics import MetricsSnapshot  # noqa: E402
+from response_cache import ResponseCache  # noqa: E402
+from serialization import PricePayload  # noqa: E402
+
+
+def make_prices(n: int) -> pd.DataFrame:
+    dates = pd.bdate_range("1987-05-20", periods=n, name="Date")
+    rng = np.random.default_rng(0)
+    prices = 30 * np.exp(np.cumsum(rng.normal(0, 0.02, size=n)))
+    df = pd.DataFrame({"Price": prices.round(2)}, index=dates)
+    df["log_return"] = np.log(df["Price"]).diff()
+    return df
+
+
+def codecs():
+    yield "gzip-1", lambda body: gzip.compress(body, compresslevel=1, mtime=0)
+    yield "gzip-6", lambda body: gzip.compress(body, compresslevel=6, mtime=0)
+    yield "gzip-9", lambda body: gzip.compress(body, compresslevel=9, mtime=0)
+    if brotli is not None:
+        for quality in (4, 9, 11):
+            yield f"br-{quality}", lambda body, q=quality: brotli.compress(body, quality=q)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--n", type=int, default=9000, help="number of observations")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    df_prices = make_prices(args.n)
+    rolling_vol = df_prices["log_return"].rolling(30).std()
+    payload = PricePayload(df_prices)
+    bodies = {
+        "/prices": payload.encode(),
+        "/metrics": json.dumps({"status": "success", **MetricsSnapshot.build(df_prices, rolling_vol, 50).to_dict()}).encode(),
+    }
+
+    print(f"{'body':<9} {'codec':<8} {'bytes':>9} {'ratio':>7} {'ms':>9}")
+    for route, body in bodies.items():
+        print(f"{route:<9} {'identity':<8} {len(body):9d} {1:7.2f} {0:9.3f}")
+        for name, func in codecs():
+            compressed = func(body)
+            seconds = min(timeit.repeat(lambda: func(body), number=1, repeat=args.repeat))
+            print(f"{route:<9} {name:<8} {len(compressed):9d} {len(body) / len(compressed):7.2f} {seconds * 1e3:9.3f}")
+
+    app = Flask(__name__)
+    cache = ResponseCache()
+    app.add_url_rule("/prices", "prices", cache.cached(lambda: Response(payload.encode(), mimetype="application/json")))
+    app.add_url_rule("/prices_uncached", "prices_uncached", lambda: Response(
+        compress(payload.encode(), GZIP), mimetype="application/json", headers={"Content-Encoding": GZIP}
+    ))
+    client = app.test_client()
+
+    print(f"\nper-request cost of full-range /prices (best of {args.repeat} x 20)")
+    candidates = [("identity, cached", "/prices", {}),
+                  ("gzip per request", "/prices_uncached", {"Accept-Encoding": GZIP})]
+    candidates += [(f"{encoding}, cached variant", "/prices", {"Accept-Encoding": encoding})
+                   for encoding in SUPPORTED_ENCODINGS]
+    for label, path, headers in candidates:
+        response = client.get(path, headers=headers)
+        seconds = min(timeit.repeat(lambda: client.get(path, headers=headers), number=20, repeat=args.repeat)) / 20
+        print(f"{label:<22} {len(response.data):9d} bytes {seconds * 1e3:9.3f} ms")
+    print(f"compressions performed by the cache: {cache.stats()['compressions']}")
+
+
+if __name__ == "__main__":
+    main()
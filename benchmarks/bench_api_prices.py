@@ -0,0 +1,72 @@
+"""
+Benchmark /prices serialization: per-record pandas loop vs pre-encoded rows.
+
+Compares the original handler body (frame copy, ``to_dict('records')``, a
+Python loop formatting dates and NaNs, then ``json.dumps``) with
+``PricePayload.encode`` on a synthetic price frame the size of the Brent
+history, for the full range and a one-year range.
+
+Usage:
+    python benchmarks/bench_api_prices.py [--n N] [--repeat N]
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "dashboard" / "backend"))
+
+from serialization import PricePayload  # noqa: E402
+
+
+def legacy_prices(df_prices: pd.DataFrame, start_date=None, end_date=None) -> bytes:
+    result_df = df_prices.copy()
+    if start_date:
+        result_df = result_df[result_df.index >= pd.to_datetime(start_date)]
+    if end_date:
+        result_df = result_df[result_df.index <= pd.to_datetime(end_date)]
+    result = result_df.reset_index().to_dict(orient='records')
+    for record in result:
+        if isinstance(record['Date'], pd.Timestamp):
+            record['Date'] = record['Date'].strftime('%Y-%m-%d')
+        if pd.isna(record.get('log_return')):
+            record['log_return'] = None
+    return json.dumps({"status": "success", "count": len(result), "data": result}).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--n", type=int, default=9000, help="number of observations")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    dates = pd.bdate_range("1987-05-20", periods=args.n, name="Date")
+    rng = np.random.default_rng(0)
+    prices = 30 * np.exp(np.cumsum(rng.normal(0, 0.02, size=args.n)))
+    df_prices = pd.DataFrame({"Price": prices.round(2)}, index=dates)
+    df_prices["log_return"] = np.log(df_prices["Price"]).diff()
+
+    payload = PricePayload(df_prices)
+    year_start, year_end = str(dates[-260].date()), str(dates[-1].date())
+
+    for label, bounds in [("full range", (None, None)), ("one year", (year_start, year_end))]:
+        assert json.loads(legacy_prices(df_prices, *bounds)) == json.loads(payload.encode(*bounds))
+        results = {}
+        candidates = [
+            ("legacy", lambda: legacy_prices(df_prices, *bounds)),
+            ("pre-encoded", lambda: payload.encode(*bounds)),
+        ]
+        for name, func in candidates:
+            times = timeit.repeat(func, number=1, repeat=args.repeat)
+            results[name] = min(times)
+            print(f"{label:<11} {name:<12} best {min(times) * 1e3:9.3f} ms")
+        print(f"{label:<11} speedup      {results['legacy'] / results['pre-encoded']:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Import-time benchmark for the ``src`` package.
+
+Runs ``python -X importtime`` in a fresh interpreter for a few typical entry
+points and reports the cumulative import time of the package together with
+the slowest top-level dependencies.
+
+Usage:
+    python benchmarks/bench_import_time.py [--repeat N] [--top N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+STATEMENTS = {
+    "package": "import src",
+    "data_loading": "from src import load_brent_data, load_events_data, calculate_returns",
+    "modeling": "from src import build_change_point_model",
+}
+
+
+def parse_importtime(stderr: str) -> dict:
+    """Parse ``-X importtime`` output into {module: cumulative_microseconds}."""
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        try:
+            timings[name.strip()] = int(cumulative)
+        except ValueError:
+            continue  # header line
+    return timings
+
+
+def measure(statement: str) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(completed.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5)
+    args = parser.parse_args()
+
+    for label, statement in STATEMENTS.items():
+        runs = [measure(statement) for _ in range(args.repeat)]
+        total_ms = [run.get("src", 0) / 1000 for run in runs]
+        print(f"{label:<14} {statement}")
+        print(f"  src cumulative: median {statistics.median(total_ms):8.1f} ms "
+              f"(min {min(total_ms):.1f}, max {max(total_ms):.1f})")
+
+        top_level = {
+            name: us for name, us in runs[-1].items()
+            if "." not in name and name != "src"
+        }
+        slowest = sorted(top_level.items(), key=lambda item: item[1], reverse=True)
+        for name, us in slowest[:args.top]:
+            print(f"    {name:<20} {us / 1000:8.1f} ms")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,29 +3,203 @@ Flask Backend API for Brent Oil Change Point Analysis Dashboard
 Provides endpoints for historical prices, change points, events, and metrics.
 """
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 from flask_cors import CORS
+from werkzeug.datastructures import MultiDict
 import pandas as pd
 import numpy as np
 from pathlib import Path
+import dataclasses
 import sys
-from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
-sys.path.append(str(project_root / "src"))
+sys.path.append(str(project_root))
 
-from data_loader import load_brent_data, calculate_returns, load_events_data
+# Importing from the package keeps PyMC/ArviZ out of the API process; the
+# modeling submodule is only loaded on first use.
+from src import (
+    EventIndex,
+    build_features,
+    build_price_pyramid,
+    calculate_returns,
+    load_brent_data,
+    load_change_points,
+    load_events_data,
+    window_sensitivity,
+)
+from src.config import BayesianModelConfig
+from src.constants import (
+    ARROW_STREAM_MIMETYPE,
+    CHANGE_POINTS_CSV,
+    DEFAULT_EVENT_WINDOW_DAYS,
+    DEFAULT_SENSITIVITY_WINDOWS,
+    PROCESSED_DATA_DIR,
+)
+from src.downsampling import AGG_LTTB, DAILY_RESOLUTION, PricePyramid
+from arrow_export import ARROW_AVAILABLE, FORMAT_ARROW, JSON_MIMETYPE, ArrowPrices, negotiate_format
+from change_points import ChangePointStore
+from jobs import JobManager, JobQueueFull
+from metrics import MetricsSnapshot, RangeMetrics
+from response_cache import ResponseCache
+from serialization import JsonRecords, PricePayload, SortedPager, parse_fields
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for React frontend
 
-# Load data once at startup
-print("Loading data...")
-df_prices = load_brent_data()
-df_prices['log_return'] = calculate_returns(df_prices, method='log')
-df_events = load_events_data()
-print("Data loaded successfully!")
+response_cache = ResponseCache(media_types=(JSON_MIMETYPE, ARROW_STREAM_MIMETYPE))
+
+
+@dataclasses.dataclass(frozen=True)
+class DataState:
+    """
+    Everything derived from one load of the price and event files.
+    
+    ``load_data`` builds a new state off to the side and publishes it with a
+    single reference assignment, like ``ChangePointStore`` does for change
+    points. Request handlers read the ``data`` global once and use that
+    object throughout, so they never see prices from one load and events
+    from another.
+    """
+    
+    df_prices: pd.DataFrame
+    df_features: pd.DataFrame
+    price_pyramid: PricePyramid
+    price_payload: PricePayload
+    level_payloads: Mapping[str, PricePayload]
+    arrow_prices: Optional[ArrowPrices]
+    df_events: pd.DataFrame
+    event_index: EventIndex
+    event_records: JsonRecords
+    events_pager: SortedPager
+    metrics_snapshot: MetricsSnapshot
+    range_metrics: RangeMetrics
+    
+    @classmethod
+    def build(cls, prices_df: pd.DataFrame, events_df: pd.DataFrame) -> "DataState":
+        """State for freshly loaded prices and events (treat both as read-only afterwards)."""
+        prices_df['log_return'] = calculate_returns(prices_df, method='log')
+        pyramid = build_price_pyramid(prices_df)
+        payload = PricePayload(prices_df)
+        payloads = {
+            name: payload if name == DAILY_RESOLUTION else PricePayload(pyramid.level(name))
+            for name in pyramid.resolutions
+        }
+        records = JsonRecords(events_df)
+        features = build_features(prices_df, windows=[30])
+        rolling_vol = features['volatility_30']
+        
+        return cls(
+            df_prices=prices_df,
+            df_features=features,
+            price_pyramid=pyramid,
+            price_payload=payload,
+            level_payloads=MappingProxyType(payloads),
+            arrow_prices=ArrowPrices(prices_df) if ARROW_AVAILABLE else None,
+            df_events=events_df,
+            event_index=EventIndex(events_df),
+            event_records=records,
+            events_pager=SortedPager(records.keys, scope="events"),
+            metrics_snapshot=MetricsSnapshot.build(prices_df, rolling_vol, len(events_df)),
+            range_metrics=RangeMetrics(prices_df, rolling_vol, events_df['Date']),
+        )
+
+
+def load_data():
+    """
+    Load prices and events and rebuild everything derived from them.
+    The new ``DataState`` is published in one assignment and the response
+    cache is invalidated right after; responses computed against the
+    previous data version are never stored.
+    """
+    global data
+    
+    print("Loading data...")
+    state = DataState.build(load_brent_data(), load_events_data())
+    data = state
+    response_cache.invalidate()
+    print("Data loaded successfully!")
+
+
+# Set by create_app. Importing this module has no side effects, because the
+# job pool's spawned workers re-import the server script as __mp_main__.
+data: Optional[DataState] = None
+change_point_store: Optional[ChangePointStore] = None
+job_manager: Optional[JobManager] = None
+
+
+def create_app() -> Flask:
+    """
+    Load the data and start the background services; returns the app.
+    Call once per server process before serving requests (``python app.py``
+    does).
+    """
+    global change_point_store, job_manager
+    
+    load_data()
+    
+    # Saved change point results, reloaded when the file changes. Swapping in a
+    # new snapshot invalidates the cached responses built from the old one.
+    change_point_store = ChangePointStore(
+        CHANGE_POINTS_CSV, load_change_points, on_swap=lambda snapshot: response_cache.invalidate()
+    )
+    change_point_store.start()
+    
+    # Model fits requested through /jobs; results are kept under data/processed/jobs
+    job_manager = JobManager(PROCESSED_DATA_DIR / "jobs")
+    return app
+
+
+def events_body(state: DataState, start_date=None, end_date=None, rows=None, fields=None) -> bytes:
+    """
+    The unpaged /events body for a date range (original event order),
+    optionally restricted to the records at ``rows`` (e.g. search hits).
+    """
+    if start_date or end_date:
+        pager = state.events_pager if rows is None else SortedPager(state.event_records.keys, rows, scope="events")
+        positions = np.sort(pager.order[pager.locate(start_date, end_date)])
+    else:
+        positions = np.arange(len(state.event_records)) if rows is None else rows
+    return state.event_records.encode_positions(positions, fields=fields)
+
+
+def associations_body(state: DataState, window_days: int) -> bytes:
+    """The /associations body: events within window_days of each change point."""
+    snapshot = change_point_store.snapshot
+    cp_dates = snapshot.change_points['change_date']
+    _, cp_ids, positions = state.event_index.window_join(cp_dates, window_days)
+    
+    associations = []
+    event_rows = state.df_events.iloc[positions]
+    for cp_id, event_date, event, description in zip(
+        cp_ids, event_rows['Date'], event_rows['Event'], event_rows['Description']
+    ):
+        associations.append({
+            "change_point_date": snapshot.dates[cp_id],
+            "event_date": event_date.strftime('%Y-%m-%d'),
+            "event": event,
+            "description": description,
+            "days_from_change": (event_date - cp_dates.iloc[cp_id]).days
+        })
+    
+    return app.json.dumps({
+        "status": "success",
+        "version": snapshot.version,
+        "window_days": window_days,
+        "count": len(associations),
+        "data": associations
+    }).encode()
+
+
+def metrics_body(state: DataState, start_date=None, end_date=None) -> bytes:
+    """The /metrics body, for the full history or a date range."""
+    if start_date or end_date:
+        result = state.range_metrics.compute(start_date, end_date)
+    else:
+        result = state.metrics_snapshot.to_dict()
+    return app.json.dumps({"status": "success", **result}).encode()
 
 
 @app.route("/")
@@ -39,277 +213,360 @@ def index():
             "/changepoints",
             "/events",
             "/associations",
-            "/metrics"
-        ]
+            "/associations/sensitivity",
+            "/metrics",
+            "/dashboard",
+            "/reload",
+            "/jobs"
+        ],
+        "cache": response_cache.stats(),
+        "change_points": change_point_store.stats(),
+        "jobs": job_manager.stats()
     })
 
 
 @app.route("/prices")
+@response_cache.cached
 def prices():
     """
     Get historical Brent oil price data.
     Optional query parameters:
     - start_date: YYYY-MM-DD format
     - end_date: YYYY-MM-DD format
+    - max_points: return at most this many points for the range
+    - agg: 'lttb' (default, daily fields) or 'ohlc' (Open/High/Low/Close
+      buckets); only used with max_points
+    - fields: comma-separated fields to return, e.g. Date,Price
+    - limit, after: page size and the next_cursor of the previous page
+    - format: 'json' (default) or 'arrow' for an Arrow IPC stream of the
+      range (also selected by Accept: application/vnd.apache.arrow.stream);
+      Arrow supports start_date, end_date and fields
     """
     try:
-        result_df = df_prices.copy()
+        state = data
+        start_date = request.args.get('start_date') or None
+        end_date = request.args.get('end_date') or None
+        fields = parse_fields(request.args.get('fields'))
+        max_points = request.args.get('max_points')
+        limit = request.args.get('limit')
+        after = request.args.get('after') or None
         
-        # Filter by date range if provided
-        start_date = request.args.get('start_date')
-        end_date = request.args.get('end_date')
+        if negotiate_format(request.args, request.accept_mimetypes) == FORMAT_ARROW:
+            if state.arrow_prices is None:
+                return jsonify({"status": "error", "message": "Arrow export requires pyarrow"}), 406
+            if max_points or limit or after:
+                raise ValueError("format=arrow supports start_date, end_date and fields only")
+            return Response(
+                state.arrow_prices.encode(start_date, end_date, fields=fields), mimetype=ARROW_STREAM_MIMETYPE
+            )
         
-        if start_date:
-            start_date = pd.to_datetime(start_date)
-            result_df = result_df[result_df.index >= start_date]
-        
-        if end_date:
-            end_date = pd.to_datetime(end_date)
-            result_df = result_df[result_df.index <= end_date]
-        
-        # Convert to JSON-friendly format
-        result = result_df.reset_index().to_dict(orient='records')
-        
-        # Format dates as strings
-        for record in result:
-            if isinstance(record['Date'], pd.Timestamp):
-                record['Date'] = record['Date'].strftime('%Y-%m-%d')
-            # Handle NaN values
-            if pd.isna(record.get('log_return')):
-                record['log_return'] = None
-        
-        return jsonify({
-            "status": "success",
-            "count": len(result),
-            "data": result
-        })
+        if max_points:
+            agg = request.args.get('agg', AGG_LTTB)
+            resolution, positions = state.price_pyramid.plan(int(max_points), start_date, end_date, agg=agg)
+            body = state.level_payloads[resolution].encode_positions(
+                positions, fields=fields, resolution=resolution, agg=agg
+            )
+        elif limit or after:
+            body = state.price_payload.encode_page(
+                start_date, end_date, after=after, limit=int(limit) if limit else None, fields=fields
+            )
+        else:
+            body = state.price_payload.encode(start_date, end_date, fields=fields)
+        return Response(body, mimetype='application/json')
     
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
 
 
 @app.route("/changepoints")
+@response_cache.cached
 def changepoints():
     """
     Get detected change points.
-    For now, returns example change points. In production, these would come
-    from the Bayesian model results saved after running notebook 03.
+    Served from the saved model results (CHANGE_POINTS_CSV), reloaded
+    automatically when the file changes; example change points are served
+    until results have been saved. The response carries the snapshot
+    version and source.
     """
     try:
-        # Example change points (should be loaded from saved model results)
-        # In production, load from a saved file like:
-        # change_points_df = pd.read_csv("../../data/processed/change_points.csv")
-        
-        change_points = [
-            {
-                "date": "2008-09-15",
-                "index": 5000,
-                "mu_1": 0.0001,
-                "mu_2": -0.0005,
-                "sigma": 0.02,
-                "impact": -0.0006,
-                "impact_pct": -0.06,
-                "confidence": 0.95
-            },
-            {
-                "date": "2014-11-27",
-                "index": 6500,
-                "mu_1": -0.0002,
-                "mu_2": -0.0008,
-                "sigma": 0.025,
-                "impact": -0.0006,
-                "impact_pct": -0.06,
-                "confidence": 0.92
-            },
-            {
-                "date": "2020-03-08",
-                "index": 8000,
-                "mu_1": 0.0003,
-                "mu_2": -0.0015,
-                "sigma": 0.03,
-                "impact": -0.0018,
-                "impact_pct": -0.18,
-                "confidence": 0.98
-            },
-            {
-                "date": "2022-02-24",
-                "index": 8500,
-                "mu_1": -0.0005,
-                "mu_2": 0.0012,
-                "sigma": 0.028,
-                "impact": 0.0017,
-                "impact_pct": 0.17,
-                "confidence": 0.94
-            }
-        ]
-        
-        return jsonify({
-            "status": "success",
-            "count": len(change_points),
-            "data": change_points
-        })
+        return Response(change_point_store.snapshot.body, mimetype='application/json')
     
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
 
 
 @app.route("/events")
+@response_cache.cached
 def events():
     """
     Get key geopolitical and economic events.
     Optional query parameters:
     - start_date: YYYY-MM-DD format
     - end_date: YYYY-MM-DD format
+    - q: keywords matched against event names and descriptions (prefixes
+      match, all keywords must be present)
+    - fields: comma-separated fields to return, e.g. Date,Event
+    - limit, after: page size and the next_cursor of the previous page;
+      paged results are in date order
     """
     try:
-        result_df = df_events.copy()
-        
-        # Filter by date range if provided
-        start_date = request.args.get('start_date')
-        end_date = request.args.get('end_date')
+        state = data
+        start_date = request.args.get('start_date') or None
+        end_date = request.args.get('end_date') or None
+        fields = parse_fields(request.args.get('fields'))
+        limit = request.args.get('limit')
+        after = request.args.get('after') or None
         
-        if start_date:
-            start_date = pd.to_datetime(start_date)
-            result_df = result_df[result_df['Date'] >= start_date]
+        query = request.args.get('q')
+        rows = state.event_index.text_index.search(query) if query else None
         
-        if end_date:
-            end_date = pd.to_datetime(end_date)
-            result_df = result_df[result_df['Date'] <= end_date]
-        
-        # Convert to JSON-friendly format
-        result = result_df.to_dict(orient='records')
-        
-        # Format dates as strings
-        for record in result:
-            if isinstance(record['Date'], pd.Timestamp):
-                record['Date'] = record['Date'].strftime('%Y-%m-%d')
-        
-        return jsonify({
-            "status": "success",
-            "count": len(result),
-            "data": result
-        })
+        if limit or after:
+            pager = state.events_pager if rows is None else SortedPager(state.event_records.keys, rows, scope="events")
+            positions, next_cursor = pager.page(
+                start_date, end_date, after=after, limit=int(limit) if limit else None
+            )
+            body = state.event_records.encode_positions(positions, fields=fields, next_cursor=next_cursor)
+        else:
+            body = events_body(state, start_date, end_date, rows=rows, fields=fields)
+        return Response(body, mimetype='application/json')
     
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
 
 
 @app.route("/associations")
+@response_cache.cached
 def associations():
     """
     Get change point-event associations.
     Matches change points with events within a time window.
     """
     try:
-        # Get change points (from /changepoints endpoint logic)
-        change_points = [
-            {"date": "2008-09-15", "index": 5000},
-            {"date": "2014-11-27", "index": 6500},
-            {"date": "2020-03-08", "index": 8000},
-            {"date": "2022-02-24", "index": 8500}
-        ]
-        
-        window_days = int(request.args.get('window_days', 30))
+        window_days = int(request.args.get('window_days', DEFAULT_EVENT_WINDOW_DAYS))
+        return Response(associations_body(data, window_days), mimetype='application/json')
+    
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+    except Exception as e:
+        return jsonify({"status": "error", "message": str(e)}), 500
+
+
+@app.route("/associations/sensitivity")
+@response_cache.cached
+def associations_sensitivity():
+    """
+    Get match counts and nearest events for several window sizes at once.
+    Optional query parameters:
+    - windows: comma-separated window sizes in days (default 7,14,30,60,90)
+    """
+    try:
+        windows_arg = request.args.get('windows')
+        if windows_arg:
+            windows = sorted({int(w) for w in windows_arg.split(',') if w.strip()})
+        else:
+            windows = list(DEFAULT_SENSITIVITY_WINDOWS)
         
-        associations = []
+        snapshot = change_point_store.snapshot
+        sweep = window_sensitivity(snapshot.change_points, data.event_index, windows=windows)
+        match_counts = sweep.pivot(
+            index='window_days', columns='change_point_date', values='match_count'
+        )
         
-        for cp in change_points:
-            cp_date = pd.to_datetime(cp['date'])
-            start = cp_date - timedelta(days=window_days)
-            end = cp_date + timedelta(days=window_days)
-            
-            # Find events within window
-            matched_events = df_events[
-                (df_events['Date'] >= start) & 
-                (df_events['Date'] <= end)
-            ].copy()
-            
-            if not matched_events.empty:
-                for _, event in matched_events.iterrows():
-                    days_diff = (event['Date'] - cp_date).days
-                    associations.append({
-                        "change_point_date": cp['date'],
-                        "event_date": event['Date'].strftime('%Y-%m-%d'),
-                        "event": event['Event'],
-                        "description": event['Description'],
-                        "days_from_change": days_diff
-                    })
+        records = []
+        for row in sweep.itertuples(index=False):
+            matched = row.match_count > 0
+            records.append({
+                "window_days": int(row.window_days),
+                "change_point_date": row.change_point_date.strftime('%Y-%m-%d'),
+                "match_count": int(row.match_count),
+                "nearest_event": row.nearest_event if matched else None,
+                "nearest_event_date": row.nearest_event_date.strftime('%Y-%m-%d') if matched else None,
+                "days_from_change": int(row.days_from_change) if matched else None
+            })
         
         return jsonify({
             "status": "success",
-            "window_days": window_days,
-            "count": len(associations),
-            "data": associations
+            "windows": [int(w) for w in match_counts.index],
+            "version": snapshot.version,
+            "change_points": list(snapshot.dates),
+            "match_counts": match_counts.astype(int).values.tolist(),
+            "count": len(records),
+            "data": records
         })
     
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
 
 
 @app.route("/metrics")
+@response_cache.cached
 def metrics():
     """
     Get summary statistics and key metrics.
+    Full-history metrics are computed once per data load; with start_date
+    and/or end_date (YYYY-MM-DD) they are restricted to that range.
     """
     try:
-        # Calculate metrics
-        price_stats = {
-            "mean": float(df_prices['Price'].mean()),
-            "std": float(df_prices['Price'].std()),
-            "min": float(df_prices['Price'].min()),
-            "max": float(df_prices['Price'].max()),
-            "min_date": df_prices['Price'].idxmin().strftime('%Y-%m-%d'),
-            "max_date": df_prices['Price'].idxmax().strftime('%Y-%m-%d')
-        }
-        
-        returns_stats = {
-            "mean": float(df_prices['log_return'].mean()),
-            "std": float(df_prices['log_return'].std()),
-            "min": float(df_prices['log_return'].min()),
-            "max": float(df_prices['log_return'].max())
-        }
-        
-        # Volatility metrics
-        rolling_vol = df_prices['log_return'].rolling(window=30).std()
-        volatility_stats = {
-            "mean_30day": float(rolling_vol.mean()),
-            "max_30day": float(rolling_vol.max()),
-            "max_vol_date": rolling_vol.idxmax().strftime('%Y-%m-%d')
-        }
-        
-        # Date range
-        date_range = {
-            "start": df_prices.index.min().strftime('%Y-%m-%d'),
-            "end": df_prices.index.max().strftime('%Y-%m-%d'),
-            "total_days": int((df_prices.index.max() - df_prices.index.min()).days),
-            "total_observations": len(df_prices)
-        }
+        start_date = request.args.get('start_date') or None
+        end_date = request.args.get('end_date') or None
+        return Response(metrics_body(data, start_date, end_date), mimetype='application/json')
+    
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+    except Exception as e:
+        return jsonify({"status": "error", "message": str(e)}), 500
+
+
+@app.route("/dashboard")
+@response_cache.cached
+def dashboard():
+    """
+    Everything the dashboard needs for first paint, in one response.
+    Optional query parameters:
+    - start_date, end_date: YYYY-MM-DD range for prices and events
+    - window_days: association window (default 30)
+    Returns the /prices, /changepoints, /events, /associations and /metrics
+    bodies under those keys. Each part is taken from (or stored in) the
+    response cache under the individual route's key, so the batched and the
+    individual requests share work.
+    """
+    try:
+        # The version is read before the data, so parts built from a state
+        # that a reload has since replaced are not stored under the new version
+        version = response_cache.version
+        state = data
+        start_date = request.args.get('start_date') or None
+        end_date = request.args.get('end_date') or None
+        window_days = int(request.args.get('window_days', DEFAULT_EVENT_WINDOW_DAYS))
+        # Parse the range once; it is shared by the price and event slices
+        start = pd.Timestamp(start_date) if start_date else None
+        end = pd.Timestamp(end_date) if end_date else None
         
+        range_args = MultiDict([('start_date', start_date or ''), ('end_date', end_date or '')])
+        parts = [
+            ("prices", "/prices", range_args, lambda: state.price_payload.encode(start, end)),
+            ("changepoints", "/changepoints", MultiDict(), lambda: change_point_store.snapshot.body),
+            ("events", "/events", range_args, lambda: events_body(state, start, end)),
+            ("associations", "/associations", MultiDict([('window_days', str(window_days))]),
+             lambda: associations_body(state, window_days)),
+            ("metrics", "/metrics", MultiDict(), lambda: metrics_body(state)),
+        ]
+        body = b'{"status":"success",%s}' % b",".join(
+            b'"%s":%s' % (name.encode(), response_cache.get_or_build(route, args, build, version=version))
+            for name, route, args, build in parts
+        )
+        return Response(body, mimetype='application/json')
+    
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+    except Exception as e:
+        return jsonify({"status": "error", "message": str(e)}), 500
+
+
+@app.route("/reload", methods=["POST"])
+def reload():
+    """
+    Reload the data files and invalidate every cached response.
+    """
+    try:
+        load_data()
+        change_point_store.refresh(force=True)
         return jsonify({
             "status": "success",
-            "price_statistics": price_stats,
-            "returns_statistics": returns_stats,
-            "volatility_statistics": volatility_stats,
-            "date_range": date_range,
-            "total_events": len(df_events)
+            "data_version": response_cache.version,
+            "change_points": change_point_store.stats()
         })
     
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
 
 
+@app.route("/jobs", methods=["POST"])
+def submit_job():
+    """
+    Queue a change point model fit.
+    JSON body (all optional):
+    - start_date, end_date: YYYY-MM-DD range of returns to fit
+    - BayesianModelConfig fields: draws, tune, random_seed, hdi_prob,
+      mu_prior_mean, mu_prior_sigma, sigma_prior_sigma
+    Identical inputs return the existing job; stored results return at once.
+    """
+    try:
+        params = request.get_json(silent=True) or {}
+        if not isinstance(params, dict):
+            raise ValueError("the request body must be a JSON object")
+        params = dict(params)
+        start_date = params.pop('start_date', None) or None
+        end_date = params.pop('end_date', None) or None
+        
+        model_fields = {f.name: f.type for f in dataclasses.fields(BayesianModelConfig)}
+        unknown = sorted(set(params) - set(model_fields))
+        if unknown:
+            raise ValueError(f"unknown parameters {unknown}; expected start_date, end_date or {sorted(model_fields)}")
+        for name, value in params.items():
+            # JSON numbers only; booleans are ints to Python but not here
+            expected = (int,) if model_fields[name] is int else (int, float)
+            if isinstance(value, bool) or not isinstance(value, expected):
+                kind = "an integer" if model_fields[name] is int else "a number"
+                raise ValueError(f"{name} must be {kind}, got {value!r}")
+        config = BayesianModelConfig(**params)
+        
+        state = data
+        bounds = state.price_payload.locate(start_date, end_date)
+        job = job_manager.submit(state.df_prices['log_return'].iloc[bounds], config)
+        status_code = 200 if job.status == 'completed' else 202
+        return jsonify({"status": "success", "job": job_manager.describe(job)}), status_code
+    
+    except JobQueueFull as e:
+        return jsonify({"status": "error", "message": str(e)}), 503
+    except (TypeError, ValueError) as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+    except Exception as e:
+        return jsonify({"status": "error", "message": str(e)}), 500
+
+
+@app.route("/jobs/<job_id>", methods=["GET", "DELETE"])
+def job_status(job_id):
+    """
+    Get a job's status, progress and result (GET), or cancel it (DELETE).
+    """
+    try:
+        job = job_manager.cancel(job_id) if request.method == "DELETE" else job_manager.get(job_id)
+        if job is None:
+            return jsonify({"status": "error", "message": f"unknown job {job_id}"}), 404
+        return jsonify({"status": "success", "job": job_manager.describe(job)})
+    
+    except Exception as e:
+        return jsonify({"status": "error", "message": str(e)}), 500
+
+
 if __name__ == "__main__":
+    create_app()
     print("\n" + "=" * 60)
     print("Starting Flask API Server")
     print("=" * 60)
     print("API will be available at: http://localhost:5000")
     print("\nAvailable endpoints:")
     print("  GET /")
-    print("  GET /prices?start_date=YYYY-MM-DD&end_date=YYYY-MM-DD")
+    print("  GET /prices?start_date=YYYY-MM-DD&end_date=YYYY-MM-DD&max_points=1000&agg=lttb")
+    print("  GET /prices?fields=Date,Price&limit=500&after=<next_cursor>")
+    print("  GET /prices?format=arrow  (or Accept: application/vnd.apache.arrow.stream)")
     print("  GET /changepoints")
-    print("  GET /events?start_date=YYYY-MM-DD&end_date=YYYY-MM-DD")
+    print("  GET /events?start_date=YYYY-MM-DD&end_date=YYYY-MM-DD&q=keywords")
+    print("  GET /events?fields=Date,Event&limit=50&after=<next_cursor>")
     print("  GET /associations?window_days=30")
-    print("  GET /metrics")
+    print("  GET /associations/sensitivity?windows=7,14,30,60,90")
+    print("  GET /metrics?start_date=YYYY-MM-DD&end_date=YYYY-MM-DD")
+    print("  GET /dashboard?start_date=YYYY-MM-DD&end_date=YYYY-MM-DD&window_days=30")
+    print("  POST /reload")
+    print("  POST /jobs  {start_date, end_date, draws, tune, ...}")
+    print("  GET|DELETE /jobs/<id>")
     print("=" * 60 + "\n")
     
     app.run(debug=True, host='0.0.0.0', port=6000)
@@ -0,0 +1,130 @@
+"""
+Apache Arrow IPC export of the price history.
+
+Bulk consumers that turn ``/prices`` back into DataFrames can request the
+Arrow streaming format instead of JSON (``?format=arrow`` or
+``Accept: application/vnd.apache.arrow.stream``). The record batch is
+built once per data load directly over the in-memory NumPy buffers (dates
+as int64 nanoseconds, float columns with a validity bitmap marking NaN as
+null), and a date range is a zero-copy slice of it, so encoding a response
+only copies the selected buffers into the IPC body. Bodies are returned as
+bytes and cached by ``ResponseCache`` like the JSON responses.
+
+pyarrow is optional; without it ``ARROW_AVAILABLE`` is False and the API
+answers Arrow requests with 406.
+"""
+
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from serialization import DATE_FIELD, SortedPager
+from src.constants import ARROW_STREAM_MIMETYPE
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+ARROW_AVAILABLE = pa is not None
+JSON_MIMETYPE = "application/json"
+FORMAT_JSON = "json"
+FORMAT_ARROW = "arrow"
+VALID_FORMATS = (FORMAT_JSON, FORMAT_ARROW)
+DEFAULT_BATCH_ROWS = 65536
+
+
+def negotiate_format(args, accept_mimetypes) -> str:
+    """
+    'arrow' or 'json' for a request: an explicit ``format`` argument wins,
+    otherwise the best ``Accept`` match (JSON for ``*/*`` or no header).
+    """
+    requested = args.get('format')
+    if requested:
+        if requested not in VALID_FORMATS:
+            raise ValueError(f"format must be one of {VALID_FORMATS}, got {requested}")
+        return requested
+    best = accept_mimetypes.best_match([JSON_MIMETYPE, ARROW_STREAM_MIMETYPE], JSON_MIMETYPE)
+    return FORMAT_ARROW if best == ARROW_STREAM_MIMETYPE else FORMAT_JSON
+
+
+def _float_array(values: np.ndarray) -> "pa.Array":
+    # Wrap the NumPy buffer as is; only the validity bitmap is new memory
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    missing = np.isnan(values)
+    if not missing.any():
+        return pa.Array.from_buffers(pa.float64(), len(values), [None, pa.py_buffer(values)])
+    validity = np.packbits(~missing, bitorder='little')
+    return pa.Array.from_buffers(
+        pa.float64(), len(values), [pa.py_buffer(validity), pa.py_buffer(values)],
+        null_count=int(missing.sum())
+    )
+
+
+class ArrowPrices:
+    """
+    Arrow record batch over a date-indexed price frame.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Frame with a DatetimeIndex (e.g. ``df_prices``); the index becomes
+        the 'Date' column and every numeric column is exported.
+    batch_rows : int, optional
+        Maximum rows per record batch in the IPC stream. Default is 65536.
+    """
+
+    def __init__(self, df: pd.DataFrame, batch_rows: int = DEFAULT_BATCH_ROWS):
+        if pa is None:
+            raise ImportError("pyarrow is required for Arrow export: pip install pyarrow")
+        if batch_rows < 1:
+            raise ValueError(f"batch_rows must be a positive integer, got {batch_rows}")
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+
+        self.batch_rows = batch_rows
+        self.keys = pd.DatetimeIndex(df.index).as_unit('ns').asi8
+        self.pager = SortedPager(self.keys)
+
+        arrays = [pa.Array.from_buffers(pa.timestamp('ns'), len(self.keys), [None, pa.py_buffer(self.keys)])]
+        names = [DATE_FIELD]
+        for column in df.columns:
+            if pd.api.types.is_numeric_dtype(df[column]):
+                arrays.append(_float_array(df[column].to_numpy(dtype=np.float64)))
+                names.append(str(column))
+        self.batch = pa.RecordBatch.from_arrays(arrays, names=names)
+        self.fields = tuple(names)
+
+    def __len__(self) -> int:
+        return self.batch.num_rows
+
+    def select(self, start_date=None, end_date=None, fields: Optional[Sequence[str]] = None) -> "pa.RecordBatch":
+        """Zero-copy slice of the batch for a date range and column projection."""
+        bounds = self.pager.locate(start_date, end_date)
+        batch = self.batch.slice(bounds.start, bounds.stop - bounds.start)
+        if fields is not None:
+            unknown = [name for name in fields if name not in self.fields]
+            if unknown or not fields:
+                raise ValueError(
+                    f"fields must be a non-empty subset of {list(self.fields)}, got {list(fields)}"
+                )
+            batch = batch.select(list(fields))
+        return batch
+
+    def encode(self, start_date=None, end_date=None, fields: Optional[Sequence[str]] = None) -> bytes:
+        """
+        The ``/prices?format=arrow`` response body for a date range.
+
+        Returns:
+        --------
+        bytes
+            Arrow IPC stream of the selected rows and columns, in record
+            batches of at most ``batch_rows`` rows.
+        """
+        batch = self.select(start_date, end_date, fields)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, batch.schema) as writer:
+            for offset in range(0, batch.num_rows, self.batch_rows):
+                writer.write_batch(batch.slice(offset, self.batch_rows))
+        return sink.getvalue().to_pybytes()
@@ -0,0 +1,228 @@
+"""
+Hot-reloaded change point results for the dashboard API.
+
+The persisted model results (``CHANGE_POINTS_CSV``) are loaded into an
+immutable ``ChangePointSnapshot``. A background thread polls the file's
+modification time and size; when they change, a new snapshot is built off
+to the side and published with a single reference assignment
+(read-copy-update). Request handlers read ``store.snapshot`` once and use
+that object throughout, so a reload never blocks them or hands them a
+half-built state. A file that fails to load leaves the current snapshot
+in place and is reported through ``stats()``.
+"""
+
+import json
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+DEFAULT_POLL_INTERVAL = 2.0
+DATE_FORMAT = "%Y-%m-%d"
+
+# Served when no results have been saved yet, so the dashboard still renders
+EXAMPLE_CHANGE_POINTS = pd.DataFrame({
+    'change_date': pd.to_datetime(["2008-09-15", "2014-11-27", "2020-03-08", "2022-02-24"]),
+    'change_index': pd.array([5000, 6500, 8000, 8500], dtype='Int64'),
+    'mu_1': [0.0001, -0.0002, 0.0003, -0.0005],
+    'mu_2': [-0.0005, -0.0008, -0.0015, 0.0012],
+    'sigma': [0.02, 0.025, 0.03, 0.028],
+    'impact': [-0.0006, -0.0006, -0.0018, 0.0017],
+    'impact_pct': [-0.06, -0.06, -0.18, 0.17],
+    'confidence': [0.95, 0.92, 0.98, 0.94],
+})
+
+# DataFrame column -> /changepoints field
+_FIELD_NAMES = {'change_index': 'index'}
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _records(change_points: pd.DataFrame) -> Tuple[Dict, ...]:
+    records = []
+    for row in change_points.to_dict(orient='records'):
+        record = {"date": row.pop('change_date').strftime(DATE_FORMAT)}
+        for column, value in row.items():
+            if pd.isna(value):
+                value = None
+            elif hasattr(value, 'item'):
+                value = value.item()
+            record[_FIELD_NAMES.get(column, column)] = value
+        records.append(record)
+    return tuple(records)
+
+
+@dataclass(frozen=True)
+class ChangePointSnapshot:
+    """
+    One loaded version of the change point results.
+
+    Attributes:
+    -----------
+    version : int
+        Increments with every published snapshot.
+    source : str
+        Path of the loaded file, or 'example' when no file exists.
+    change_points : pd.DataFrame
+        One row per change point with a 'change_date' column (treat as
+        read-only; it is shared by every request using this snapshot).
+    dates : Tuple[str, ...]
+        Change point dates formatted as YYYY-MM-DD.
+    body : bytes
+        Pre-encoded ``/changepoints`` response.
+    loaded_at : float
+        Unix time the snapshot was published.
+    load_seconds : float
+        Time taken to read the file and build the snapshot.
+    """
+
+    version: int
+    source: str
+    change_points: pd.DataFrame
+    dates: Tuple[str, ...]
+    body: bytes
+    loaded_at: float
+    load_seconds: float
+
+    @classmethod
+    def build(cls, change_points: pd.DataFrame, version: int, source: str, started: float) -> "ChangePointSnapshot":
+        """Snapshot of ``change_points``; ``started`` is the ``perf_counter`` value when loading began."""
+        records = _records(change_points)
+        body = json.dumps({
+            "status": "success",
+            "version": version,
+            "source": source,
+            "count": len(records),
+            "data": list(records),
+        }).encode()
+        return cls(
+            version=version,
+            source=source,
+            change_points=change_points,
+            dates=tuple(record["date"] for record in records),
+            body=body,
+            loaded_at=time.time(),
+            load_seconds=time.perf_counter() - started,
+        )
+
+
+class ChangePointStore:
+    """
+    Publishes change point snapshots and reloads them when the file changes.
+
+    Parameters:
+    -----------
+    path : Path
+        Change points CSV (e.g. ``CHANGE_POINTS_CSV``).
+    loader : callable
+        Function reading ``path`` into a change point DataFrame
+        (e.g. ``load_change_points``).
+    on_swap : callable, optional
+        Called with the new snapshot after it is published (e.g. to
+        invalidate cached responses).
+    poll_interval : float, optional
+        Seconds between file checks of the watcher thread. Default is 2.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        loader: Callable[[Path], pd.DataFrame],
+        on_swap: Optional[Callable[[ChangePointSnapshot], None]] = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL
+    ):
+        if poll_interval <= 0:
+            raise ValueError(f"poll_interval must be positive, got {poll_interval}")
+        self.path = Path(path)
+        self.loader = loader
+        self.on_swap = on_swap
+        self.poll_interval = poll_interval
+        self._write_lock = threading.Lock()
+        self._signature = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_error: Optional[str] = None
+        self.snapshot: Optional[ChangePointSnapshot] = None
+        self.refresh(force=True)
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Reload the file if it changed since the last load (always if ``force``).
+
+        Returns:
+        --------
+        bool
+            Whether a new snapshot was published.
+        """
+        with self._write_lock:
+            signature = _file_signature(self.path)
+            if not force and signature == self._signature:
+                return False
+
+            started = time.perf_counter()
+            version = 1 if self.snapshot is None else self.snapshot.version + 1
+            try:
+                if signature is None:
+                    change_points, source = EXAMPLE_CHANGE_POINTS, "example"
+                else:
+                    change_points, source = self.loader(self.path), str(self.path)
+                snapshot = ChangePointSnapshot.build(change_points, version, source, started)
+            except Exception as e:
+                # Keep serving the previous snapshot; retry once the file changes again
+                self._signature = signature
+                self.last_error = f"{type(e).__name__}: {e}"
+                if self.snapshot is None:
+                    raise
+                return False
+
+            self._signature = signature
+            self.last_error = None
+            self.snapshot = snapshot
+
+        if self.on_swap is not None:
+            self.on_swap(snapshot)
+        return True
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.refresh()
+            except Exception:
+                pass
+
+    def start(self) -> None:
+        """Start the watcher thread (a daemon; idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="change-point-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the watcher thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def stats(self) -> Dict:
+        """Snapshot version, source, load latency and watcher state."""
+        snapshot = self.snapshot
+        return {
+            "version": snapshot.version,
+            "source": snapshot.source,
+            "count": len(snapshot.dates),
+            "loaded_at": snapshot.loaded_at,
+            "load_ms": round(snapshot.load_seconds * 1e3, 3),
+            "watching": self._thread is not None and self._thread.is_alive(),
+            "last_error": self.last_error,
+        }
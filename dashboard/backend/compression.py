@@ -0,0 +1,43 @@
+"""
+HTTP response compression for the dashboard API.
+
+Bodies are compressed with gzip, or brotli when the ``brotli`` package is
+installed, according to the client's ``Accept-Encoding``. Cached responses
+keep their compressed variants (see ``ResponseCache``), so each body is
+compressed once per encoding and data version; that is what makes
+the slower, denser settings below affordable.
+"""
+
+import gzip
+from typing import Optional, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+GZIP = "gzip"
+BROTLI = "br"
+# In order of preference when the client accepts several equally
+SUPPORTED_ENCODINGS: Tuple[str, ...] = (BROTLI, GZIP) if brotli is not None else (GZIP,)
+
+# Bodies smaller than this are sent as is; headers would eat the savings
+MIN_COMPRESS_BYTES = 1024
+GZIP_LEVEL = 9
+# Quality 11 saves another ~25% on /prices but takes seconds per megabyte
+BROTLI_QUALITY = 9
+
+
+def negotiate_encoding(accept_encodings, available: Tuple[str, ...] = SUPPORTED_ENCODINGS) -> Optional[str]:
+    """Best encoding in ``available`` accepted by the client, None for identity."""
+    return accept_encodings.best_match(available)
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress ``body`` with 'gzip' or 'br'."""
+    if encoding == GZIP:
+        # mtime=0 keeps the output, and so the ETag's bytes, deterministic
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    if encoding == BROTLI and brotli is not None:
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    raise ValueError(f"encoding must be one of {SUPPORTED_ENCODINGS}, got {encoding}")
@@ -0,0 +1,389 @@
+"""
+Asynchronous change point model fits for the dashboard API.
+
+MCMC sampling takes minutes, so fits run on a bounded process pool instead
+of a Flask worker. A job is identified by a hash of its inputs (the returns
+being fitted and the ``BayesianModelConfig`` fields): submitting identical
+inputs again returns the existing job, and finished results are kept as
+JSON files in a local store, so repeated requests return immediately, even
+across restarts.
+
+Workers report progress and poll for cancellation through small files next
+to the store entries, which keeps the pool free of shared-memory plumbing.
+"""
+
+import dataclasses
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.config import BayesianModelConfig
+
+DEFAULT_MAX_WORKERS = 1
+DEFAULT_MAX_PENDING = 8
+DATE_FORMAT = "%Y-%m-%d"
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+STATUS_CANCELLED = "cancelled"
+FINISHED_STATUSES = (STATUS_COMPLETED, STATUS_FAILED, STATUS_CANCELLED)
+
+# Draws between progress writes / cancellation checks in the worker
+_REPORT_EVERY = 50
+
+_JOB_ID_LENGTH = 24
+_JOB_ID_PATTERN = re.compile(f"[0-9a-f]{{{_JOB_ID_LENGTH}}}")
+
+
+class JobQueueFull(RuntimeError):
+    """Raised when the pool already has ``max_pending`` unfinished jobs."""
+
+
+class JobCancelled(Exception):
+    """Raised inside a worker to abort sampling of a cancelled job."""
+
+
+def _write_json(path: Path, payload: Dict) -> None:
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _read_json(path: Path) -> Optional[Dict]:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def fit_change_point(
+    returns: np.ndarray,
+    date_keys: np.ndarray,
+    config_fields: Dict,
+    progress_path: str,
+    cancel_path: str
+) -> Dict:
+    """
+    Fit the change point model in a worker process.
+
+    Parameters:
+    -----------
+    returns : np.ndarray
+        Log returns to fit.
+    date_keys : np.ndarray
+        Nanosecond timestamps of the returns.
+    config_fields : Dict
+        ``BayesianModelConfig`` fields.
+    progress_path, cancel_path : str
+        Files the worker writes its progress to and checks for a
+        cancellation request.
+
+    Returns:
+    --------
+    Dict
+        JSON-ready change point results and convergence flags.
+    """
+    # Imported here so the API process never loads PyMC
+    from src.modeling import (
+        build_change_point_model,
+        check_model_convergence,
+        extract_change_point_results,
+        run_mcmc_sampling,
+    )
+
+    config = BayesianModelConfig(**config_fields)
+    steps_per_chain = config.tune + config.draws
+    steps: Dict[int, int] = {}
+    progress_path, cancel_path = Path(progress_path), Path(cancel_path)
+
+    def callback(trace, draw):
+        steps[draw.chain] = steps.get(draw.chain, 0) + 1
+        if sum(steps.values()) % _REPORT_EVERY:
+            return
+        if cancel_path.exists():
+            raise JobCancelled()
+        progress = sum(steps.values()) / (len(steps) * steps_per_chain)
+        _write_json(progress_path, {"progress": round(min(progress, 1.0), 4)})
+
+    model = build_change_point_model(returns, config=config)
+    trace = run_mcmc_sampling(model, config=config, progressbar=False, callback=callback)
+    results = extract_change_point_results(trace, pd.DatetimeIndex(date_keys), config=config)
+    tau_samples = results.pop('tau_samples')
+    low, high = np.percentile(tau_samples, [100 * (1 - config.hdi_prob) / 2, 100 * (1 + config.hdi_prob) / 2])
+
+    return {
+        "change_point_date": results['change_point_date'].strftime(DATE_FORMAT),
+        "change_point_index": int(results['change_point_index']),
+        "change_point_interval": [
+            pd.Timestamp(date_keys[int(low)]).strftime(DATE_FORMAT),
+            pd.Timestamp(date_keys[int(high)]).strftime(DATE_FORMAT),
+        ],
+        **{name: float(results[name]) for name in ('mu_1', 'mu_2', 'sigma', 'impact', 'impact_pct')},
+        "convergence": {name: bool(ok) for name, ok in check_model_convergence(trace).items()},
+    }
+
+
+@dataclass
+class Job:
+    """State of one submitted fit."""
+
+    id: str
+    params: Dict
+    status: str = STATUS_QUEUED
+    submitted_at: float = dataclasses.field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    result: Optional[Dict] = None
+    error: Optional[str] = None
+    future: Optional[Future] = dataclasses.field(default=None, repr=False)
+
+
+class JobManager:
+    """
+    Runs model fits on a process pool and keeps their results.
+
+    Parameters:
+    -----------
+    store_dir : Path
+        Directory of the local result store.
+    max_workers : int, optional
+        Size of the process pool. Default is 1.
+    max_pending : int, optional
+        Maximum number of queued and running jobs; further submissions raise
+        ``JobQueueFull``. Default is 8.
+    fit : callable, optional
+        Function run in the workers, with the signature and JSON-ready
+        result of ``fit_change_point`` (the default); it must be picklable.
+    """
+
+    def __init__(
+        self,
+        store_dir: Path,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        fit: Callable[..., Dict] = fit_change_point
+    ):
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be a positive integer, got {max_workers}")
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be a positive integer, got {max_pending}")
+        self.store_dir = Path(store_dir)
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.fit = fit
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Job] = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        # Created on first use, and again if a worker died. Spawned workers
+        # start a fresh interpreter: they inherit no threads or locks, but
+        # re-import the server's main script as __mp_main__, which must
+        # therefore have no import-time side effects (see app.create_app)
+        if self._executor is None or getattr(self._executor, "_broken", False):
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def _path(self, job_id: str, suffix: str) -> Path:
+        return self.store_dir / f"{job_id}{suffix}"
+
+    def _load_stored(self, job_id: str) -> Optional[Job]:
+        # Caller holds the lock
+        stored = _read_json(self._path(job_id, ".json"))
+        if stored is None:
+            return None
+        job = Job(
+            job_id, stored["params"], STATUS_COMPLETED,
+            submitted_at=stored["submitted_at"], finished_at=stored["finished_at"], result=stored["result"]
+        )
+        self._jobs[job_id] = job
+        return job
+
+    @staticmethod
+    def job_id(returns: pd.Series, config: BayesianModelConfig) -> str:
+        """Content hash of a fit's inputs."""
+        digest = hashlib.sha256()
+        digest.update(np.ascontiguousarray(returns.to_numpy(dtype=np.float64)).tobytes())
+        digest.update(np.ascontiguousarray(pd.DatetimeIndex(returns.index).as_unit('ns').asi8).tobytes())
+        digest.update(repr(sorted(dataclasses.asdict(config).items())).encode())
+        return digest.hexdigest()[:_JOB_ID_LENGTH]
+
+    def submit(self, returns: pd.Series, config: BayesianModelConfig) -> Job:
+        """
+        Queue a fit of ``returns``, or return the job already holding it.
+
+        Parameters:
+        -----------
+        returns : pd.Series
+            Log returns indexed by date (NaNs are dropped).
+        config : BayesianModelConfig
+            Model and sampler settings.
+
+        Returns:
+        --------
+        Job
+            The new or existing job; completed immediately if the result is
+            already in the store.
+
+        Raises:
+        -------
+        ValueError
+            If fewer than two returns remain.
+        JobQueueFull
+            If ``max_pending`` jobs are already queued or running.
+        """
+        returns = returns.dropna()
+        if len(returns) < 2:
+            raise ValueError(f"at least 2 returns are needed to fit a change point, got {len(returns)}")
+
+        job_id = self.job_id(returns, config)
+        params = {
+            "start_date": returns.index[0].strftime(DATE_FORMAT),
+            "end_date": returns.index[-1].strftime(DATE_FORMAT),
+            "observations": len(returns),
+            **dataclasses.asdict(config),
+        }
+
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and job.status not in (STATUS_FAILED, STATUS_CANCELLED):
+                return job
+
+            stored = self._load_stored(job_id)
+            if stored is not None:
+                return stored
+
+            pending = sum(1 for j in self._jobs.values() if j.status not in FINISHED_STATUSES)
+            if pending >= self.max_pending:
+                raise JobQueueFull(f"{pending} jobs are already queued or running")
+
+            self.store_dir.mkdir(parents=True, exist_ok=True)
+            for suffix in (".progress", ".cancel"):
+                self._path(job_id, suffix).unlink(missing_ok=True)
+
+            job = Job(job_id, params)
+            job.future = self._pool().submit(
+                self.fit,
+                returns.to_numpy(dtype=np.float64),
+                pd.DatetimeIndex(returns.index).as_unit('ns').asi8,
+                dataclasses.asdict(config),
+                str(self._path(job_id, ".progress")),
+                str(self._path(job_id, ".cancel")),
+            )
+            self._jobs[job_id] = job
+
+        job.future.add_done_callback(lambda future: self._finish(job, future))
+        return job
+
+    def _finish(self, job: Job, future: Future) -> None:
+        result, error = None, None
+        try:
+            result = future.result()
+            status = STATUS_COMPLETED
+        except (CancelledError, JobCancelled):
+            status = STATUS_CANCELLED
+        except Exception as e:
+            status, error = STATUS_FAILED, f"{type(e).__name__}: {e}"
+        finished_at = time.time()
+
+        if status == STATUS_COMPLETED:
+            try:
+                _write_json(self._path(job.id, ".json"), {
+                    "params": job.params,
+                    "submitted_at": job.submitted_at,
+                    "finished_at": finished_at,
+                    "result": result,
+                })
+            except Exception as e:
+                # A result that cannot be stored would be lost on restart
+                status, result, error = STATUS_FAILED, None, f"storing the result failed: {type(e).__name__}: {e}"
+
+        with self._lock:
+            job.result, job.error, job.finished_at = result, error, finished_at
+            job.status = status
+        for suffix in (".progress", ".cancel"):
+            self._path(job.id, suffix).unlink(missing_ok=True)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """The job with ``job_id`` (from memory or the store), None if unknown."""
+        if not _JOB_ID_PATTERN.fullmatch(job_id):
+            return None
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job if job is not None else self._load_stored(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """
+        Cancel a queued or running job; finished jobs are returned unchanged.
+
+        Queued jobs are removed from the pool; running jobs stop at their next
+        progress check.
+        """
+        job = self.get(job_id)
+        if job is None:
+            return None
+        with self._lock:
+            if job.status in FINISHED_STATUSES:
+                return job
+        if not job.future.cancel():
+            self._path(job_id, ".cancel").touch()
+        return job
+
+    def describe(self, job: Job) -> Dict:
+        """JSON-ready status, progress, parameters and result of a job."""
+        with self._lock:
+            status, finished_at, result, error = job.status, job.finished_at, job.result, job.error
+        if status == STATUS_QUEUED and job.future is not None and job.future.running():
+            status = STATUS_RUNNING
+        if status == STATUS_COMPLETED:
+            progress = 1.0
+        elif status == STATUS_RUNNING:
+            progress = (_read_json(self._path(job.id, ".progress")) or {}).get("progress", 0.0)
+        else:
+            progress = None
+        return {
+            "id": job.id,
+            "status": status,
+            "progress": progress,
+            "cancel_requested": status == STATUS_RUNNING and self._path(job.id, ".cancel").exists(),
+            "params": job.params,
+            "submitted_at": job.submitted_at,
+            "finished_at": finished_at,
+            "result": result,
+            "error": error,
+        }
+
+    def stats(self) -> Dict[str, int]:
+        """Number of known jobs per status."""
+        counts = {status: 0 for status in (STATUS_QUEUED, STATUS_RUNNING) + FINISHED_STATUSES}
+        with self._lock:
+            jobs = list(self._jobs.values())
+        for job in jobs:
+            counts[self.describe(job)["status"]] += 1
+        return counts
+
+    def shutdown(self) -> None:
+        """Cancel queued jobs and stop the pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
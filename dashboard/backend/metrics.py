@@ -0,0 +1,236 @@
+"""
+Summary metrics for the dashboard API.
+
+``MetricsSnapshot`` holds the full-history statistics served by
+``/metrics``; it is computed once per data load and never mutated.
+``RangeMetrics`` answers the same statistics for any date range in O(1)
+per query: means and standard deviations come from prefix sums (of values
+centred on their global mean, to limit cancellation) and minima/maxima from
+sparse tables of argmin/argmax positions.
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+DATE_FORMAT = "%Y-%m-%d"
+
+
+def _freeze(values: Dict) -> Mapping:
+    return MappingProxyType(dict(values))
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Immutable full-history metrics, in the ``/metrics`` response layout."""
+
+    price_statistics: Mapping
+    returns_statistics: Mapping
+    volatility_statistics: Mapping
+    date_range: Mapping
+    total_events: int
+
+    @classmethod
+    def build(
+        cls,
+        df_prices: pd.DataFrame,
+        rolling_vol: pd.Series,
+        n_events: int
+    ) -> "MetricsSnapshot":
+        """
+        Compute the metrics from loaded data.
+
+        Parameters:
+        -----------
+        df_prices : pd.DataFrame
+            Prices with DatetimeIndex and Price and log_return columns.
+        rolling_vol : pd.Series
+            30-day rolling volatility (e.g. ``df_features['volatility_30']``).
+        n_events : int
+            Number of loaded events.
+        """
+        price = df_prices['Price']
+        log_return = df_prices['log_return']
+        return cls(
+            price_statistics=_freeze({
+                "mean": float(price.mean()),
+                "std": float(price.std()),
+                "min": float(price.min()),
+                "max": float(price.max()),
+                "min_date": price.idxmin().strftime(DATE_FORMAT),
+                "max_date": price.idxmax().strftime(DATE_FORMAT),
+            }),
+            returns_statistics=_freeze({
+                "mean": float(log_return.mean()),
+                "std": float(log_return.std()),
+                "min": float(log_return.min()),
+                "max": float(log_return.max()),
+            }),
+            volatility_statistics=_freeze({
+                "mean_30day": float(rolling_vol.mean()),
+                "max_30day": float(rolling_vol.max()),
+                "max_vol_date": rolling_vol.idxmax().strftime(DATE_FORMAT),
+            }),
+            date_range=_freeze({
+                "start": df_prices.index.min().strftime(DATE_FORMAT),
+                "end": df_prices.index.max().strftime(DATE_FORMAT),
+                "total_days": int((df_prices.index.max() - df_prices.index.min()).days),
+                "total_observations": len(df_prices),
+            }),
+            total_events=int(n_events),
+        )
+
+    def to_dict(self) -> Dict:
+        """Plain nested dictionaries, ready for ``jsonify``."""
+        return {
+            "price_statistics": dict(self.price_statistics),
+            "returns_statistics": dict(self.returns_statistics),
+            "volatility_statistics": dict(self.volatility_statistics),
+            "date_range": dict(self.date_range),
+            "total_events": self.total_events,
+        }
+
+
+class _Moments:
+    """Prefix sums giving count, mean and sample std of any slice in O(1)."""
+
+    def __init__(self, values: np.ndarray):
+        valid = ~np.isnan(values)
+        self.shift = float(values[valid].mean()) if valid.any() else 0.0
+        centred = np.where(valid, values - self.shift, 0.0)
+        self.counts = np.r_[0, np.cumsum(valid)]
+        self.sums = np.r_[0.0, np.cumsum(centred)]
+        self.sums_sq = np.r_[0.0, np.cumsum(centred ** 2)]
+
+    def mean_std(self, lo: int, hi: int) -> Tuple[Optional[float], Optional[float]]:
+        n = int(self.counts[hi] - self.counts[lo])
+        if n == 0:
+            return None, None
+        total = self.sums[hi] - self.sums[lo]
+        mean = total / n
+        if n < 2:
+            return float(mean + self.shift), None
+        variance = max(self.sums_sq[hi] - self.sums_sq[lo] - total * mean, 0.0) / (n - 1)
+        return float(mean + self.shift), float(np.sqrt(variance))
+
+
+class _ArgExtremum:
+    """Sparse table of argmax (or argmin) positions: O(n log n) build, O(1) query."""
+
+    def __init__(self, values: np.ndarray, largest: bool):
+        fill = -np.inf if largest else np.inf
+        self.values = np.where(np.isnan(values), fill, values)
+        self.valid = ~np.isnan(values)
+        self.largest = largest
+        table = [np.arange(len(values))]
+        width = 1
+        while 2 * width <= len(values):
+            previous = table[-1]
+            table.append(self._pick(previous[:-width], previous[width:]))
+            width *= 2
+        self.table = table
+
+    def _pick(self, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        a, b = self.values[left], self.values[right]
+        better = a > b if self.largest else a < b
+        # Ties go to the earlier position, like idxmax/idxmin
+        return np.where(better | ((a == b) & (left <= right)), left, right)
+
+    def query(self, lo: int, hi: int) -> Optional[int]:
+        """Position of the extremum in [lo, hi), None if empty or all NaN."""
+        if hi <= lo:
+            return None
+        level = (hi - lo).bit_length() - 1
+        row = self.table[level]
+        position = int(self._pick(row[lo:lo + 1], row[hi - (1 << level):hi - (1 << level) + 1])[0])
+        return position if self.valid[position] else None
+
+
+class RangeMetrics:
+    """
+    ``/metrics`` statistics restricted to a date range, in O(1) per query.
+
+    Parameters:
+    -----------
+    df_prices : pd.DataFrame
+        Prices with a sorted DatetimeIndex and Price and log_return columns.
+    rolling_vol : pd.Series
+        30-day rolling volatility aligned with ``df_prices``.
+    event_dates : array-like of datetimes
+        Event dates, to count the events in the range.
+    """
+
+    def __init__(self, df_prices: pd.DataFrame, rolling_vol: pd.Series, event_dates):
+        self.index = pd.DatetimeIndex(df_prices.index)
+        self.keys = self.index.as_unit('ns').asi8
+        self.dates = self.index.strftime(DATE_FORMAT)
+        event_keys = pd.DatetimeIndex(pd.to_datetime(event_dates)).as_unit('ns').asi8
+        self.event_keys = np.sort(event_keys[event_keys != np.iinfo(np.int64).min])
+
+        self._series = {}
+        for name, values in [
+            ('price', df_prices['Price'].to_numpy(dtype=np.float64)),
+            ('return', df_prices['log_return'].to_numpy(dtype=np.float64)),
+            ('volatility', rolling_vol.to_numpy(dtype=np.float64)),
+        ]:
+            self._series[name] = (
+                values, _Moments(values), _ArgExtremum(values, largest=False), _ArgExtremum(values, largest=True)
+            )
+
+    def _stats(self, name: str, lo: int, hi: int) -> Tuple:
+        values, moments, argmin, argmax = self._series[name]
+        mean, std = moments.mean_std(lo, hi)
+        low, high = argmin.query(lo, hi), argmax.query(lo, hi)
+        return mean, std, low, high, values
+
+    def compute(self, start_date=None, end_date=None) -> Dict:
+        """
+        Metrics for start_date <= Date <= end_date, in the ``/metrics`` layout.
+
+        Statistics of an empty range (or an all-NaN column) are None.
+        """
+        start = None if start_date is None else pd.Timestamp(start_date).value
+        end = None if end_date is None else pd.Timestamp(end_date).value
+        lo = 0 if start is None else int(np.searchsorted(self.keys, start, side='left'))
+        hi = len(self.keys) if end is None else int(np.searchsorted(self.keys, end, side='right'))
+        hi = max(lo, hi)
+
+        def value(values, position):
+            return None if position is None else float(values[position])
+
+        def date(position):
+            return None if position is None else self.dates[position]
+
+        mean, std, low, high, values = self._stats('price', lo, hi)
+        price_stats = {
+            "mean": mean, "std": std,
+            "min": value(values, low), "max": value(values, high),
+            "min_date": date(low), "max_date": date(high),
+        }
+        mean, std, low, high, values = self._stats('return', lo, hi)
+        returns_stats = {"mean": mean, "std": std, "min": value(values, low), "max": value(values, high)}
+        mean, _, _, high, values = self._stats('volatility', lo, hi)
+        volatility_stats = {"mean_30day": mean, "max_30day": value(values, high), "max_vol_date": date(high)}
+
+        empty = hi == lo
+        date_range = {
+            "start": None if empty else self.dates[lo],
+            "end": None if empty else self.dates[hi - 1],
+            "total_days": 0 if empty else int((self.keys[hi - 1] - self.keys[lo]) // 86_400_000_000_000),
+            "total_observations": hi - lo,
+        }
+
+        event_lo = 0 if start is None else int(np.searchsorted(self.event_keys, start, side='left'))
+        event_hi = len(self.event_keys) if end is None else int(
+            np.searchsorted(self.event_keys, end, side='right')
+        )
+        return {
+            "price_statistics": price_stats,
+            "returns_statistics": returns_stats,
+            "volatility_statistics": volatility_stats,
+            "date_range": date_range,
+            "total_events": max(event_hi - event_lo, 0),
+        }
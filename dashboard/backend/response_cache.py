@@ -0,0 +1,246 @@
+"""
+Response cache for the dashboard API.
+
+Encoded response bodies are kept in a bounded LRU keyed by route and
+normalized query arguments (plus the negotiated media type, for routes
+that can answer in several formats). Every entry carries a strong ETag
+hashed from its body, so clients revalidating with ``If-None-Match`` get a
+304 without the route being recomputed, and a tag never outlives the bytes
+it was issued for, across reloads and server restarts alike. Bumping the
+data version on reload drops every entry at once.
+
+Bodies are compressed according to ``Accept-Encoding``; each entry keeps
+its compressed variants, so a body is compressed once per encoding
+for as long as it is cached.
+"""
+
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from flask import Response, make_response, request
+
+from compression import MIN_COMPRESS_BYTES, compress, negotiate_encoding
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MEDIA_TYPES = ("application/json",)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """
+    An encoded 200 response and its ETag.
+
+    ``variants`` maps content encodings to compressed bodies (None when
+    compression would not make the body smaller); it is filled on demand.
+    """
+
+    body: bytes
+    mimetype: str
+    etag: str
+    variants: Dict[str, Optional[bytes]] = field(default_factory=dict, compare=False, repr=False)
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU of encoded responses, invalidated by a version counter.
+
+    Parameters:
+    -----------
+    max_entries : int, optional
+        Maximum number of cached responses. Default is 256.
+    media_types : tuple of str, optional
+        Media types the API can negotiate through ``Accept``; the first is
+        the default. With more than one, the best match is part of the key
+        and responses carry ``Vary: Accept``. Default is JSON only.
+    compression : bool, optional
+        Whether to serve compressed bodies to clients that accept them.
+        Default is True.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        media_types: Tuple[str, ...] = DEFAULT_MEDIA_TYPES,
+        compression: bool = True
+    ):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be a positive integer, got {max_entries}")
+        self.max_entries = max_entries
+        self.media_types = tuple(media_types)
+        self.compression = compression
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._version = 0
+        self.hits = 0
+        self.misses = 0
+        self.compressions = 0
+
+    @property
+    def version(self) -> int:
+        """Data version; incremented by every ``invalidate``."""
+        return self._version
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(route: str, args) -> Tuple:
+        """Cache key for a route and its query arguments, ignoring order and empty values."""
+        items = []
+        for name in sorted(args.keys()):
+            values = tuple(sorted(v for v in args.getlist(name) if v != ""))
+            if values:
+                items.append((name, values))
+        return route, tuple(items)
+
+    def key_for(self, route: str, args, media_type: Optional[str] = None) -> Tuple:
+        """Cache key of a route's response in ``media_type`` (default: the first media type)."""
+        key = self.make_key(route, args)
+        if len(self.media_types) > 1:
+            key += (media_type or self.media_types[0],)
+        return key
+
+    @staticmethod
+    def _etag(body: bytes) -> str:
+        # Hashed once per stored entry; 304s compare against the stored tag
+        return hashlib.sha1(body).hexdigest()[:24]
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        """Return the cached response for ``key`` (marking it recently used)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Tuple, body: bytes, mimetype: str, version: int) -> CachedResponse:
+        """
+        Store a response computed against data ``version``.
+
+        If the data was reloaded while the response was being computed, the
+        entry is returned but not stored, so stale bodies never enter the
+        cache.
+        """
+        entry = CachedResponse(body, mimetype, self._etag(body))
+        with self._lock:
+            if version == self._version:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return entry
+
+    def get_or_build(
+        self,
+        route: str,
+        args,
+        build: Callable[[], bytes],
+        mimetype: str = "application/json",
+        version: Optional[int] = None
+    ) -> bytes:
+        """
+        Body of a route's response from the cache, built and stored on a miss.
+
+        Lets a view reuse (and populate) the entries of other routes, e.g. a
+        batched endpoint assembling the bodies of several routes. A view that
+        captured its data before calling this should pass the ``version`` it
+        read before capturing it; the body is then stored only if the data
+        has not been reloaded since. By default the version is read on the
+        miss, which is only safe if ``build`` reads the data itself.
+        """
+        key = self.key_for(route, args, mimetype)
+        entry = self.get(key)
+        if entry is None:
+            if version is None:
+                version = self._version
+            entry = self.put(key, build(), mimetype, version)
+        return entry.body
+
+    def encoded(self, entry: CachedResponse, encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+        """
+        Body of ``entry`` in ``encoding`` and the encoding actually applied.
+
+        The compressed body is computed on first use and kept on the entry;
+        small bodies and bodies that do not shrink are served as is.
+        """
+        if encoding is None or len(entry.body) < MIN_COMPRESS_BYTES:
+            return entry.body, None
+        with self._lock:
+            known = encoding in entry.variants
+            compressed = entry.variants.get(encoding)
+        if not known:
+            # Compressed outside the lock; if two requests race, the first
+            # stored variant wins and both serve it
+            compressed = compress(entry.body, encoding)
+            if len(compressed) >= len(entry.body):
+                compressed = None
+            with self._lock:
+                self.compressions += 1
+                compressed = entry.variants.setdefault(encoding, compressed)
+        return (entry.body, None) if compressed is None else (compressed, encoding)
+
+    def invalidate(self) -> int:
+        """Drop every entry and bump the data version; returns the new version."""
+        with self._lock:
+            self._version += 1
+            self._entries = OrderedDict()
+            return self._version
+
+    def stats(self) -> Dict[str, int]:
+        """Entry count, capacity, version and hit/miss counters."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "version": self._version,
+            "hits": self.hits,
+            "misses": self.misses,
+            "compressions": self.compressions,
+        }
+
+    def cached(self, view: Callable) -> Callable:
+        """
+        Decorate a Flask view so its successful responses are cached.
+
+        Non-200 responses pass through uncached. Responses carry the ETag
+        and ``Cache-Control: no-cache`` so browsers revalidate, and a
+        matching ``If-None-Match`` yields an empty 304. Compressed variants
+        get their own ETag (suffixed with the encoding).
+        """
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            media_type = request.accept_mimetypes.best_match(self.media_types, self.media_types[0])
+            key = self.key_for(request.path, request.args, media_type)
+            entry = self.get(key)
+            if entry is None:
+                version = self._version
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                entry = self.put(key, response.get_data(), response.mimetype, version)
+
+            encoding = negotiate_encoding(request.accept_encodings) if self.compression else None
+            body, encoding = self.encoded(entry, encoding)
+            etag = entry.etag if encoding is None else f"{entry.etag}-{encoding}"
+
+            if request.if_none_match.contains(etag):
+                response = Response(status=304)
+            else:
+                response = Response(body, mimetype=entry.mimetype)
+                if encoding is not None:
+                    response.headers['Content-Encoding'] = encoding
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'no-cache'
+            if self.compression:
+                response.vary.add('Accept-Encoding')
+            if len(self.media_types) > 1:
+                response.vary.add('Accept')
+            return response
+
+        return wrapper
@@ -0,0 +1,269 @@
+"""
+Fast JSON serialization for the dashboard API.
+
+Responses are assembled from JSON fragments that are encoded once when the
+data is loaded. Every column is encoded separately, so a ``fields=``
+projection only joins the fragments it needs, and rows are located by
+binary search on the sorted dates: a request joins the fragments of a
+positional slice (or of the positions chosen by a downsampling plan or a
+page). The full-range price response is pre-encoded as well.
+
+Pagination uses opaque cursors holding the (date, row) of the last record
+served, so seeking to any page is a binary search rather than a skip.
+Cursors are tagged with the listing they came from and must point at one of
+its records; anything else is rejected.
+"""
+
+import base64
+import binascii
+import json
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+DATE_FORMAT = "%Y-%m-%d"
+DATE_FIELD = "Date"
+
+_NAT_KEY = np.iinfo(np.int64).min
+
+
+def _encode_column(values: np.ndarray) -> list:
+    """JSON text of every value in a column (NaN and None become null)."""
+    if values.dtype.kind == "f":
+        finite = np.isfinite(values)
+        return [repr(v) if ok else "null" for v, ok in zip(values.tolist(), finite.tolist())]
+    if values.dtype.kind in "iub":
+        return [json.dumps(v) for v in values.tolist()]
+    return [
+        "null" if v is None or (isinstance(v, float) and math.isnan(v)) else json.dumps(v)
+        for v in values.tolist()
+    ]
+
+
+def parse_fields(value: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Split a ``fields=`` argument ('Date,Price') into a tuple, None if absent."""
+    if not value:
+        return None
+    return tuple(dict.fromkeys(name.strip() for name in value.split(",") if name.strip()))
+
+
+def encode_cursor(key: int, row: int, scope: str = "") -> str:
+    """Opaque pagination cursor for the record at (date key, row) of a listing."""
+    return base64.urlsafe_b64encode(f"{scope}:{key}:{row}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, scope: str = "") -> Tuple[int, int]:
+    """
+    Inverse of ``encode_cursor``; raises ValueError for malformed cursors and
+    for cursors of another listing than ``scope``.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        cursor_scope, key, row = raw.split(":")
+        key, row = int(key), int(row)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError(f"invalid cursor: {cursor!r}") from None
+    if cursor_scope != scope:
+        raise ValueError(f"cursor {cursor!r} does not belong to this listing")
+    return key, row
+
+
+def render(rows: Sequence[bytes], **fields) -> bytes:
+    """Success envelope around pre-encoded rows, with extra top-level keys."""
+    extra = b"".join(
+        b",%s:%s" % (json.dumps(name).encode(), json.dumps(value).encode())
+        for name, value in fields.items()
+    )
+    return b'{"status":"success","count":%d%s,"data":[%s]}' % (len(rows), extra, b",".join(rows))
+
+
+class JsonRecords:
+    """
+    Column-wise pre-encoded JSON records of a DataFrame.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Records to serve. The 'Date' field is taken from a 'Date' column if
+        present, otherwise from the DatetimeIndex, and formatted once.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        if DATE_FIELD in df.columns:
+            dates = pd.DatetimeIndex(pd.to_datetime(df[DATE_FIELD]))
+            columns = [c for c in df.columns if c != DATE_FIELD]
+        else:
+            dates = pd.DatetimeIndex(df.index)
+            columns = list(df.columns)
+
+        self.keys = dates.as_unit("ns").asi8
+        self._encoded: Dict[str, List[str]] = {
+            DATE_FIELD: [
+                json.dumps(d) if isinstance(d, str) else "null"
+                for d in dates.strftime(DATE_FORMAT)
+            ],
+        }
+        for column in columns:
+            self._encoded[str(column)] = _encode_column(df[column].to_numpy())
+        self.fields = tuple(self._encoded)
+        self._rows: Dict[Tuple[str, ...], List[bytes]] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def rows(self, fields: Optional[Sequence[str]] = None) -> List[bytes]:
+        """
+        Encoded records restricted to ``fields`` (all fields if None).
+
+        Each projection is assembled from the column fragments on first use
+        and kept, so repeated projections cost nothing.
+        """
+        fields = self.fields if fields is None else tuple(fields)
+        rows = self._rows.get(fields)
+        if rows is None:
+            unknown = [name for name in fields if name not in self._encoded]
+            if unknown or not fields:
+                raise ValueError(
+                    f"fields must be a non-empty subset of {list(self.fields)}, got {list(fields)}"
+                )
+            prefixes = [json.dumps(name) + ":" for name in fields]
+            rows = [
+                ("{" + ",".join(p + v for p, v in zip(prefixes, values)) + "}").encode()
+                for values in zip(*(self._encoded[name] for name in fields))
+            ]
+            self._rows[fields] = rows
+        return rows
+
+    def encode_positions(self, positions, fields: Optional[Sequence[str]] = None, **extra) -> bytes:
+        """Response body for the records at ``positions``, plus ``extra`` keys."""
+        rows = self.rows(fields)
+        return render([rows[i] for i in positions], **extra)
+
+
+class SortedPager:
+    """
+    Date-ordered view over a subset of records for range queries and paging.
+
+    Parameters:
+    -----------
+    keys : np.ndarray
+        Nanosecond date keys of all records.
+    rows : np.ndarray, optional
+        Ascending record positions to include (default all). Records without
+        a date are left out.
+    scope : str, optional
+        Name of the listing (e.g. 'prices'), recorded in its cursors so they
+        are not accepted by another listing. Default is ''.
+    """
+
+    def __init__(self, keys: np.ndarray, rows: Optional[np.ndarray] = None, scope: str = ""):
+        rows = np.arange(len(keys)) if rows is None else np.asarray(rows, dtype=np.int64)
+        rows = rows[keys[rows] != _NAT_KEY]
+        self.order = rows[np.argsort(keys[rows], kind="stable")]
+        self.sorted_keys = keys[self.order]
+        self.scope = scope
+
+    def locate(self, start_date=None, end_date=None) -> slice:
+        """Slice of the sorted order with start_date <= Date <= end_date."""
+        lo = 0 if start_date is None else int(
+            np.searchsorted(self.sorted_keys, pd.Timestamp(start_date).value, side="left")
+        )
+        hi = len(self.sorted_keys) if end_date is None else int(
+            np.searchsorted(self.sorted_keys, pd.Timestamp(end_date).value, side="right")
+        )
+        return slice(lo, max(lo, hi))
+
+    def seek(self, cursor: str) -> int:
+        """
+        Sorted position just after the record a cursor points at: O(log n).
+        Raises ValueError unless the cursor names a record of this listing.
+        """
+        key, row = decode_cursor(cursor, self.scope)
+        lo = int(np.searchsorted(self.sorted_keys, key, side="left"))
+        hi = int(np.searchsorted(self.sorted_keys, key, side="right"))
+        # Equal dates keep row order, so the run can be binary-searched by row
+        position = lo + int(np.searchsorted(self.order[lo:hi], row, side="left"))
+        if position >= hi or self.order[position] != row:
+            raise ValueError(f"cursor {cursor!r} does not point at a record of this listing")
+        return position + 1
+
+    def page(
+        self,
+        start_date=None,
+        end_date=None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[np.ndarray, Optional[str]]:
+        """
+        Record positions of one page and the cursor of the next one.
+
+        Returns:
+        --------
+        Tuple[np.ndarray, Optional[str]]
+            Record positions in date order and the ``after`` cursor for the
+            next page (None on the last page).
+        """
+        if limit is not None and limit < 1:
+            raise ValueError(f"limit must be a positive integer, got {limit}")
+        bounds = self.locate(start_date, end_date)
+        lo = bounds.start if after is None else max(bounds.start, self.seek(after))
+        hi = bounds.stop if limit is None else min(bounds.stop, lo + limit)
+        lo = min(lo, hi)
+
+        next_cursor = None
+        if lo < hi < bounds.stop:
+            next_cursor = encode_cursor(int(self.sorted_keys[hi - 1]), int(self.order[hi - 1]), self.scope)
+        return self.order[lo:hi], next_cursor
+
+
+class PricePayload(JsonRecords):
+    """
+    Pre-encoded JSON rows of a date-indexed price frame.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Frame with a DatetimeIndex named 'Date' (e.g. ``df_prices``). Every
+        column is serialized; the index becomes the 'Date' field.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+        super().__init__(df)
+        self.pager = SortedPager(self.keys, scope="prices")
+        self._full = render(self.rows())
+
+    def locate(self, start_date=None, end_date=None) -> slice:
+        """Positional slice of rows with start_date <= Date <= end_date."""
+        return self.pager.locate(start_date, end_date)
+
+    def encode(self, start_date=None, end_date=None, fields: Optional[Sequence[str]] = None) -> bytes:
+        """
+        The ``/prices`` response body for a date range.
+
+        Returns:
+        --------
+        bytes
+            JSON object with status, count and data (one record per day).
+        """
+        bounds = self.locate(start_date, end_date)
+        if fields is None and bounds.start == 0 and bounds.stop == len(self):
+            return self._full
+        return render(self.rows(fields)[bounds])
+
+    def encode_page(
+        self,
+        start_date=None,
+        end_date=None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> bytes:
+        """Response body for one page of the range, with a ``next_cursor`` key."""
+        positions, next_cursor = self.pager.page(start_date, end_date, after, limit)
+        # Prices are stored in date order, so a page is a contiguous slice
+        rows = self.rows(fields)[positions[0]:positions[-1] + 1] if len(positions) else []
+        return render(rows, next_cursor=next_cursor)
@@ -27,43 +27,28 @@ function App() {
       setError(null);
       
       try {
-        // Fetch prices
-        const pricesRes = await fetch(
-          `${API_BASE_URL}/prices?start_date=${dateRange.start}&end_date=${dateRange.end}`
+        // One round trip: prices, change points, events, associations and metrics
+        const res = await fetch(
+          `${API_BASE_URL}/dashboard?start_date=${dateRange.start}&end_date=${dateRange.end}&window_days=30`
         );
-        const pricesJson = await pricesRes.json();
-        if (pricesJson.status === "success") {
-          setPriceData(pricesJson.data);
+        const json = await res.json();
+        if (json.status !== "success") {
+          throw new Error(json.message || "Failed to load dashboard data");
         }
-
-        // Fetch change points
-        const cpRes = await fetch(`${API_BASE_URL}/changepoints`);
-        const cpJson = await cpRes.json();
-        if (cpJson.status === "success") {
-          setChangePoints(cpJson.data);
+        if (json.prices.status === "success") {
+          setPriceData(json.prices.data);
         }
-
-        // Fetch events
-        const eventsRes = await fetch(
-          `${API_BASE_URL}/events?start_date=${dateRange.start}&end_date=${dateRange.end}`
-        );
-        const eventsJson = await eventsRes.json();
-        if (eventsJson.status === "success") {
-          setEvents(eventsJson.data);
+        if (json.changepoints.status === "success") {
+          setChangePoints(json.changepoints.data);
         }
-
-        // Fetch associations
-        const assocRes = await fetch(`${API_BASE_URL}/associations?window_days=30`);
-        const assocJson = await assocRes.json();
-        if (assocJson.status === "success") {
-          setAssociations(assocJson.data);
+        if (json.events.status === "success") {
+          setEvents(json.events.data);
         }
-
-        // Fetch metrics
-        const metricsRes = await fetch(`${API_BASE_URL}/metrics`);
-        const metricsJson = await metricsRes.json();
-        if (metricsJson.status === "success") {
-          setMetrics(metricsJson);
+        if (json.associations.status === "success") {
+          setAssociations(json.associations.data);
+        }
+        if (json.metrics.status === "success") {
+          setMetrics(json.metrics);
         }
 
         setLoading(false);
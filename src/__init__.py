@@ -5,6 +5,8 @@ A comprehensive package for detecting structural breaks in Brent oil prices
 and associating them with geopolitical and economic events.
 """
 
+import importlib
+
 from .config import (
     BayesianModelConfig,
     DataConfig,
@@ -26,26 +28,65 @@ from .constants import (
     PROJECT_ROOT,
     RAW_DATA_DIR,
 )
-from .data_loader import load_brent_data, load_events_data
+from .api_client import fetch_prices, read_arrow_stream
+from .data_loader import load_brent_data, load_change_points, load_events_data
+from .downsampling import (
+    PricePyramid,
+    build_price_pyramid,
+    lttb,
+    resample_ohlc,
+)
 from .event_matching import (
+    EventIndex,
     associate_change_points_with_events,
+    associate_posterior_with_events,
     find_nearest_event,
     match_events_to_change_point,
+    window_sensitivity,
+)
+from .event_study import (
+    EventStudyResult,
+    event_study,
+    gather_event_returns,
 )
-from .modeling import (
-    build_change_point_model,
-    check_model_convergence,
-    extract_change_point_results,
-    run_mcmc_sampling,
+from .online import (
+    OnlineRollingMean,
+    OnlineRollingVolatility,
+    RollingWindowStatistics,
 )
+from .pipeline import Pipeline, PipelineResult, Stage, run_pipeline
 from .preprocessing import (
+    build_features,
+    calculate_multi_window_volatility,
     calculate_returns,
     calculate_rolling_mean,
     calculate_rolling_volatility,
 )
+from .significance import event_alignment_test
+from .text_index import EventTextIndex, tokenize
 
 __version__ = "1.0.0"
 
+# Submodules that pull in heavy dependencies (PyMC, ArviZ, PyTensor, SciPy,
+# statsmodels) are imported on first attribute access so that lightweight
+# consumers such as the dashboard backend only pay for what they use.
+_LAZY_ATTRIBUTES = {
+    "build_change_point_model": "modeling",
+    "run_mcmc_sampling": "modeling",
+    "extract_change_point_results": "modeling",
+    "check_model_convergence": "modeling",
+    "calculate_ewma_volatility": "volatility",
+    "calculate_garch_volatility": "volatility",
+    "garch_variance": "volatility",
+    "garch_log_likelihood": "volatility",
+    "fit_garch": "volatility",
+    "run_adf_test": "stationarity",
+    "run_kpss_test": "stationarity",
+    "run_stationarity_tests": "stationarity",
+    "rolling_stationarity_tests": "stationarity",
+    "expanding_stationarity_tests": "stationarity",
+}
+
 __all__ = [
     # Config
     "DataConfig",
@@ -69,17 +110,75 @@ __all__ = [
     # Data loading
     "load_brent_data",
     "load_events_data",
+    "load_change_points",
+    # API client
+    "fetch_prices",
+    "read_arrow_stream",
     # Preprocessing
     "calculate_returns",
     "calculate_rolling_volatility",
     "calculate_rolling_mean",
+    "build_features",
+    "calculate_multi_window_volatility",
+    # Downsampling
+    "resample_ohlc",
+    "lttb",
+    "PricePyramid",
+    "build_price_pyramid",
+    # Volatility models
+    "calculate_ewma_volatility",
+    "calculate_garch_volatility",
+    "garch_variance",
+    "garch_log_likelihood",
+    "fit_garch",
+    # Stationarity testing
+    "run_adf_test",
+    "run_kpss_test",
+    "run_stationarity_tests",
+    "rolling_stationarity_tests",
+    "expanding_stationarity_tests",
+    # Pipeline
+    "Pipeline",
+    "PipelineResult",
+    "Stage",
+    "run_pipeline",
+    # Online statistics
+    "RollingWindowStatistics",
+    "OnlineRollingMean",
+    "OnlineRollingVolatility",
     # Modeling
     "build_change_point_model",
     "run_mcmc_sampling",
     "extract_change_point_results",
     "check_model_convergence",
     # Event matching
+    "EventIndex",
     "match_events_to_change_point",
     "find_nearest_event",
     "associate_change_points_with_events",
+    "associate_posterior_with_events",
+    "window_sensitivity",
+    "EventTextIndex",
+    "tokenize",
+    "event_alignment_test",
+    # Event study
+    "event_study",
+    "gather_event_returns",
+    "EventStudyResult",
 ]
+
+
+def __getattr__(name):
+    """Import heavy submodules lazily on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,89 @@
+"""
+Python client helpers for the dashboard API.
+
+Bulk price history is fetched in the Arrow IPC streaming format and read
+straight into pandas, skipping JSON encoding on the server and parsing on
+the client. Requires the optional ``pyarrow`` dependency.
+"""
+
+import urllib.parse
+import urllib.request
+from typing import Optional, Sequence
+
+import pandas as pd
+
+from .constants import ARROW_STREAM_MIMETYPE, FRONTEND_API_BASE_URL
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("pyarrow is required to read Arrow streams: pip install pyarrow") from None
+    return pyarrow
+
+
+def read_arrow_stream(source) -> pd.DataFrame:
+    """
+    Read an Arrow IPC stream into a DataFrame.
+
+    Parameters:
+    -----------
+    source : bytes or file-like
+        Arrow streaming-format data, e.g. a ``/prices?format=arrow`` body or
+        an open HTTP response.
+
+    Returns:
+    --------
+    pd.DataFrame
+        The stream's columns; a 'Date' column becomes the DatetimeIndex.
+        Null values are NaN.
+    """
+    pa = _require_pyarrow()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = pa.BufferReader(source)
+    df = pa.ipc.open_stream(source).read_all().to_pandas()
+    if 'Date' in df.columns:
+        df = df.set_index('Date')
+    return df
+
+
+def fetch_prices(
+    base_url: str = FRONTEND_API_BASE_URL,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    timeout: float = 60.0
+) -> pd.DataFrame:
+    """
+    Fetch price history from the dashboard API as a DataFrame.
+
+    Parameters:
+    -----------
+    base_url : str, optional
+        API root. Default is ``FRONTEND_API_BASE_URL``.
+    start_date, end_date : str, optional
+        Inclusive date range (YYYY-MM-DD). Default is the full history.
+    fields : sequence of str, optional
+        Columns to fetch, e.g. ('Date', 'Price'). Default is all.
+    timeout : float, optional
+        Request timeout in seconds. Default is 60.
+
+    Returns:
+    --------
+    pd.DataFrame
+        Prices indexed by Date (if requested), as served by ``/prices``.
+    """
+    _require_pyarrow()
+    params = {'format': 'arrow'}
+    if start_date:
+        params['start_date'] = start_date
+    if end_date:
+        params['end_date'] = end_date
+    if fields:
+        params['fields'] = ','.join(fields)
+
+    url = f"{base_url.rstrip('/')}/prices?{urllib.parse.urlencode(params)}"
+    request = urllib.request.Request(url, headers={'Accept': ARROW_STREAM_MIMETYPE})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return read_arrow_stream(response)
@@ -16,6 +16,9 @@ BRENT_OIL_PRICES_CSV: Final[Path] = RAW_DATA_DIR / "brent_oil_prices.csv"
 KEY_EVENTS_CSV: Final[Path] = PROCESSED_DATA_DIR / "key_events.csv"
 CHANGE_POINTS_CSV: Final[Path] = PROCESSED_DATA_DIR / "change_point_event_association.csv"
 
+# Cache directories
+PIPELINE_CACHE_DIR: Final[Path] = PROCESSED_DATA_DIR / "pipeline_cache"
+
 # Date formats
 DATE_FORMAT_1: Final[str] = "%d-%b-%y"  # "20-May-87"
 DATE_FORMAT_2: Final[str] = "%b %d, %Y"  # "Apr 22, 2020"
@@ -25,6 +28,12 @@ DATE_FORMAT_OUTPUT: Final[str] = "%Y-%m-%d"  # "2020-04-22"
 DEFAULT_EVENT_WINDOW_DAYS: Final[int] = 30
 MIN_EVENT_WINDOW_DAYS: Final[int] = 1
 MAX_EVENT_WINDOW_DAYS: Final[int] = 365
+DEFAULT_SENSITIVITY_WINDOWS: Final[tuple] = (7, 14, 30, 60, 90)
+
+# Event study (offsets in trading days relative to the event day)
+DEFAULT_EVENT_STUDY_WINDOWS: Final[tuple] = ((-1, 1), (-5, 5), (-10, 10))
+DEFAULT_ESTIMATION_WINDOW: Final[tuple] = (-250, -11)
+MIN_ESTIMATION_OBSERVATIONS: Final[int] = 30
 
 # Returns calculation
 RETURN_METHOD_LOG: Final[str] = "log"
@@ -48,11 +57,18 @@ KPSS_SIGNIFICANCE_LEVEL: Final[float] = 0.05
 
 # Volatility calculation
 DEFAULT_ROLLING_WINDOW: Final[int] = 30
+TRADING_DAYS_PER_YEAR: Final[int] = 252
+DEFAULT_EWMA_DECAY: Final[float] = 0.94  # RiskMetrics daily decay factor
+
+# Downsampling pyramid
+OHLC_RESOLUTIONS: Final[dict] = {"weekly": "W", "monthly": "M", "quarterly": "Q"}
+DEFAULT_LTTB_TARGETS: Final[tuple] = (250, 500, 1000, 2000)
 
 # API configuration
 API_HOST: Final[str] = "0.0.0.0"
 API_PORT: Final[int] = 5000
 API_DEBUG: Final[bool] = True
+ARROW_STREAM_MIMETYPE: Final[str] = "application/vnd.apache.arrow.stream"
 
 # Dashboard configuration
 FRONTEND_PORT: Final[int] = 3000
@@ -1,8 +1,8 @@
 """
 Data loading utilities for Brent oil price analysis.
 
-This module provides functions to load and parse Brent oil price data
-and event data from CSV files.
+This module provides functions to load and parse Brent oil price data,
+event data and persisted change point results from CSV files.
 """
 
 from pathlib import Path
@@ -13,6 +13,11 @@ import pandas as pd
 from .config import DataConfig
 from .constants import DATE_FORMAT_1, DATE_FORMAT_2
 
+# Column names accepted for persisted change point results, in order of preference
+CHANGE_POINT_DATE_COLUMNS = ('change_date', 'change_point_date', 'date')
+CHANGE_POINT_INDEX_COLUMNS = ('change_index', 'change_point_index', 'index')
+CHANGE_POINT_VALUE_COLUMNS = ('mu_1', 'mu_2', 'sigma', 'impact', 'impact_pct', 'confidence')
+
 
 def load_brent_data(data_path: Optional[Path] = None, config: Optional[DataConfig] = None) -> pd.DataFrame:
     """
@@ -135,3 +140,63 @@ def load_events_data(data_path: Optional[Path] = None, config: Optional[DataConf
     df['Date'] = pd.to_datetime(df['Date'])
     
     return df
+
+
+def load_change_points(data_path: Optional[Path] = None, config: Optional[DataConfig] = None) -> pd.DataFrame:
+    """
+    Load persisted change point results from CSV file.
+    
+    Accepts either one row per change point (as built from
+    ``extract_change_point_results``) or the change point-event association
+    table saved by notebook 04, which repeats each change point once per
+    matched event; repeated change points are collapsed to their first row.
+    
+    Parameters:
+    -----------
+    data_path : Path, optional
+        Path to the change points CSV file. If None, uses path from config or default.
+    config : DataConfig, optional
+        Configuration object. If None, uses default DataConfig.
+    
+    Returns:
+    --------
+    pd.DataFrame
+        One row per change point sorted by date, with a 'change_date' column,
+        a 'change_index' column (nullable, if the file has one) and whichever
+        of mu_1, mu_2, sigma, impact, impact_pct and confidence are present.
+    
+    Raises:
+    -------
+    FileNotFoundError
+        If the change points file does not exist.
+    ValueError
+        If the file has no change point date column.
+    """
+    if config is None:
+        config = DataConfig()
+    
+    if data_path is None:
+        data_path = config.change_points_path
+    
+    if not data_path.exists():
+        raise FileNotFoundError(f"Change points file not found: {data_path}")
+    
+    df = pd.read_csv(data_path)
+    
+    date_column = next((c for c in CHANGE_POINT_DATE_COLUMNS if c in df.columns), None)
+    if date_column is None:
+        raise ValueError(
+            f"Change points CSV file must contain one of {list(CHANGE_POINT_DATE_COLUMNS)}"
+        )
+    index_column = next((c for c in CHANGE_POINT_INDEX_COLUMNS if c in df.columns), None)
+    
+    result = pd.DataFrame({'change_date': pd.to_datetime(df[date_column])})
+    if index_column is not None:
+        result['change_index'] = pd.to_numeric(df[index_column]).astype('Int64')
+    for column in CHANGE_POINT_VALUE_COLUMNS:
+        if column in df.columns:
+            result[column] = pd.to_numeric(df[column])
+    
+    result = result.dropna(subset=['change_date'])
+    result = result.drop_duplicates(subset='change_date', keep='first')
+    return result.sort_values('change_date', kind='stable').reset_index(drop=True)
@@ -0,0 +1,376 @@
+"""
+Multi-resolution downsampling of Brent oil prices for plotting.
+
+This module provides OHLC aggregation to weekly/monthly/quarterly buckets,
+largest-triangle-three-buckets (LTTB) downsampling, and a ``PricePyramid``
+that precomputes all levels once and serves them by resolution and date
+range using binary search.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .constants import DEFAULT_LTTB_TARGETS, OHLC_RESOLUTIONS
+
+DAILY_RESOLUTION = "daily"
+LTTB_PREFIX = "lttb_"
+AGG_LTTB = "lttb"
+AGG_OHLC = "ohlc"
+VALID_AGGREGATIONS = (AGG_LTTB, AGG_OHLC)
+
+DateLike = Union[str, pd.Timestamp, None]
+
+_NS_PER_DAY = 86_400e9
+
+
+def _date_keys(index: pd.DatetimeIndex) -> np.ndarray:
+    """Nanosecond int64 keys of a DatetimeIndex, whatever its resolution."""
+    return pd.DatetimeIndex(index).as_unit('ns').asi8
+
+
+def resample_ohlc(prices: pd.Series, freq: str) -> pd.DataFrame:
+    """
+    Aggregate a price series into OHLC buckets.
+
+    Buckets are calendar periods (e.g. 'W', 'M', 'Q'). Because the input is
+    sorted, every bucket is a contiguous run, so open/close are simple
+    gathers and high/low are ``ufunc.reduceat`` over the run starts.
+
+    Parameters:
+    -----------
+    prices : pd.Series
+        Price series with a sorted DatetimeIndex.
+    freq : str
+        Pandas period alias, e.g. 'W', 'M' or 'Q'.
+
+    Returns:
+    --------
+    pd.DataFrame
+        DataFrame indexed by bucket start date with Open, High, Low, Close
+        and Count columns.
+    """
+    if not isinstance(prices.index, pd.DatetimeIndex):
+        raise ValueError("prices must have a DatetimeIndex")
+
+    values = prices.to_numpy(dtype=np.float64)
+    if len(values) == 0:
+        return pd.DataFrame(
+            columns=['Open', 'High', 'Low', 'Close', 'Count'],
+            index=pd.DatetimeIndex([], name=prices.index.name),
+        )
+
+    periods = prices.index.to_period(freq)
+    codes = periods.asi8
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    ends = np.r_[starts[1:], len(values)]
+
+    ohlc = pd.DataFrame(
+        {
+            'Open': values[starts],
+            'High': np.maximum.reduceat(values, starts),
+            'Low': np.minimum.reduceat(values, starts),
+            'Close': values[ends - 1],
+            'Count': ends - starts,
+        },
+        index=periods[starts].start_time,
+    )
+    ohlc.index.name = prices.index.name
+    return ohlc
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select points with the largest-triangle-three-buckets algorithm.
+
+    The first and last points are always kept; every bucket in between
+    contributes the point forming the largest triangle with the previously
+    selected point and the mean of the next bucket. Bucket means are read
+    off prefix sums, so the per-bucket work is a single vectorized argmax.
+
+    Parameters:
+    -----------
+    x, y : np.ndarray
+        Coordinates of the series, ``x`` sorted ascending.
+    n_out : int
+        Number of points to keep (at least 3).
+
+    Returns:
+    --------
+    np.ndarray
+        Sorted integer positions of the selected points.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+
+    if n_out < 3:
+        raise ValueError(f"n_out must be at least 3, got {n_out}")
+    if n_out >= n:
+        return np.arange(n)
+
+    # Bucket boundaries for the n - 2 interior points
+    edges = (np.floor(np.arange(n_out - 1) * (n - 2) / (n_out - 2)) + 1).astype(np.int64)
+    edges[-1] = n - 1
+
+    x_sums = np.r_[0.0, np.cumsum(x)]
+    y_sums = np.r_[0.0, np.cumsum(y)]
+    # Mean of bucket i + 1 (the last interior bucket looks at the final point)
+    next_start = np.r_[edges[1:-1], n - 1]
+    next_end = np.r_[edges[2:], n]
+    next_count = next_end - next_start
+    next_x = (x_sums[next_end] - x_sums[next_start]) / next_count
+    next_y = (y_sums[next_end] - y_sums[next_start]) / next_count
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs(
+            (x[a] - next_x[i]) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (next_y[i] - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return selected
+
+
+def lttb(prices: pd.Series, n_out: int) -> pd.Series:
+    """
+    Downsample a price series to ``n_out`` points with LTTB.
+
+    Parameters:
+    -----------
+    prices : pd.Series
+        Price series with a sorted DatetimeIndex.
+    n_out : int
+        Number of points to keep.
+
+    Returns:
+    --------
+    pd.Series
+        The selected subset of ``prices``.
+    """
+    x = _date_keys(prices.index) / _NS_PER_DAY  # days, to keep the triangle areas well scaled
+    return prices.iloc[lttb_indices(x, prices.to_numpy(dtype=np.float64), n_out)]
+
+
+class PricePyramid:
+    """
+    Precomputed multi-resolution views of a price series.
+
+    Levels are the daily frame itself, OHLC aggregates for every entry of
+    ``ohlc_resolutions`` and LTTB downsamples for every entry of
+    ``lttb_targets``. Each level keeps its dates as a sorted int64 array,
+    so ``query`` finds a date range with two binary searches and returns a
+    positional slice (a view) of the precomputed frame.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        DataFrame with DatetimeIndex and Price column (e.g. from
+        ``load_brent_data``). Extra columns are carried along in the daily
+        and LTTB levels.
+    ohlc_resolutions : dict, optional
+        Mapping of level name to pandas period alias. Default is weekly,
+        monthly and quarterly.
+    lttb_targets : sequence of int, optional
+        Point counts for LTTB levels. Default is (250, 500, 1000, 2000).
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        ohlc_resolutions: Optional[Dict[str, str]] = None,
+        lttb_targets: Optional[Sequence[int]] = None
+    ):
+        if 'Price' not in df.columns:
+            raise ValueError("DataFrame must contain a 'Price' column")
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+
+        if ohlc_resolutions is None:
+            ohlc_resolutions = OHLC_RESOLUTIONS
+        if lttb_targets is None:
+            lttb_targets = DEFAULT_LTTB_TARGETS
+
+        self._levels: Dict[str, pd.DataFrame] = {DAILY_RESOLUTION: df}
+        for name, freq in ohlc_resolutions.items():
+            self._levels[name] = resample_ohlc(df['Price'], freq)
+
+        x = _date_keys(df.index) / _NS_PER_DAY
+        y = df['Price'].to_numpy(dtype=np.float64)
+        for target in sorted(set(int(t) for t in lttb_targets)):
+            self._levels[f"{LTTB_PREFIX}{target}"] = df.iloc[lttb_indices(x, y, target)]
+
+        self._keys = {name: _date_keys(level.index) for name, level in self._levels.items()}
+
+    @property
+    def resolutions(self) -> List[str]:
+        """Names of the available levels."""
+        return list(self._levels)
+
+    @property
+    def ohlc_resolutions(self) -> List[str]:
+        """Names of the OHLC levels, finest first."""
+        return [name for name, level in self._levels.items() if 'Open' in level.columns]
+
+    @property
+    def lttb_targets(self) -> List[int]:
+        """Point counts of the LTTB levels, ascending."""
+        return [int(name[len(LTTB_PREFIX):]) for name in self._levels if name.startswith(LTTB_PREFIX)]
+
+    def level(self, resolution: str) -> pd.DataFrame:
+        """Return the full precomputed frame for a resolution."""
+        if resolution not in self._levels:
+            raise ValueError(f"resolution must be one of {self.resolutions}, got {resolution}")
+        return self._levels[resolution]
+
+    def locate(self, resolution: str, start: DateLike = None, end: DateLike = None) -> slice:
+        """
+        Positional slice of ``resolution`` covering [start, end] (inclusive).
+
+        Uses binary search on the level's sorted dates: O(log n).
+        """
+        self.level(resolution)  # validates the name
+        keys = self._keys[resolution]
+        lo = 0 if start is None else int(np.searchsorted(keys, pd.Timestamp(start).value, side='left'))
+        hi = len(keys) if end is None else int(np.searchsorted(keys, pd.Timestamp(end).value, side='right'))
+        return slice(lo, max(lo, hi))
+
+    def count(self, resolution: str, start: DateLike = None, end: DateLike = None) -> int:
+        """Number of rows ``query`` would return, without slicing."""
+        bounds = self.locate(resolution, start, end)
+        return bounds.stop - bounds.start
+
+    def query(self, resolution: str, start: DateLike = None, end: DateLike = None) -> pd.DataFrame:
+        """
+        Return the rows of a resolution between ``start`` and ``end`` (inclusive).
+
+        Parameters:
+        -----------
+        resolution : str
+            'daily', an OHLC level name (e.g. 'monthly') or an LTTB level
+            name (e.g. 'lttb_1000').
+        start, end : str or pd.Timestamp, optional
+            Date range bounds. None means unbounded.
+
+        Returns:
+        --------
+        pd.DataFrame
+            Positional slice of the precomputed level.
+        """
+        return self.level(resolution).iloc[self.locate(resolution, start, end)]
+
+    def plan(
+        self,
+        max_points: int,
+        start: DateLike = None,
+        end: DateLike = None,
+        agg: str = AGG_LTTB
+    ) -> Tuple[str, np.ndarray]:
+        """
+        Choose the rows that represent [start, end] in at most ``max_points``.
+
+        With 'lttb', the daily rows are used when they fit. Otherwise the
+        coarsest LTTB level that still has at least ``max_points`` rows in
+        the range is LTTB-downsampled to exactly ``max_points``, so the work
+        per request is bounded by that level's size, not by the length of
+        the range. With 'ohlc', the finest OHLC level with at most
+        ``max_points`` buckets in the range is used.
+
+        Parameters:
+        -----------
+        max_points : int
+            Maximum number of rows to return (at least 3 for 'lttb').
+        start, end : str or pd.Timestamp, optional
+            Date range bounds. None means unbounded.
+        agg : str, optional
+            'lttb' or 'ohlc'. Default is 'lttb'.
+
+        Returns:
+        --------
+        Tuple[str, np.ndarray]
+            The resolution the rows come from and their sorted positions
+            in ``level(resolution)``.
+
+        Raises:
+        -------
+        ValueError
+            If agg or max_points is invalid, or with 'ohlc' when even the
+            coarsest level has more than ``max_points`` buckets in the range.
+        """
+        if agg not in VALID_AGGREGATIONS:
+            raise ValueError(f"agg must be one of {VALID_AGGREGATIONS}, got {agg}")
+        max_points = int(max_points)
+
+        if agg == AGG_OHLC:
+            if max_points < 1:
+                raise ValueError(f"max_points must be a positive integer, got {max_points}")
+            names = self.ohlc_resolutions
+            if not names:
+                raise ValueError("the pyramid has no OHLC levels")
+            chosen = next((name for name in names if self.count(name, start, end) <= max_points), None)
+            if chosen is None:
+                raise ValueError(
+                    f"max_points={max_points} is too small for OHLC: the range has "
+                    f"{self.count(names[-1], start, end)} {names[-1]} buckets"
+                )
+            bounds = self.locate(chosen, start, end)
+            return chosen, np.arange(bounds.start, bounds.stop)
+
+        if max_points < 3:
+            raise ValueError(f"max_points must be at least 3, got {max_points}")
+        # Finest to coarsest: daily, then LTTB levels by decreasing size
+        candidates = [DAILY_RESOLUTION] + [f"{LTTB_PREFIX}{t}" for t in reversed(self.lttb_targets)]
+        chosen = DAILY_RESOLUTION
+        for name in candidates:
+            if self.count(name, start, end) < max_points:
+                break
+            chosen = name
+        bounds = self.locate(chosen, start, end)
+        if bounds.stop - bounds.start <= max_points:
+            return chosen, np.arange(bounds.start, bounds.stop)
+
+        level = self._levels[chosen]
+        x = self._keys[chosen][bounds] / _NS_PER_DAY
+        y = level['Price'].to_numpy(dtype=np.float64)[bounds]
+        return chosen, bounds.start + lttb_indices(x, y, max_points)
+
+    def downsample(
+        self,
+        max_points: int,
+        start: DateLike = None,
+        end: DateLike = None,
+        agg: str = AGG_LTTB
+    ) -> pd.DataFrame:
+        """
+        Return at most ``max_points`` rows representing [start, end].
+
+        See ``plan`` for how the level is chosen. 'lttb' rows have the daily
+        columns; 'ohlc' rows have Open, High, Low, Close and Count.
+        """
+        resolution, positions = self.plan(max_points, start, end, agg)
+        return self._levels[resolution].iloc[positions]
+
+    def __repr__(self) -> str:
+        sizes = ", ".join(f"{name}={len(level)}" for name, level in self._levels.items())
+        return f"PricePyramid({sizes})"
+
+
+def build_price_pyramid(
+    df: pd.DataFrame,
+    ohlc_resolutions: Optional[Dict[str, str]] = None,
+    lttb_targets: Optional[Iterable[int]] = None
+) -> PricePyramid:
+    """
+    Build a ``PricePyramid`` for loaded price data.
+
+    Convenience wrapper meant to be called right after ``load_brent_data``
+    so that the pyramid can be cached next to the DataFrame.
+    """
+    return PricePyramid(df, ohlc_resolutions=ohlc_resolutions, lttb_targets=lttb_targets)
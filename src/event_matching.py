@@ -3,16 +3,235 @@ Event matching utilities for associating change points with geopolitical events.
 """
 
 from datetime import timedelta
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 from .config import EventMatchingConfig
+from .constants import DEFAULT_SENSITIVITY_WINDOWS
+from .text_index import EventTextIndex
+
+NS_PER_DAY = 86_400 * 10**9
+NO_EVENT_LABEL = "No major recorded event"
+ASSOCIATION_COLUMNS = [
+    "change_point_date",
+    "event_date",
+    "event",
+    "description",
+    "days_from_change",
+]
+
+
+def _datetime_keys(dates) -> np.ndarray:
+    """Nanosecond int64 keys for datetime-like values (NaT maps to int64 min)."""
+    return pd.DatetimeIndex(pd.to_datetime(dates)).as_unit('ns').asi8
+
+
+class EventIndex:
+    """
+    Sorted index over an events DataFrame for fast date queries.
+    
+    Built once (e.g. from ``load_events_data`` output), it keeps the event
+    dates as a stably sorted int64 array so that window, k-nearest and
+    nearest-within-window queries are answered by binary search instead of
+    rescanning the frame. Every query has a batched form that takes an
+    array of dates. Results are row positions into ``events``; ties and
+    window matches follow the original row order, like the DataFrame-based
+    functions. ``search`` narrows the index to events matching a keyword
+    query through an ``EventTextIndex`` built on first use.
+    
+    Parameters:
+    -----------
+    events_df : pd.DataFrame
+        DataFrame with event dates (must have 'Date' column). Events with
+        NaT dates are never matched.
+    """
+    
+    def __init__(self, events_df: pd.DataFrame):
+        if 'Date' not in events_df.columns:
+            raise ValueError("events_df must contain a 'Date' column")
+        
+        self.events = events_df
+        self.dates = pd.DatetimeIndex(pd.to_datetime(events_df['Date']))
+        self.keys = _datetime_keys(self.dates)
+        
+        valid = np.flatnonzero(self.keys != np.iinfo(np.int64).min)
+        self.order = valid[np.argsort(self.keys[valid], kind='stable')]
+        self.sorted_keys = self.keys[self.order]
+        self._is_row_sorted = bool(np.all(self.order[1:] > self.order[:-1]))
+        self._text_index: Optional[EventTextIndex] = None
+    
+    @property
+    def text_index(self) -> EventTextIndex:
+        """Inverted index over the event names and descriptions."""
+        if self._text_index is None:
+            self._text_index = EventTextIndex(self.events)
+        return self._text_index
+    
+    def search(self, query: str, prefix: bool = True, match: str = "all") -> "EventIndex":
+        """
+        Index over the events matching a keyword query.
+        
+        The result can be passed to any event-matching function in place of
+        the events DataFrame, e.g. to associate change points with
+        sanctions-related events only. See ``EventTextIndex.search``.
+        """
+        positions = self.text_index.search(query, prefix=prefix, match=match)
+        return EventIndex(self.events.iloc[positions])
+    
+    def __len__(self) -> int:
+        return len(self.sorted_keys)
+    
+    def __repr__(self) -> str:
+        return f"EventIndex(n_events={len(self)})"
+    
+    def _bounds(self, query_keys: np.ndarray, window_days: int) -> Tuple[np.ndarray, np.ndarray]:
+        span = int(window_days) * NS_PER_DAY
+        lo = np.searchsorted(self.sorted_keys, query_keys - span, side='left')
+        hi = np.searchsorted(self.sorted_keys, query_keys + span, side='right')
+        return lo, np.maximum(hi, lo)
+    
+    def window_join(
+        self,
+        dates,
+        window_days: int = 30
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Interval join of many dates against events within +/- window_days.
+        
+        Each query window's bounds are found with ``searchsorted`` and the
+        matching positions are gathered in one shot.
+        
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray, np.ndarray]
+            (counts, query_ids, positions): number of matches per query, and
+            for every match the query index and the event's row position.
+            Matches are ordered by query, then by original event row.
+        """
+        query_keys = _datetime_keys(dates)
+        lo, hi = self._bounds(query_keys, window_days)
+        counts = hi - lo
+        
+        query_ids = np.repeat(np.arange(len(query_keys)), counts)
+        starts = np.cumsum(counts) - counts
+        sorted_pos = np.arange(len(query_ids)) - np.repeat(starts - lo, counts)
+        positions = self.order[sorted_pos]
+        
+        # Restore the original event row order within each query. Nothing to
+        # do in the common case of events already sorted by date.
+        if not self._is_row_sorted:
+            regroup = np.argsort(query_ids * len(self.keys) + positions, kind='stable')
+            query_ids, positions = query_ids[regroup], positions[regroup]
+        return counts, query_ids, positions
+    
+    def window(self, date, window_days: int = 30) -> np.ndarray:
+        """Row positions of events within +/- window_days of ``date``."""
+        lo, hi = self._bounds(_datetime_keys([date]), window_days)
+        return np.sort(self.order[lo[0]:hi[0]])
+    
+    def window_counts(self, dates, window_days: int = 30) -> np.ndarray:
+        """Number of events within +/- window_days of each date."""
+        lo, hi = self._bounds(_datetime_keys(dates), window_days)
+        return hi - lo
+    
+    def nearest_k(self, dates, k: int = 1) -> np.ndarray:
+        """
+        Row positions of the ``k`` nearest events to each date.
+        
+        Only the ``k`` sorted neighbours on either side of each insertion
+        point can be among the nearest, so candidates form a (queries x 2k)
+        matrix ranked in one vectorized argsort.
+        
+        Returns:
+        --------
+        np.ndarray
+            Array of shape (len(dates), min(k, n_events)), closest first.
+        """
+        if k < 1:
+            raise ValueError(f"k must be a positive integer, got {k}")
+        query_keys = _datetime_keys(dates)
+        n = len(self.sorted_keys)
+        k = min(k, n)
+        if k == 0:
+            return np.empty((len(query_keys), 0), dtype=np.int64)
+        
+        insert = np.searchsorted(self.sorted_keys, query_keys)
+        candidates = insert[:, None] + np.arange(-k, k)[None, :]
+        in_range = (candidates >= 0) & (candidates < n)
+        candidates = np.clip(candidates, 0, n - 1)
+        
+        distance = np.abs(self.sorted_keys[candidates] - query_keys[:, None]).astype(np.float64)
+        distance[~in_range] = np.inf
+        best = np.argsort(distance, axis=1, kind='stable')[:, :k]
+        return self.order[np.take_along_axis(candidates, best, axis=1)]
+    
+    def nearest_within_window(self, dates, window_days: int = 30) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Nearest event within +/- window_days of each date.
+        
+        Distance is measured in whole days as in ``days_from_change``; ties
+        go to the earliest row, matching ``find_nearest_event``.
+        
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray]
+            (positions, days_from_change). Position is -1 and days is NaN
+            where no event falls inside the window.
+        """
+        query_keys = _datetime_keys(dates)
+        lo, hi = self._bounds(query_keys, window_days)
+        has_match = hi > lo
+        positions = np.full(len(query_keys), -1, dtype=np.int64)
+        days = np.full(len(query_keys), np.nan)
+        if not has_match.any() or len(self.sorted_keys) == 0:
+            return positions, days
+        
+        # Candidates: last event at or before the date and first event after
+        # it, each moved to the start of its run of equal dates so that the
+        # stable sort yields the earliest row among ties.
+        insert = np.searchsorted(self.sorted_keys, query_keys, side='right')
+        last = len(self.sorted_keys) - 1
+        left = np.clip(np.maximum(insert - 1, lo), 0, last)
+        right = np.clip(np.minimum(insert, hi - 1), 0, last)
+        left = np.searchsorted(self.sorted_keys, self.sorted_keys[left], side='left')
+        right = np.searchsorted(self.sorted_keys, self.sorted_keys[right], side='left')
+        
+        left_days = (self.sorted_keys[left] - query_keys) // NS_PER_DAY
+        right_days = (self.sorted_keys[right] - query_keys) // NS_PER_DAY
+        left_pos, right_pos = self.order[left], self.order[right]
+        take_right = (np.abs(right_days) < np.abs(left_days)) | (
+            (np.abs(right_days) == np.abs(left_days)) & (right_pos < left_pos)
+        )
+        
+        best_pos = np.where(take_right, right_pos, left_pos)
+        best_days = np.where(take_right, right_days, left_days)
+        positions[has_match] = best_pos[has_match]
+        days[has_match] = best_days[has_match]
+        return positions, days
+
+
+def _as_event_index(events: Union[pd.DataFrame, "EventIndex"]) -> "EventIndex":
+    return events if isinstance(events, EventIndex) else EventIndex(events)
+
+
+def _gather_column(events_df: pd.DataFrame, column: str, rows: np.ndarray, fill_value, default):
+    """
+    Take ``events_df[column]`` at ``rows``, using ``fill_value`` where rows is -1.
+    
+    If the column does not exist, matched rows get ``default`` instead.
+    """
+    if column not in events_df.columns:
+        values = np.full(len(rows), default, dtype=object)
+        values[rows < 0] = fill_value
+        return values
+    return events_df[column].array.take(rows, allow_fill=True, fill_value=fill_value)
 
 
 def match_events_to_change_point(
     change_point_date: pd.Timestamp,
-    events_df: pd.DataFrame,
+    events_df: Union[pd.DataFrame, EventIndex],
     window_days: int = 30,
     config: Optional[EventMatchingConfig] = None
 ) -> pd.DataFrame:
@@ -23,8 +242,9 @@ def match_events_to_change_point(
     -----------
     change_point_date : pd.Timestamp
         The change point date.
-    events_df : pd.DataFrame
-        DataFrame with event dates (must have 'Date' column).
+    events_df : pd.DataFrame or EventIndex
+        DataFrame with event dates (must have 'Date' column), or an
+        ``EventIndex`` built from one to answer by binary search.
     window_days : int, optional
         Number of days before and after change point to search. Default is 30.
     config : EventMatchingConfig, optional
@@ -38,6 +258,15 @@ def match_events_to_change_point(
     if config is not None:
         window_days = config.window_days
     
+    if isinstance(events_df, EventIndex):
+        positions = events_df.window(change_point_date, window_days)
+        matched = events_df.events.iloc[positions].copy()
+        if not matched.empty:
+            matched['days_from_change'] = (
+                (events_df.keys[positions] - _datetime_keys([change_point_date])[0]) // NS_PER_DAY
+            )
+        return matched
+    
     if 'Date' not in events_df.columns:
         raise ValueError("events_df must contain a 'Date' column")
     
@@ -57,7 +286,7 @@ def match_events_to_change_point(
 
 def find_nearest_event(
     change_point_date: pd.Timestamp,
-    events_df: pd.DataFrame,
+    events_df: Union[pd.DataFrame, EventIndex],
     window_days: int = 30,
     config: Optional[EventMatchingConfig] = None
 ) -> Optional[pd.Series]:
@@ -68,8 +297,9 @@ def find_nearest_event(
     -----------
     change_point_date : pd.Timestamp
         The change point date.
-    events_df : pd.DataFrame
-        DataFrame with event dates (must have 'Date' column).
+    events_df : pd.DataFrame or EventIndex
+        DataFrame with event dates (must have 'Date' column), or an
+        ``EventIndex`` to locate the nearest event without a window scan.
     window_days : int, optional
         Number of days before and after change point to search. Default is 30.
     config : EventMatchingConfig, optional
@@ -80,6 +310,16 @@ def find_nearest_event(
     pd.Series or None
         The nearest event as a Series, or None if no events found.
     """
+    if isinstance(events_df, EventIndex):
+        if config is not None:
+            window_days = config.window_days
+        positions, days = events_df.nearest_within_window([change_point_date], window_days)
+        if positions[0] < 0:
+            return None
+        nearest = events_df.events.iloc[positions[0]].copy()
+        nearest['days_from_change'] = int(days[0])
+        return nearest
+    
     matched = match_events_to_change_point(change_point_date, events_df, window_days, config)
     
     if matched.empty:
@@ -92,19 +332,26 @@ def find_nearest_event(
 
 def associate_change_points_with_events(
     change_points_df: pd.DataFrame,
-    events_df: pd.DataFrame,
+    events_df: Union[pd.DataFrame, EventIndex],
     window_days: int = 30,
     config: Optional[EventMatchingConfig] = None
 ) -> pd.DataFrame:
     """
     Associate multiple change points with events.
     
+    Implemented as a sorted-array interval join (``EventIndex.window_join``):
+    events are sorted once, each change point's window bounds are located
+    with ``searchsorted`` and all matches are gathered in a single indexing
+    step, so the cost is O((C + E) log E + matches) rather than a Python
+    loop over C x E.
+    
     Parameters:
     -----------
     change_points_df : pd.DataFrame
         DataFrame with change point dates (must have 'change_date' column).
-    events_df : pd.DataFrame
-        DataFrame with event dates (must have 'Date' column).
+    events_df : pd.DataFrame or EventIndex
+        DataFrame with event dates (must have 'Date' column), or a prebuilt
+        ``EventIndex`` to skip sorting the events.
     window_days : int, optional
         Number of days before and after change point to search. Default is 30.
     config : EventMatchingConfig, optional
@@ -113,7 +360,9 @@ def associate_change_points_with_events(
     Returns:
     --------
     pd.DataFrame
-        Association results with change_point_date, event_date, event, and days_from_change columns.
+        Association results with change_point_date, event_date, event, description
+        and days_from_change columns. Change points without any event in the
+        window get a single row with event "No major recorded event".
     """
     if config is not None:
         window_days = config.window_days
@@ -121,29 +370,194 @@ def associate_change_points_with_events(
     if 'change_date' not in change_points_df.columns:
         raise ValueError("change_points_df must contain a 'change_date' column")
     
-    associations = []
+    index = _as_event_index(events_df)
+    events_df = index.events
+    cp_dates = pd.DatetimeIndex(pd.to_datetime(change_points_df['change_date']))
+    cp_keys = _datetime_keys(cp_dates)
+    counts, cp_ids, event_pos = index.window_join(cp_dates, window_days)
     
-    for _, cp_row in change_points_df.iterrows():
-        cp_date = pd.to_datetime(cp_row['change_date'])
-        matched = match_events_to_change_point(cp_date, events_df, window_days, config)
-        
-        if not matched.empty:
-            for _, event_row in matched.iterrows():
-                associations.append({
-                    "change_point_date": cp_date,
-                    "event_date": event_row['Date'],
-                    "event": event_row.get('Event', 'Unknown Event'),
-                    "description": event_row.get('Description', ''),
-                    "days_from_change": event_row['days_from_change']
-                })
-        else:
-            associations.append({
-                "change_point_date": cp_date,
-                "event_date": None,
-                "event": "No major recorded event",
-                "description": None,
-                "days_from_change": None
-            })
-    
-    return pd.DataFrame(associations)
+    # One row per match, plus a placeholder row for change points without any
+    rows_per_cp = np.maximum(counts, 1)
+    row_cp = np.repeat(np.arange(len(cp_dates)), rows_per_cp)
+    matched = np.repeat(counts > 0, rows_per_cp)
+    n_rows = len(row_cp)
+    
+    # Row positions into events_df, -1 for the placeholder rows
+    rows = np.full(n_rows, -1, dtype=np.int64)
+    rows[matched] = event_pos
+    
+    days = (index.keys[event_pos] - cp_keys[cp_ids]) // NS_PER_DAY
+    if matched.all():
+        days_from_change = days
+    else:
+        days_from_change = np.full(n_rows, np.nan)
+        days_from_change[matched] = days
+    
+    return pd.DataFrame({
+        "change_point_date": cp_dates.values[row_cp],
+        "event_date": index.dates.array.take(rows, allow_fill=True),
+        "event": _gather_column(events_df, 'Event', rows, NO_EVENT_LABEL, 'Unknown Event'),
+        "description": _gather_column(events_df, 'Description', rows, None, ''),
+        "days_from_change": days_from_change,
+    }, columns=ASSOCIATION_COLUMNS)
+
+
+def window_sensitivity(
+    change_points_df: pd.DataFrame,
+    events_df: Union[pd.DataFrame, EventIndex],
+    windows: Optional[Sequence[int]] = None
+) -> pd.DataFrame:
+    """
+    Match counts and nearest events for many window sizes at once.
+    
+    Match counts come from one batched binary search of every window's
+    bounds in the sorted event dates, and the nearest event
+    is looked up once for the widest window, so the cost is O(C W log E)
+    with no change points x events intermediate.
+    
+    Parameters:
+    -----------
+    change_points_df : pd.DataFrame
+        DataFrame with change point dates (must have 'change_date' column).
+    events_df : pd.DataFrame or EventIndex
+        DataFrame with event dates (must have 'Date' column), or an
+        ``EventIndex`` built from one.
+    windows : sequence of int, optional
+        Window sizes in days. Default is 7, 14, 30, 60 and 90.
+    
+    Returns:
+    --------
+    pd.DataFrame
+        One row per (window, change point), ordered by window then change
+        point, with window_days, change_point_date, match_count (events
+        within +/- window_days, as in ``associate_change_points_with_events``)
+        and nearest_event, nearest_event_date and days_from_change for the
+        nearest event in the window (ties go to the earliest row; NaN when
+        the window is empty). Use ``pivot`` on window_days and
+        change_point_date for a windows x change points table.
+    
+    Raises:
+    -------
+    ValueError
+        If a window is negative.
+    """
+    if windows is None:
+        windows = DEFAULT_SENSITIVITY_WINDOWS
+    windows = np.asarray(list(windows), dtype=np.int64)
+    if (windows < 0).any():
+        raise ValueError(f"windows must be non-negative, got {windows.tolist()}")
+    
+    if 'change_date' not in change_points_df.columns:
+        raise ValueError("change_points_df must contain a 'change_date' column")
+    
+    index = _as_event_index(events_df)
+    cp_dates = pd.DatetimeIndex(pd.to_datetime(change_points_df['change_date']))
+    cp_keys = _datetime_keys(cp_dates)
+    
+    n_cp = len(cp_keys)
+    
+    # (windows x change points) bounds by binary search on the sorted dates
+    spans = (windows * NS_PER_DAY)[:, None]
+    lo = np.searchsorted(index.sorted_keys, cp_keys[None, :] - spans, side='left')
+    hi = np.searchsorted(index.sorted_keys, cp_keys[None, :] + spans, side='right')
+    counts = np.maximum(hi - lo, 0)
+    
+    # Nearest event per change point, shared by every window containing it;
+    # any window with a match contains the nearest event of the widest one
+    widest = int(windows.max()) if len(windows) else 0
+    nearest, nearest_days = index.nearest_within_window(cp_dates, widest)
+    
+    matched = counts > 0
+    event_rows = np.where(matched, nearest[None, :], -1).ravel()
+    return pd.DataFrame({
+        "window_days": np.repeat(windows, n_cp),
+        "change_point_date": np.tile(cp_dates.values, len(windows)),
+        "match_count": counts.ravel(),
+        "nearest_event": _gather_column(index.events, 'Event', event_rows, None, 'Unknown Event'),
+        "nearest_event_date": index.dates.array.take(event_rows, allow_fill=True),
+        "days_from_change": np.where(matched, nearest_days[None, :], np.nan).ravel(),
+    })
+
 
+def associate_posterior_with_events(
+    tau_samples: np.ndarray,
+    returns_dates: pd.DatetimeIndex,
+    events_df: Union[pd.DataFrame, EventIndex],
+    window_days: int = 30,
+    config: Optional[EventMatchingConfig] = None
+) -> pd.DataFrame:
+    """
+    Posterior probability that the change point falls near each event.
+    
+    Instead of matching events against the point estimate of tau, the
+    posterior samples are collapsed into a probability mass over
+    ``returns_dates`` with a single ``bincount``. Its cumulative sum gives
+    the mass inside any date range by two lookups, so every event's window
+    is answered by binary search: O(S + (T + E) log T) for S samples, T
+    dates and E events, with no per-sample loop.
+    
+    Parameters:
+    -----------
+    tau_samples : np.ndarray
+        Posterior samples of the change point index (e.g. the flattened
+        ``trace.posterior['tau']`` values), as positions into ``returns_dates``.
+    returns_dates : pd.DatetimeIndex
+        Datetime index corresponding to the returns array the model was fit on.
+    events_df : pd.DataFrame or EventIndex
+        DataFrame with event dates (must have 'Date' column), or an
+        ``EventIndex`` built from one.
+    window_days : int, optional
+        Number of days before and after each event to count. Default is 30.
+    config : EventMatchingConfig, optional
+        Configuration object. If provided, window_days is taken from config.
+    
+    Returns:
+    --------
+    pd.DataFrame
+        One row per event in the original order, with event_date, event,
+        description and posterior_probability columns. Events with a
+        missing date get a NaN probability.
+    
+    Raises:
+    -------
+    ValueError
+        If tau_samples is empty or contains indices outside returns_dates.
+    """
+    if config is not None:
+        window_days = config.window_days
+    
+    tau_samples = np.asarray(tau_samples).ravel()
+    n_dates = len(returns_dates)
+    if len(tau_samples) == 0:
+        raise ValueError("tau_samples must not be empty")
+    if tau_samples.min() < 0 or tau_samples.max() >= n_dates:
+        raise ValueError(f"tau_samples must be indices into returns_dates (0 to {n_dates - 1})")
+    
+    index = _as_event_index(events_df)
+    
+    # Posterior mass on each date, then cumulative mass in date order
+    mass = np.bincount(tau_samples.astype(np.int64), minlength=n_dates) / len(tau_samples)
+    date_keys = _datetime_keys(returns_dates)
+    if not np.all(date_keys[1:] >= date_keys[:-1]):
+        order = np.argsort(date_keys, kind='stable')
+        date_keys, mass = date_keys[order], mass[order]
+    cumulative = np.r_[0.0, np.cumsum(mass)]
+    
+    # Window [event - w, event + w] contains the change date iff the change
+    # date's window contains the event, matching the point-estimate mode
+    valid = index.keys != np.iinfo(np.int64).min
+    span = int(window_days) * NS_PER_DAY
+    event_keys = index.keys[valid]
+    lo = np.searchsorted(date_keys, event_keys - span, side='left')
+    hi = np.searchsorted(date_keys, event_keys + span, side='right')
+    
+    probability = np.full(len(index.keys), np.nan)
+    probability[valid] = np.clip(cumulative[hi] - cumulative[lo], 0.0, 1.0)
+    
+    rows = np.arange(len(index.keys))
+    return pd.DataFrame({
+        "event_date": index.dates.values,
+        "event": _gather_column(index.events, 'Event', rows, NO_EVENT_LABEL, 'Unknown Event'),
+        "description": _gather_column(index.events, 'Description', rows, None, ''),
+        "posterior_probability": probability,
+    })
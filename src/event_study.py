@@ -0,0 +1,240 @@
+"""
+Event-study engine for abnormal and cumulative abnormal returns.
+
+Complements the model's ``mu_2 - mu_1`` impact with the classic event-study
+measures around every event: abnormal returns (ARs) against a constant-mean
+model fit on an estimation window, cumulative abnormal returns (CARs) over
+one or more event windows and their t-statistics. Returns around all events
+are gathered into an (events x offsets) matrix with a single indexed take,
+so every statistic is a column-wise array operation.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .constants import (
+    DEFAULT_ESTIMATION_WINDOW,
+    DEFAULT_EVENT_STUDY_WINDOWS,
+    MIN_ESTIMATION_OBSERVATIONS,
+)
+from .event_matching import _datetime_keys
+
+Window = Tuple[int, int]
+
+
+def _window_label(window: Window) -> str:
+    return f"[{window[0]:+d}, {window[1]:+d}]"
+
+
+def _validate_window(window: Window, name: str) -> Window:
+    start, end = int(window[0]), int(window[1])
+    if start > end:
+        raise ValueError(f"{name} start must not exceed its end, got {window}")
+    return start, end
+
+
+def event_day_positions(index: pd.DatetimeIndex, event_dates) -> np.ndarray:
+    """
+    Position of each event's day zero in a sorted DatetimeIndex.
+
+    Day zero is the first trading day on or after the event date. Events
+    after the last trading day or without a date get -1.
+    """
+    keys = _datetime_keys(index)
+    event_keys = _datetime_keys(event_dates)
+    positions = np.searchsorted(keys, event_keys, side='left')
+    invalid = (positions >= len(keys)) | (event_keys == np.iinfo(np.int64).min)
+    positions[invalid] = -1
+    return positions
+
+
+def _gather(values: np.ndarray, anchors: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """(events x offsets) matrix of ``values`` around each anchor, NaN outside."""
+    positions = anchors[:, None] + offsets[None, :]
+    valid = (anchors[:, None] >= 0) & (positions >= 0) & (positions < len(values))
+    return np.where(valid, values[np.clip(positions, 0, max(len(values) - 1, 0))], np.nan)
+
+
+def gather_event_returns(
+    returns: pd.Series,
+    event_dates,
+    start: int,
+    end: int
+) -> pd.DataFrame:
+    """
+    Returns from ``start`` to ``end`` trading days around each event.
+
+    Parameters:
+    -----------
+    returns : pd.Series
+        Returns series with a sorted DatetimeIndex (e.g. from ``calculate_returns``).
+    event_dates : array-like of datetimes
+        Event dates; day zero is the first trading day on or after each.
+    start, end : int
+        First and last offset in trading days (inclusive), e.g. -5 and 5.
+
+    Returns:
+    --------
+    pd.DataFrame
+        One row per event and one column per offset. Offsets that fall
+        outside the sample are NaN.
+    """
+    start, end = _validate_window((start, end), "window")
+    offsets = np.arange(start, end + 1)
+    anchors = event_day_positions(returns.index, event_dates)
+    return pd.DataFrame(
+        _gather(returns.to_numpy(dtype=np.float64), anchors, offsets),
+        columns=pd.Index(offsets, name='offset'),
+    )
+
+
+@dataclass
+class EventStudyResult:
+    """
+    Output of ``event_study``.
+
+    ``events`` holds each event's date, name, day-zero trading date and
+    estimation-window mean, standard deviation and observation count.
+    ``abnormal_returns`` is an (events x offsets) frame covering every event
+    window; ``car`` and ``t_stats`` have one column per event window.
+    """
+
+    events: pd.DataFrame
+    abnormal_returns: pd.DataFrame
+    car: pd.DataFrame
+    t_stats: pd.DataFrame
+
+    def summary(self) -> pd.DataFrame:
+        """
+        Cross-sectional statistics per event window.
+
+        Returns:
+        --------
+        pd.DataFrame
+            One row per window with n_events (events with a complete CAR),
+            mean_car, car_std and the cross-sectional t_stat of the mean CAR.
+        """
+        n_events = self.car.notna().sum()
+        mean_car = self.car.mean()
+        car_std = self.car.std()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_stat = mean_car / (car_std / np.sqrt(n_events))
+        return pd.DataFrame({
+            'n_events': n_events,
+            'mean_car': mean_car,
+            'car_std': car_std,
+            't_stat': t_stat,
+        })
+
+
+def event_study(
+    returns: pd.Series,
+    events_df: pd.DataFrame,
+    event_windows: Optional[Sequence[Window]] = None,
+    estimation_window: Optional[Window] = None,
+    min_estimation_obs: int = MIN_ESTIMATION_OBSERVATIONS
+) -> EventStudyResult:
+    """
+    Abnormal returns, CARs and t-statistics around every event.
+
+    Uses the constant-mean return model: an event's abnormal return is its
+    return minus the mean return over the estimation window, and the CAR
+    t-statistic is ``CAR / (sigma * sqrt(L))`` with sigma the estimation
+    window standard deviation and L the event window length. Returns over
+    the union of all windows are gathered once; each CAR is then a row sum
+    over a column slice, so several window specifications cost one pass.
+
+    Parameters:
+    -----------
+    returns : pd.Series
+        Returns series with DatetimeIndex (e.g. from ``calculate_returns``).
+    events_df : pd.DataFrame
+        DataFrame with event dates (must have 'Date' column).
+    event_windows : sequence of (int, int), optional
+        Event windows as inclusive trading-day offsets around day zero.
+        Default is (-1, 1), (-5, 5) and (-10, 10).
+    estimation_window : (int, int), optional
+        Estimation window offsets; must end before every event window
+        starts. Default is (-250, -11).
+    min_estimation_obs : int, optional
+        Events with fewer estimation returns get NaN statistics. Default is 30.
+
+    Returns:
+    --------
+    EventStudyResult
+        Per-event estimation statistics, abnormal returns, CARs and t-stats.
+        CARs are NaN when any return in the window is unavailable.
+
+    Raises:
+    -------
+    ValueError
+        If 'Date' is missing, a window is empty, or the estimation window
+        overlaps an event window.
+    """
+    if 'Date' not in events_df.columns:
+        raise ValueError("events_df must contain a 'Date' column")
+    if event_windows is None:
+        event_windows = DEFAULT_EVENT_STUDY_WINDOWS
+    if estimation_window is None:
+        estimation_window = DEFAULT_ESTIMATION_WINDOW
+
+    windows = [_validate_window(window, "event window") for window in event_windows]
+    if not windows:
+        raise ValueError("event_windows must contain at least one window")
+    est_start, est_end = _validate_window(estimation_window, "estimation window")
+    first = min(start for start, _ in windows)
+    last = max(end for _, end in windows)
+    if est_end >= first:
+        raise ValueError(
+            f"estimation window must end before the event windows start ({first}), got {estimation_window}"
+        )
+
+    if not returns.index.is_monotonic_increasing:
+        returns = returns.sort_index()
+    values = returns.to_numpy(dtype=np.float64)
+    event_dates = pd.to_datetime(events_df['Date'])
+    anchors = event_day_positions(returns.index, event_dates)
+
+    # Constant-mean model on the estimation window
+    estimation = _gather(values, anchors, np.arange(est_start, est_end + 1))
+    observed = ~np.isnan(estimation)
+    n_obs = observed.sum(axis=1)
+    enough = n_obs >= max(int(min_estimation_obs), 2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = np.where(observed, estimation, 0.0).sum(axis=1) / n_obs
+        deviations = np.where(observed, estimation - mean[:, None], 0.0)
+        std = np.sqrt((deviations ** 2).sum(axis=1) / (n_obs - 1))
+    mean[~enough] = np.nan
+    std[~enough] = np.nan
+
+    offsets = np.arange(first, last + 1)
+    abnormal = _gather(values, anchors, offsets) - mean[:, None]
+
+    labels = [_window_label(window) for window in windows]
+    car = np.empty((len(anchors), len(windows)))
+    for j, (start, end) in enumerate(windows):
+        car[:, j] = abnormal[:, start - first:end - first + 1].sum(axis=1)
+    lengths = np.array([end - start + 1 for start, end in windows], dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_stats = car / (std[:, None] * np.sqrt(lengths)[None, :])
+
+    index = events_df.index
+    events = pd.DataFrame({
+        'event_date': event_dates.to_numpy(),
+        'event': events_df['Event'].to_numpy() if 'Event' in events_df.columns else 'Unknown Event',
+        'day_zero': pd.DatetimeIndex(returns.index).array.take(anchors, allow_fill=True),
+        'estimation_mean': mean,
+        'estimation_std': std,
+        'estimation_obs': n_obs,
+    }, index=index)
+
+    columns = pd.Index(labels, name='window')
+    return EventStudyResult(
+        events=events,
+        abnormal_returns=pd.DataFrame(abnormal, index=index, columns=pd.Index(offsets, name='offset')),
+        car=pd.DataFrame(car, index=index, columns=columns),
+        t_stats=pd.DataFrame(t_stats, index=index, columns=columns),
+    )
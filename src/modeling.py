@@ -5,7 +5,7 @@ This module provides functions for building and running Bayesian
 change point models using PyMC.
 """
 
-from typing import Dict, Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
 
 import arviz as az
 import numpy as np
@@ -70,7 +70,8 @@ def build_change_point_model(
 def run_mcmc_sampling(
     model: pm.Model,
     config: Optional[BayesianModelConfig] = None,
-    progressbar: bool = True
+    progressbar: bool = True,
+    callback: Optional[Callable] = None
 ) -> az.InferenceData:
     """
     Run MCMC sampling for the change point model.
@@ -83,6 +84,10 @@ def run_mcmc_sampling(
         Configuration object. If None, uses default BayesianModelConfig.
     progressbar : bool, optional
         Whether to show progress bar. Default is True.
+    callback : callable, optional
+        Passed to ``pm.sample``; called as ``callback(trace=..., draw=...)``
+        after every draw (e.g. to report progress). An exception raised by
+        the callback aborts sampling.
     
     Returns:
     --------
@@ -98,7 +103,8 @@ def run_mcmc_sampling(
             tune=config.tune,
             return_inferencedata=True,
             random_seed=config.random_seed,
-            progressbar=progressbar
+            progressbar=progressbar,
+            callback=callback
         )
     
     return trace
@@ -132,6 +138,8 @@ def extract_change_point_results(
         - sigma: float (volatility)
         - impact: float (mu_2 - mu_1)
         - impact_pct: float (impact as percentage)
+        - tau_samples: np.ndarray (posterior draws of the change point index,
+          for ``associate_posterior_with_events``)
     """
     if config is None:
         config = BayesianModelConfig()
@@ -163,7 +171,8 @@ def extract_change_point_results(
         'mu_2': mu2_mean,
         'sigma': sigma_mean,
         'impact': impact,
-        'impact_pct': impact_pct
+        'impact_pct': impact_pct,
+        'tau_samples': tau_samples
     }
 
 
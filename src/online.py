@@ -0,0 +1,232 @@
+"""
+Online rolling statistics for streaming price updates.
+
+This module provides stateful estimators that update rolling means and
+volatilities in O(1) per new observation, so appending a daily price does
+not require recomputing the full history. Results match the batch
+``calculate_rolling_mean`` / ``calculate_rolling_volatility`` functions.
+"""
+
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class RollingWindowStatistics:
+    """
+    Rolling mean and sample standard deviation over a fixed-size window.
+
+    Only the window ring buffer and the running Welford moments (count,
+    mean, sum of squared deviations) are held. Each update removes the
+    observation leaving the window and adds the new one, which keeps the
+    moments numerically stable; the moments are additionally recomputed
+    from the buffer once per ``window`` updates so that rounding error
+    cannot accumulate over long streams (amortized O(1)).
+
+    NaN observations follow pandas ``rolling(window)`` semantics: any window
+    that contains a NaN yields NaN.
+
+    Parameters:
+    -----------
+    window : int
+        Rolling window size in observations.
+    """
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError(f"window must be a positive integer, got {window}")
+
+        self.window = int(window)
+        self._buffer = np.full(self.window, np.nan)
+        self._head = 0
+        self._seen = 0
+        self._nan_count = 0
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._since_resync = 0
+
+    @classmethod
+    def from_series(cls, values: Iterable[float], window: int) -> "RollingWindowStatistics":
+        """
+        Create an estimator warmed up on historical values.
+
+        Only the last ``window`` values are needed to reproduce the state, so
+        this costs O(window) regardless of history length.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        estimator = cls(window)
+        tail = values[-estimator.window:]
+        for value in tail:
+            estimator.update(value)
+        estimator._seen += len(values) - len(tail)
+        return estimator
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the window is full and contains no NaN."""
+        return self._seen >= self.window and self._nan_count == 0
+
+    @property
+    def mean(self) -> float:
+        """Current rolling mean (NaN until the window is full)."""
+        if not self.is_ready:
+            return np.nan
+        return self._mean
+
+    @property
+    def std(self) -> float:
+        """Current rolling sample standard deviation (ddof=1)."""
+        if not self.is_ready or self.window < 2:
+            return np.nan
+        return float(np.sqrt(max(self._m2, 0.0) / (self.window - 1)))
+
+    @property
+    def value(self) -> float:
+        """The statistic the estimator tracks; the rolling mean here."""
+        return self.mean
+
+    def _add(self, value: float) -> None:
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+
+    def _remove(self, value: float) -> None:
+        self._count -= 1
+        if self._count == 0:
+            self._mean = 0.0
+            self._m2 = 0.0
+            return
+        delta = value - self._mean
+        self._mean -= delta / self._count
+        self._m2 -= delta * (value - self._mean)
+
+    def _resync(self) -> None:
+        finite = self._buffer[np.isfinite(self._buffer)]
+        self._count = len(finite)
+        self._mean = float(finite.mean()) if self._count else 0.0
+        self._m2 = float(((finite - self._mean) ** 2).sum()) if self._count else 0.0
+        self._since_resync = 0
+
+    def update(self, value: float) -> "RollingWindowStatistics":
+        """
+        Add one observation, evicting the oldest one once the window is full.
+
+        Returns the estimator itself so calls can be chained.
+        """
+        value = float(value)
+
+        if self._seen >= self.window:
+            old = self._buffer[self._head]
+            if np.isnan(old):
+                self._nan_count -= 1
+            else:
+                self._remove(old)
+
+        self._buffer[self._head] = value
+        self._head = (self._head + 1) % self.window
+        self._seen += 1
+
+        if np.isnan(value):
+            self._nan_count += 1
+        else:
+            self._add(value)
+
+        self._since_resync += 1
+        if self._since_resync >= self.window:
+            self._resync()
+
+        return self
+
+    def update_many(self, values: Iterable[float]) -> pd.DataFrame:
+        """
+        Add several observations and return the rolling mean/std after each.
+
+        Returns:
+        --------
+        pd.DataFrame
+            DataFrame with 'mean' and 'std' columns, one row per value.
+        """
+        means = []
+        stds = []
+        for value in values:
+            self.update(value)
+            means.append(self.mean)
+            stds.append(self.std)
+        return pd.DataFrame({'mean': means, 'std': stds})
+
+    def to_dict(self) -> Dict:
+        """Serialize the estimator state to a JSON-friendly dictionary."""
+        # Store the buffer oldest-first so the state does not depend on _head
+        ordered = np.roll(self._buffer, -self._head)
+        filled = min(self._seen, self.window)
+        return {
+            'type': type(self).__name__,
+            'window': self.window,
+            'seen': self._seen,
+            'values': [None if np.isnan(v) else float(v) for v in ordered[self.window - filled:]],
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict) -> "RollingWindowStatistics":
+        """Restore an estimator serialized with ``to_dict``."""
+        values = [np.nan if v is None else v for v in state['values']]
+        estimator = cls.from_series(values, state['window'])
+        estimator._seen = int(state['seen'])
+        return estimator
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(window={self.window}, mean={self.mean}, std={self.std})"
+
+
+class OnlineRollingMean(RollingWindowStatistics):
+    """
+    Incremental counterpart of ``calculate_rolling_mean``.
+
+    ``value`` is the rolling mean, e.g. ``estimator.update(x).value``.
+    """
+
+
+class OnlineRollingVolatility(RollingWindowStatistics):
+    """
+    Incremental counterpart of ``calculate_rolling_volatility``.
+
+    Feed returns (not prices); ``value`` is the rolling standard deviation,
+    e.g. ``estimator.update(r).value``. Use ``update_price`` to feed prices
+    directly and have log returns computed on the fly.
+    """
+
+    def __init__(self, window: int, last_price: Optional[float] = None):
+        super().__init__(window)
+        self.last_price = last_price
+
+    @property
+    def value(self) -> float:
+        """The rolling standard deviation."""
+        return self.std
+
+    def update_price(self, price: float) -> "OnlineRollingVolatility":
+        """
+        Add a new price, computing its log return against the previous one.
+
+        The first price only primes the estimator. Returns the estimator
+        itself, like ``update``.
+        """
+        price = float(price)
+        previous, self.last_price = self.last_price, price
+        if previous is None:
+            return self
+        return self.update(np.log(price / previous))
+
+    def to_dict(self) -> Dict:
+        state = super().to_dict()
+        state['last_price'] = self.last_price
+        return state
+
+    @classmethod
+    def from_dict(cls, state: Dict) -> "OnlineRollingVolatility":
+        estimator = super().from_dict(state)
+        estimator.last_price = state.get('last_price')
+        return estimator
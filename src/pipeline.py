@@ -0,0 +1,312 @@
+"""
+Memoized end-to-end analysis pipeline driven by ProjectConfig.
+
+This module chains the analysis stages (load -> returns -> model ->
+extract -> associate) as a small DAG. Every stage is keyed by a hash of its
+config section and the keys of its dependencies (plus the content of any
+input files), its output is persisted under that key, and a rerun only
+executes the stages whose inputs changed.
+"""
+
+import dataclasses
+import hashlib
+import os
+import pickle
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .config import ProjectConfig
+from .constants import PIPELINE_CACHE_DIR
+from .data_loader import load_brent_data, load_events_data
+from .event_matching import associate_change_points_with_events
+from .preprocessing import calculate_returns
+
+STATUS_EXECUTED = "executed"
+STATUS_CACHED = "cached"
+
+
+@dataclass
+class Stage:
+    """
+    A single pipeline node.
+
+    ``func`` is called as ``func(config_section, *dependency_outputs)``.
+    ``config_section`` names the attribute of ``ProjectConfig`` that
+    parameterizes the stage (None for stages without configuration) and
+    ``input_files`` returns paths whose content is hashed into the key.
+    """
+
+    name: str
+    func: Callable[..., Any]
+    deps: Tuple[str, ...] = ()
+    config_section: Optional[str] = None
+    input_files: Optional[Callable[[ProjectConfig], Sequence[Path]]] = None
+
+
+@dataclass
+class PipelineResult:
+    """Outputs, keys and per-stage timings of a pipeline run."""
+
+    outputs: Dict[str, Any] = field(default_factory=dict)
+    keys: Dict[str, str] = field(default_factory=dict)
+    status: Dict[str, str] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def executed(self) -> List[str]:
+        """Stages that were recomputed in this run."""
+        return [name for name, status in self.status.items() if status == STATUS_EXECUTED]
+
+    def summary(self) -> pd.DataFrame:
+        """Per-stage status, wall time in seconds and cache key."""
+        return pd.DataFrame({
+            'status': pd.Series(self.status),
+            'seconds': pd.Series(self.timings),
+            'key': pd.Series(self.keys),
+        })
+
+    def __getitem__(self, name: str) -> Any:
+        return self.outputs[name]
+
+
+def _load_stage(data_config) -> Dict[str, pd.DataFrame]:
+    return {
+        'prices': load_brent_data(config=data_config),
+        'events': load_events_data(config=data_config),
+    }
+
+
+def _returns_stage(preprocessing_config, loaded) -> pd.Series:
+    return calculate_returns(loaded['prices'], config=preprocessing_config)
+
+
+def _model_stage(model_config, returns):
+    # Imported here so that building a pipeline does not import PyMC
+    from .modeling import build_change_point_model, run_mcmc_sampling
+
+    model = build_change_point_model(returns.values, config=model_config)
+    return run_mcmc_sampling(model, config=model_config, progressbar=False)
+
+
+def _extract_stage(model_config, trace, returns) -> Dict:
+    from .modeling import extract_change_point_results
+
+    return extract_change_point_results(trace, returns.index, config=model_config)
+
+
+def _associate_stage(event_matching_config, results, loaded) -> pd.DataFrame:
+    change_points = pd.DataFrame({'change_date': [results['change_point_date']]})
+    return associate_change_points_with_events(
+        change_points, loaded['events'], config=event_matching_config
+    )
+
+
+def _data_files(config: ProjectConfig) -> List[Path]:
+    return [config.data.brent_oil_prices_path, config.data.key_events_path]
+
+
+def default_stages() -> List[Stage]:
+    """The standard load -> returns -> model -> extract -> associate stages."""
+    return [
+        Stage('load', _load_stage, (), 'data', _data_files),
+        Stage('returns', _returns_stage, ('load',), 'preprocessing'),
+        Stage('model', _model_stage, ('returns',), 'model'),
+        Stage('extract', _extract_stage, ('model', 'returns'), 'model'),
+        Stage('associate', _associate_stage, ('extract', 'load'), 'event_matching'),
+    ]
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _config_repr(section: Any) -> str:
+    if dataclasses.is_dataclass(section):
+        section = dataclasses.asdict(section)
+    return repr(sorted(section.items()) if isinstance(section, dict) else section)
+
+
+class Pipeline:
+    """
+    Memoized DAG runner for the analysis stages.
+
+    Parameters:
+    -----------
+    config : ProjectConfig, optional
+        Project configuration. If None, uses default ProjectConfig.
+    cache_dir : Path, optional
+        Directory where stage outputs are persisted. Default is
+        ``PIPELINE_CACHE_DIR``. Pass ``persist=False`` to keep outputs in
+        memory only.
+    stages : list of Stage, optional
+        Stages in dependency order. Default is ``default_stages()``.
+    persist : bool, optional
+        Whether to write stage outputs to ``cache_dir``. Default is True.
+    """
+
+    def __init__(
+        self,
+        config: Optional[ProjectConfig] = None,
+        cache_dir: Optional[Path] = None,
+        stages: Optional[Sequence[Stage]] = None,
+        persist: bool = True
+    ):
+        self.config = config if config is not None else ProjectConfig()
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else PIPELINE_CACHE_DIR
+        self.persist = persist
+        self._stages: Dict[str, Stage] = {}
+        self._memory: Dict[str, Any] = {}
+
+        for stage in (stages if stages is not None else default_stages()):
+            self.add_stage(stage)
+
+    @property
+    def stages(self) -> List[str]:
+        """Stage names in execution order."""
+        return list(self._stages)
+
+    def add_stage(self, stage: Stage) -> None:
+        """Append a stage; its dependencies must already be registered."""
+        missing = [dep for dep in stage.deps if dep not in self._stages]
+        if missing:
+            raise ValueError(f"stage '{stage.name}' depends on unknown stages {missing}")
+        self._stages[stage.name] = stage
+
+    def replace_stage(self, name: str, **changes) -> None:
+        """Replace fields of a registered stage (e.g. its ``func``)."""
+        if name not in self._stages:
+            raise ValueError(f"unknown stage '{name}'")
+        self._stages[name] = dataclasses.replace(self._stages[name], **changes)
+
+    def _stage_key(self, stage: Stage, dep_keys: Sequence[str]) -> str:
+        digest = hashlib.sha256()
+        digest.update(stage.name.encode())
+        digest.update(getattr(stage.func, '__qualname__', repr(stage.func)).encode())
+        if stage.config_section is not None:
+            digest.update(_config_repr(getattr(self.config, stage.config_section)).encode())
+        if stage.input_files is not None:
+            for path in stage.input_files(self.config):
+                path = Path(path)
+                digest.update(str(path).encode())
+                digest.update(_hash_file(path).encode() if path.exists() else b'<missing>')
+        for key in dep_keys:
+            digest.update(key.encode())
+        return digest.hexdigest()[:24]
+
+    def _cache_path(self, name: str, key: str) -> Path:
+        return self.cache_dir / f"{name}-{key}.pkl"
+
+    def _lookup(self, name: str, key: str) -> Tuple[bool, Any]:
+        if key in self._memory:
+            return True, self._memory[key]
+        path = self._cache_path(name, key)
+        if self.persist and path.exists():
+            with open(path, 'rb') as f:
+                output = pickle.load(f)
+            self._memory[key] = output
+            return True, output
+        return False, None
+
+    def _store(self, name: str, key: str, output: Any) -> None:
+        self._memory[key] = output
+        if not self.persist:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._cache_path(name, key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(output, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def _required(self, targets: Optional[Sequence[str]]) -> List[str]:
+        if targets is None:
+            return self.stages
+        needed = set()
+        stack = list(targets)
+        while stack:
+            name = stack.pop()
+            if name not in self._stages:
+                raise ValueError(f"unknown stage '{name}'")
+            if name not in needed:
+                needed.add(name)
+                stack.extend(self._stages[name].deps)
+        return [name for name in self._stages if name in needed]
+
+    def run(self, targets: Optional[Sequence[str]] = None, force: Sequence[str] = ()) -> PipelineResult:
+        """
+        Run the pipeline, reusing every stage whose key is already cached.
+
+        Parameters:
+        -----------
+        targets : sequence of str, optional
+            Stages to produce; their dependencies are included. Default is
+            every stage.
+        force : sequence of str, optional
+            Stages to recompute even if cached.
+
+        Returns:
+        --------
+        PipelineResult
+            Outputs, cache keys, status ('executed' or 'cached') and wall
+            time in seconds for each stage that was needed.
+        """
+        result = PipelineResult()
+
+        for name in self._required(targets):
+            stage = self._stages[name]
+            start = time.perf_counter()
+            key = self._stage_key(stage, [result.keys[dep] for dep in stage.deps])
+
+            found, output = (False, None) if name in force else self._lookup(name, key)
+            if not found:
+                section = getattr(self.config, stage.config_section) if stage.config_section else None
+                output = stage.func(section, *(result.outputs[dep] for dep in stage.deps))
+                self._store(name, key, output)
+
+            result.outputs[name] = output
+            result.keys[name] = key
+            result.status[name] = STATUS_CACHED if found else STATUS_EXECUTED
+            result.timings[name] = time.perf_counter() - start
+
+        return result
+
+    def clear_cache(self) -> None:
+        """Drop in-memory outputs and delete persisted stage outputs."""
+        self._memory.clear()
+        if self.cache_dir.exists():
+            for name in self._stages:
+                for path in self.cache_dir.glob(f"{name}-*.pkl"):
+                    path.unlink()
+
+
+def run_pipeline(
+    config: Optional[ProjectConfig] = None,
+    cache_dir: Optional[Path] = None,
+    targets: Optional[Sequence[str]] = None
+) -> PipelineResult:
+    """
+    Run the default analysis pipeline with memoization.
+
+    Parameters:
+    -----------
+    config : ProjectConfig, optional
+        Project configuration. If None, uses default ProjectConfig.
+    cache_dir : Path, optional
+        Directory for persisted stage outputs. Default is ``PIPELINE_CACHE_DIR``.
+    targets : sequence of str, optional
+        Stages to produce. Default is every stage.
+
+    Returns:
+    --------
+    PipelineResult
+        Stage outputs and per-stage timings.
+    """
+    return Pipeline(config, cache_dir=cache_dir).run(targets)
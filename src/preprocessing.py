@@ -5,13 +5,19 @@ This module provides functions for calculating returns, volatility,
 and other preprocessing steps.
 """
 
-from typing import Literal
+from typing import Literal, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 
 from .config import PreprocessingConfig
-from .constants import RETURN_METHOD_LOG, RETURN_METHOD_SIMPLE, VALID_RETURN_METHODS
+from .constants import (
+    DEFAULT_ROLLING_WINDOW,
+    RETURN_METHOD_LOG,
+    RETURN_METHOD_SIMPLE,
+    TRADING_DAYS_PER_YEAR,
+    VALID_RETURN_METHODS,
+)
 
 
 def calculate_returns(
@@ -106,3 +112,225 @@ def calculate_rolling_mean(
     """
     return prices.rolling(window=window).mean()
 
+
+
+def _prefix_sums(values: np.ndarray) -> Tuple[float, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Zero-padded prefix sums used to evaluate any rolling window in O(1).
+    
+    Values are centred on their mean before accumulation so that the
+    sum-of-squares variance formula does not lose precision on price-level
+    data. Non-finite values contribute zero and are tracked in a separate
+    count so that windows containing them can be masked like pandas does.
+    
+    Returns:
+    --------
+    Tuple[float, np.ndarray, np.ndarray, np.ndarray]
+        (shift, sums, sums of squares, invalid counts), each array of length n + 1.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    invalid = ~np.isfinite(values)
+    shift = float(values[~invalid].mean()) if (~invalid).any() else 0.0
+    
+    centered = np.where(invalid, 0.0, values - shift)
+    n = len(values)
+    sums = np.zeros(n + 1)
+    np.cumsum(centered, out=sums[1:])
+    np.square(centered, out=centered)
+    sums_sq = np.zeros(n + 1)
+    np.cumsum(centered, out=sums_sq[1:])
+    invalid_counts = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(invalid, out=invalid_counts[1:])
+    
+    return shift, sums, sums_sq, invalid_counts
+
+
+def _rolling_moments_into(
+    prefix: Tuple[float, np.ndarray, np.ndarray, np.ndarray],
+    window: int,
+    mean_out: Optional[np.ndarray] = None,
+    std_out: Optional[np.ndarray] = None,
+    scratch: Optional[np.ndarray] = None
+) -> None:
+    """
+    Write the rolling mean and/or sample standard deviation for one window.
+    
+    Output arrays (typically column views of a larger block) are filled in
+    place and follow pandas ``rolling(window)`` semantics: the first
+    ``window - 1`` rows and any window containing a NaN are NaN, and the
+    standard deviation uses ``ddof=1``. ``scratch`` is an optional length-n
+    buffer that is reused instead of allocating a temporary.
+    """
+    if window < 1:
+        raise ValueError(f"window must be a positive integer, got {window}")
+    
+    shift, sums, sums_sq, invalid_counts = prefix
+    n = len(sums) - 1
+    outputs = [out for out in (mean_out, std_out) if out is not None]
+    
+    for out in outputs:
+        out[:min(window - 1, n)] = np.nan
+    if window > n:
+        return
+    
+    if scratch is None:
+        scratch = np.empty(n)
+    total = scratch[window - 1:]
+    np.subtract(sums[window:], sums[:-window], out=total)
+    has_invalid = invalid_counts[window:] != invalid_counts[:-window]
+    
+    if mean_out is not None:
+        mean = mean_out[window - 1:]
+        np.divide(total, window, out=mean)
+        mean += shift
+        mean[has_invalid] = np.nan
+    
+    if std_out is not None:
+        var = std_out[window - 1:]
+        if window < 2:
+            var[:] = np.nan
+        else:
+            # var = (sum_sq - sum**2 / w) / (w - 1), reusing the scratch buffer
+            np.subtract(sums_sq[window:], sums_sq[:-window], out=var)
+            np.multiply(total, total, out=total)
+            total /= window
+            var -= total
+            var /= window - 1
+            np.maximum(var, 0.0, out=var)
+            np.sqrt(var, out=var)
+            var[has_invalid] = np.nan
+
+
+def build_features(
+    df: pd.DataFrame,
+    windows: Optional[Sequence[int]] = None,
+    annualization_factor: int = TRADING_DAYS_PER_YEAR,
+    config: Optional[PreprocessingConfig] = None
+) -> pd.DataFrame:
+    """
+    Compute returns, rolling means and rolling volatilities in one pass.
+    
+    Equivalent to calling ``calculate_returns`` (log and simple),
+    ``calculate_rolling_mean`` and ``calculate_rolling_volatility`` for every
+    window, but ``np.log`` runs once and every rolling statistic is read off
+    shared prefix sums. All columns are written into a single preallocated
+    float64 block, which backs the returned DataFrame without a copy.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        DataFrame with Price column.
+    windows : sequence of int, optional
+        Rolling window sizes in days. Defaults to ``config.rolling_window``
+        or the project default rolling window.
+    annualization_factor : int, optional
+        Periods per year used to annualize. Default is 252 trading days.
+    config : PreprocessingConfig, optional
+        Configuration object. Supplies the default window.
+    
+    Returns:
+    --------
+    pd.DataFrame
+        Frame aligned with ``df.index`` (returns are NaN on the first row) with
+        columns ``Price``, ``log_return``, ``simple_return`` and, for each
+        window ``w``: ``price_mean_{w}``, ``return_mean_{w}_annualized``,
+        ``volatility_{w}`` and ``volatility_{w}_annualized``. Volatilities are
+        computed from log returns.
+    
+    Raises:
+    -------
+    ValueError
+        If Price column is missing or a window is not positive.
+    """
+    if 'Price' not in df.columns:
+        raise ValueError("DataFrame must contain a 'Price' column")
+    
+    if windows is None:
+        windows = (config.rolling_window if config is not None else DEFAULT_ROLLING_WINDOW,)
+    windows = [int(w) for w in windows]
+    if any(w < 1 for w in windows):
+        raise ValueError(f"windows must be positive integers, got {windows}")
+    
+    columns = ['Price', 'log_return', 'simple_return']
+    for w in windows:
+        columns += [
+            f'price_mean_{w}',
+            f'return_mean_{w}_annualized',
+            f'volatility_{w}',
+            f'volatility_{w}_annualized',
+        ]
+    
+    n = len(df)
+    block = np.empty((n, len(columns)), dtype=np.float64)
+    price, log_return, simple_return = block[:, 0], block[:, 1], block[:, 2]
+    price[:] = df['Price'].to_numpy(dtype=np.float64)
+    
+    log_price = np.log(price)
+    log_return[:1] = np.nan
+    np.subtract(log_price[1:], log_price[:-1], out=log_return[1:])
+    simple_return[:1] = np.nan
+    np.divide(price[1:], price[:-1], out=simple_return[1:])
+    simple_return[1:] -= 1.0
+    
+    price_prefix = _prefix_sums(price)
+    return_prefix = _prefix_sums(log_return)
+    scratch = np.empty(n)
+    sqrt_factor = np.sqrt(annualization_factor)
+    
+    for i, w in enumerate(windows):
+        base = 3 + 4 * i
+        price_mean, return_mean, vol, vol_annual = (block[:, base + j] for j in range(4))
+        _rolling_moments_into(price_prefix, w, mean_out=price_mean, scratch=scratch)
+        _rolling_moments_into(return_prefix, w, mean_out=return_mean, std_out=vol, scratch=scratch)
+        return_mean *= annualization_factor
+        np.multiply(vol, sqrt_factor, out=vol_annual)
+    
+    return pd.DataFrame(block, index=df.index, columns=columns, copy=False)
+
+
+def calculate_multi_window_volatility(
+    returns: pd.Series,
+    windows: Sequence[int]
+) -> pd.DataFrame:
+    """
+    Calculate rolling volatility for several window sizes at once.
+    
+    Equivalent to calling ``calculate_rolling_volatility`` once per window,
+    but all windows are read off a single pair of cumulative-sum /
+    cumulative-square arrays and written straight into one 2-D output, so
+    no per-window Series or temporaries are allocated.
+    
+    Parameters:
+    -----------
+    returns : pd.Series
+        Returns series.
+    windows : sequence of int
+        Rolling window sizes in days, e.g. [5, 10, 21, 30, 63, 126, 252].
+    
+    Returns:
+    --------
+    pd.DataFrame
+        Rolling volatility with one column per window (named by window size)
+        and the same index as ``returns``.
+    
+    Raises:
+    -------
+    ValueError
+        If no windows are given or a window is not positive.
+    """
+    windows = [int(w) for w in windows]
+    if not windows:
+        raise ValueError("windows must contain at least one window size")
+    if any(w < 1 for w in windows):
+        raise ValueError(f"windows must be positive integers, got {windows}")
+    
+    n = len(returns)
+    prefix = _prefix_sums(returns.to_numpy(dtype=np.float64))
+    # Fortran order keeps each window's column contiguous for the in-place ops
+    out = np.empty((n, len(windows)), dtype=np.float64, order='F')
+    scratch = np.empty(n)
+    
+    for i, w in enumerate(windows):
+        _rolling_moments_into(prefix, w, std_out=out[:, i], scratch=scratch)
+    
+    return pd.DataFrame(out, index=returns.index, columns=windows, copy=False)
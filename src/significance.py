@@ -0,0 +1,242 @@
+"""
+Monte Carlo significance test for change point / event alignment.
+
+With dozens of events and month-long windows, some change points will have
+events nearby purely by chance. This module compares the observed number of
+events in each change point's window (and their mean distance) against a
+null distribution built by randomly relocating the event dates, with every
+replicate evaluated as part of a batched binary search over sorted arrays.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .config import EventMatchingConfig
+from .constants import DEFAULT_RANDOM_SEED
+from .event_matching import NS_PER_DAY, EventIndex, _as_event_index, _datetime_keys
+
+VALID_NULL_METHODS: Tuple[str, ...] = ("shift", "uniform")
+
+# Replicates are processed in chunks of about this many simulated events
+_CHUNK_EVENTS = 1_000_000
+
+DateLike = Union[str, pd.Timestamp, None]
+
+
+def _window_statistics(
+    sorted_days: np.ndarray,
+    cp_days: np.ndarray,
+    span_length: int,
+    window_days: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Match counts and summed |days| for every (replicate, change point).
+
+    ``sorted_days`` is an (R, E) array of day offsets in [0, span_length),
+    sorted along each row. Rows are laid out on one number line, each
+    ``span_length + 2 * window_days + 1`` days apart so that no window can
+    reach a neighbouring row, which lets a single ``searchsorted`` on the
+    flattened array serve all replicates. Summed distances come from prefix
+    sums split at each change point.
+    """
+    n_rep = sorted_days.shape[0]
+    stride = span_length + 2 * window_days + 1
+    base = (np.arange(n_rep, dtype=np.int64) * stride)[:, None]
+    flat = (sorted_days + base).ravel()
+    prefix = np.r_[0, np.cumsum(flat)]
+
+    centre = base + cp_days[None, :]
+    lo = np.searchsorted(flat, centre - window_days, side='left')
+    mid = np.searchsorted(flat, centre, side='left')
+    hi = np.searchsorted(flat, centre + window_days, side='right')
+
+    counts = hi - lo
+    abs_days = (
+        centre * (mid - lo) - (prefix[mid] - prefix[lo])
+        + (prefix[hi] - prefix[mid]) - centre * (hi - mid)
+    )
+    return counts, abs_days
+
+
+def _mean_abs_days(counts: np.ndarray, abs_days: np.ndarray) -> np.ndarray:
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(counts > 0, abs_days / np.maximum(counts, 1), np.inf)
+
+
+def _run_replicate_chunk(
+    event_days: np.ndarray,
+    cp_days: np.ndarray,
+    span_length: int,
+    window_days: int,
+    method: str,
+    n_replicates: int,
+    seed: np.random.SeedSequence,
+    observed_counts: np.ndarray,
+    observed_mean_abs: np.ndarray
+) -> np.ndarray:
+    """
+    Simulate ``n_replicates`` null event sets and tally them.
+
+    Returns a (3, C) array: per change point, the number of replicates with
+    at least the observed match count, the number with a mean |days| at most
+    the observed one, and the summed null match counts. Module-level so it
+    can be dispatched to worker processes.
+    """
+    rng = np.random.default_rng(seed)
+    n_events = len(event_days)
+
+    if method == 'shift':
+        offsets = rng.integers(0, span_length, size=(n_replicates, 1))
+        null_days = (event_days[None, :] + offsets) % span_length
+    else:
+        null_days = rng.integers(0, span_length, size=(n_replicates, n_events))
+    null_days.sort(axis=1)
+
+    counts, abs_days = _window_statistics(null_days, cp_days, span_length, window_days)
+    mean_abs = _mean_abs_days(counts, abs_days)
+    return np.vstack([
+        (counts >= observed_counts[None, :]).sum(axis=0),
+        (mean_abs <= observed_mean_abs[None, :]).sum(axis=0),
+        counts.sum(axis=0),
+    ])
+
+
+def event_alignment_test(
+    change_points_df: pd.DataFrame,
+    events_df: Union[pd.DataFrame, EventIndex],
+    window_days: int = 30,
+    n_replicates: int = 10_000,
+    method: str = "shift",
+    start: DateLike = None,
+    end: DateLike = None,
+    random_seed: int = DEFAULT_RANDOM_SEED,
+    max_workers: Optional[int] = 1,
+    config: Optional[EventMatchingConfig] = None
+) -> pd.DataFrame:
+    """
+    Test whether events cluster around each change point more than by chance.
+
+    The observed statistics are those of ``associate_change_points_with_events``:
+    the number of events within +/- window_days of the change point and
+    their mean absolute ``days_from_change``. The null distribution relocates
+    the event dates inside the study period [start, end]:
+
+    - 'shift': all events move by one common random offset, wrapping around
+      the period, which preserves their spacing and clustering.
+    - 'uniform': every event is placed on an independent uniformly random day.
+
+    Replicates are generated as (replicates x events) day arrays, sorted
+    row-wise and evaluated with one batched binary search, in chunks that
+    may be spread across processes.
+
+    Parameters:
+    -----------
+    change_points_df : pd.DataFrame
+        DataFrame with change point dates (must have 'change_date' column).
+    events_df : pd.DataFrame or EventIndex
+        DataFrame with event dates (must have 'Date' column), or an
+        ``EventIndex`` built from one. Events without a date are ignored.
+    window_days : int, optional
+        Number of days before and after change point to search. Default is 30.
+    n_replicates : int, optional
+        Number of null replicates. Default is 10,000.
+    method : str, optional
+        Null model, 'shift' or 'uniform'. Default is 'shift'.
+    start, end : str or pd.Timestamp, optional
+        Study period the events are relocated within (e.g. the first and
+        last price dates). Default is the range spanned by the events and
+        change points.
+    random_seed : int, optional
+        Seed for the replicates. Results do not depend on max_workers.
+    max_workers : int, optional
+        Number of worker processes. Default is 1 (in-process); None uses
+        all CPUs.
+    config : EventMatchingConfig, optional
+        Configuration object. If provided, window_days is taken from config.
+
+    Returns:
+    --------
+    pd.DataFrame
+        One row per change point with change_point_date, observed_matches,
+        observed_mean_abs_days, null_mean_matches, count_p_value (chance of
+        at least as many matches) and days_p_value (chance of a mean
+        distance at most as small). P-values use the (1 + k) / (1 + n)
+        Monte Carlo estimate; days_p_value is 1.0 without observed matches.
+
+    Raises:
+    -------
+    ValueError
+        If the method or replicate count is invalid, there are no dated
+        events, or change points fall outside [start, end].
+    """
+    if config is not None:
+        window_days = config.window_days
+
+    if method not in VALID_NULL_METHODS:
+        raise ValueError(f"method must be one of {VALID_NULL_METHODS}, got {method}")
+    if n_replicates < 1:
+        raise ValueError(f"n_replicates must be a positive integer, got {n_replicates}")
+    if 'change_date' not in change_points_df.columns:
+        raise ValueError("change_points_df must contain a 'change_date' column")
+
+    index = _as_event_index(events_df)
+    if len(index) == 0:
+        raise ValueError("events_df must contain at least one dated event")
+
+    cp_dates = pd.DatetimeIndex(pd.to_datetime(change_points_df['change_date']))
+    event_days = index.sorted_keys // NS_PER_DAY
+    cp_days = _datetime_keys(cp_dates) // NS_PER_DAY
+
+    # Without change points the period defaults to the events' range alone
+    bounds = np.concatenate([event_days[[0, -1]], cp_days])
+    first = bounds.min() if start is None else pd.Timestamp(start).value // NS_PER_DAY
+    last = bounds.max() if end is None else pd.Timestamp(end).value // NS_PER_DAY
+    if len(cp_days) and (cp_days.min() < first or cp_days.max() > last):
+        raise ValueError("change points must fall within [start, end]")
+    span_length = int(last - first) + 1
+    window_days = int(window_days)
+
+    event_days = event_days - first
+    cp_days = cp_days - first
+
+    counts, abs_days = _window_statistics(event_days[None, :], cp_days, span_length, window_days)
+    observed_counts = counts[0]
+    observed_mean_abs = _mean_abs_days(counts, abs_days)[0]
+
+    # Null replicates live on [0, span_length); events outside the period wrap in
+    event_days = np.sort(event_days % span_length)
+
+    chunk_size = max(1, _CHUNK_EVENTS // len(event_days))
+    sizes = [min(chunk_size, n_replicates - i) for i in range(0, n_replicates, chunk_size)]
+    seeds = np.random.SeedSequence(random_seed).spawn(len(sizes))
+    args = [
+        (event_days, cp_days, span_length, window_days, method, size, seed,
+         observed_counts, observed_mean_abs)
+        for size, seed in zip(sizes, seeds)
+    ]
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if max_workers <= 1 or len(args) < 2:
+        parts = [_run_replicate_chunk(*chunk_args) for chunk_args in args]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            parts = list(executor.map(_run_replicate_chunk, *zip(*args)))
+    count_exceed, days_exceed, null_counts = np.sum(parts, axis=0)
+
+    observed_matched = observed_counts > 0
+    return pd.DataFrame({
+        'change_point_date': cp_dates.values,
+        'observed_matches': observed_counts,
+        'observed_mean_abs_days': np.where(observed_matched, observed_mean_abs, np.nan),
+        'null_mean_matches': null_counts / n_replicates,
+        'count_p_value': (1 + count_exceed) / (1 + n_replicates),
+        'days_p_value': np.where(
+            observed_matched, (1 + days_exceed) / (1 + n_replicates), 1.0
+        ),
+    })
@@ -0,0 +1,382 @@
+"""
+Stationarity testing utilities for Brent oil price analysis.
+
+This module provides ADF and KPSS tests on full series and on rolling or
+expanding windows. Window tests are fanned out across a process pool and
+results are cached by data fingerprint and window specification, so
+refreshing rolling-stationarity charts does not rerun thousands of
+regressions.
+"""
+
+import hashlib
+import os
+import pickle
+import warnings
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.stattools import adfuller, kpss
+
+from .constants import ADF_SIGNIFICANCE_LEVEL, KPSS_SIGNIFICANCE_LEVEL
+
+VALID_TESTS: Tuple[str, ...] = ("adf", "kpss")
+# Deterministic terms each test supports
+VALID_REGRESSIONS: Dict[str, Tuple[str, ...]] = {"adf": ("c", "ct", "ctt", "n"), "kpss": ("c", "ct")}
+
+# Below this many windows the process pool costs more than it saves
+_MIN_WINDOWS_FOR_POOL = 64
+_MEMORY_CACHE_SIZE = 32
+_memory_cache: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+
+
+def _adf(values: np.ndarray, regression: str) -> Tuple[float, float, int, int, Dict[str, float]]:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        result = adfuller(values, regression=regression, autolag='AIC')
+    return float(result[0]), float(result[1]), int(result[2]), int(result[3]), dict(result[4])
+
+
+def _kpss(values: np.ndarray, regression: str) -> Tuple[float, float, int, Dict[str, float]]:
+    # statsmodels warns when the statistic falls outside its p-value table
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        result = kpss(values, regression=regression, nlags='auto')
+    return float(result[0]), float(result[1]), int(result[2]), dict(result[3])
+
+
+def run_adf_test(
+    series: pd.Series,
+    significance_level: float = ADF_SIGNIFICANCE_LEVEL,
+    regression: str = 'c'
+) -> Dict:
+    """
+    Run the Augmented Dickey-Fuller test (H0: unit root).
+
+    Parameters:
+    -----------
+    series : pd.Series
+        Series to test. NaN values are dropped.
+    significance_level : float, optional
+        Significance level for the stationarity decision. Default is 0.05.
+    regression : str, optional
+        Deterministic terms ('c', 'ct', 'ctt' or 'n'). Default is 'c'.
+
+    Returns:
+    --------
+    Dict
+        Dictionary containing test results:
+        - statistic: float
+        - p_value: float
+        - n_lags: int
+        - n_obs: int
+        - critical_values: Dict[str, float]
+        - is_stationary: bool (H0 rejected)
+    """
+    statistic, p_value, n_lags, n_obs, critical_values = _adf(
+        np.asarray(pd.Series(series).dropna(), dtype=np.float64), regression
+    )
+    return {
+        'statistic': statistic,
+        'p_value': p_value,
+        'n_lags': n_lags,
+        'n_obs': n_obs,
+        'critical_values': critical_values,
+        'is_stationary': p_value < significance_level,
+    }
+
+
+def run_kpss_test(
+    series: pd.Series,
+    significance_level: float = KPSS_SIGNIFICANCE_LEVEL,
+    regression: str = 'c'
+) -> Dict:
+    """
+    Run the KPSS test (H0: stationary).
+
+    Parameters:
+    -----------
+    series : pd.Series
+        Series to test. NaN values are dropped.
+    significance_level : float, optional
+        Significance level for the stationarity decision. Default is 0.05.
+    regression : str, optional
+        'c' for level stationarity or 'ct' for trend stationarity. Default is 'c'.
+
+    Returns:
+    --------
+    Dict
+        Dictionary containing test results:
+        - statistic: float
+        - p_value: float (bounded to the statsmodels lookup table)
+        - n_lags: int
+        - critical_values: Dict[str, float]
+        - is_stationary: bool (H0 not rejected)
+    """
+    statistic, p_value, n_lags, critical_values = _kpss(
+        np.asarray(pd.Series(series).dropna(), dtype=np.float64), regression
+    )
+    return {
+        'statistic': statistic,
+        'p_value': p_value,
+        'n_lags': n_lags,
+        'critical_values': critical_values,
+        'is_stationary': p_value >= significance_level,
+    }
+
+
+def run_stationarity_tests(
+    series: pd.Series,
+    adf_significance_level: float = ADF_SIGNIFICANCE_LEVEL,
+    kpss_significance_level: float = KPSS_SIGNIFICANCE_LEVEL
+) -> Dict:
+    """
+    Run ADF and KPSS on a full series and combine their verdicts.
+
+    Returns:
+    --------
+    Dict
+        Dictionary with 'adf' and 'kpss' results and a 'conclusion' string:
+        'stationary' (ADF rejects a unit root, KPSS does not reject
+        stationarity), 'non-stationary' (ADF does not reject, KPSS rejects),
+        'trend-stationary' (neither test rejects) or 'difference-stationary'
+        (both reject).
+    """
+    adf_result = run_adf_test(series, adf_significance_level)
+    kpss_result = run_kpss_test(series, kpss_significance_level)
+
+    conclusion = {
+        (True, True): 'stationary',
+        (False, False): 'non-stationary',
+        (False, True): 'trend-stationary',
+        (True, False): 'difference-stationary',
+    }[(adf_result['is_stationary'], kpss_result['is_stationary'])]
+
+    return {'adf': adf_result, 'kpss': kpss_result, 'conclusion': conclusion}
+
+
+def _window_bounds(n: int, window: int, step: int, expanding: bool) -> np.ndarray:
+    """(start, end) positions of every window, end exclusive."""
+    ends = np.arange(window, n + 1, step)
+    starts = np.zeros_like(ends) if expanding else ends - window
+    return np.column_stack([starts, ends])
+
+
+def _run_window_chunk(
+    values: np.ndarray,
+    bounds: np.ndarray,
+    tests: Sequence[str],
+    regression: str
+) -> np.ndarray:
+    """Run the requested tests on a chunk of windows (process pool worker)."""
+    out = np.full((len(bounds), 2 * len(tests)), np.nan)
+    for i, (start, end) in enumerate(bounds):
+        window_values = values[start:end]
+        for j, test in enumerate(tests):
+            try:
+                if test == 'adf':
+                    statistic, p_value = _adf(window_values, regression)[:2]
+                else:
+                    statistic, p_value = _kpss(window_values, regression)[:2]
+            except (ValueError, np.linalg.LinAlgError):
+                continue  # degenerate window (e.g. constant values)
+            out[i, 2 * j] = statistic
+            out[i, 2 * j + 1] = p_value
+    return out
+
+
+def _fingerprint(series: pd.Series, spec: Tuple) -> str:
+    """Hash of the series values, index and test specification."""
+    digest = hashlib.sha1()
+    digest.update(np.ascontiguousarray(series.to_numpy(dtype=np.float64)).tobytes())
+    if isinstance(series.index, pd.DatetimeIndex):
+        digest.update(series.index.as_unit('ns').asi8.tobytes())
+    else:
+        digest.update(pd.util.hash_pandas_object(series.index, index=False).to_numpy().tobytes())
+    digest.update(repr(spec).encode())
+    return digest.hexdigest()
+
+
+def _cache_get(key: str, cache_dir: Optional[Path]) -> Optional[pd.DataFrame]:
+    if key in _memory_cache:
+        _memory_cache.move_to_end(key)
+        return _memory_cache[key]
+    if cache_dir is not None:
+        path = Path(cache_dir) / f"{key}.pkl"
+        if path.exists():
+            with open(path, 'rb') as f:
+                result = pickle.load(f)
+            _cache_put(key, result, None)
+            return result
+    return None
+
+
+def _cache_put(key: str, result: pd.DataFrame, cache_dir: Optional[Path]) -> None:
+    _memory_cache[key] = result
+    _memory_cache.move_to_end(key)
+    while len(_memory_cache) > _MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+    if cache_dir is not None:
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent readers never see a partial file
+        tmp_path = cache_dir / f"{key}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_dir / f"{key}.pkl")
+
+
+def clear_stationarity_cache() -> None:
+    """Clear the in-memory cache of rolling test results."""
+    _memory_cache.clear()
+
+
+def rolling_stationarity_tests(
+    series: pd.Series,
+    window: int,
+    step: int = 1,
+    expanding: bool = False,
+    tests: Sequence[str] = VALID_TESTS,
+    regression: str = 'c',
+    adf_significance_level: float = ADF_SIGNIFICANCE_LEVEL,
+    kpss_significance_level: float = KPSS_SIGNIFICANCE_LEVEL,
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[Path] = None,
+    use_cache: bool = True
+) -> pd.DataFrame:
+    """
+    Run ADF and/or KPSS on rolling or expanding windows.
+
+    Windows are split into chunks and evaluated on a process pool. Results
+    are cached in memory (and optionally on disk) under a key derived from
+    the series content and every argument that affects the output, so a
+    repeated call with unchanged data returns immediately.
+
+    Parameters:
+    -----------
+    series : pd.Series
+        Series to test. NaN values are dropped.
+    window : int
+        Window length in observations (minimum length for expanding windows).
+    step : int, optional
+        Distance between consecutive window ends. Default is 1.
+    expanding : bool, optional
+        If True, every window starts at the first observation. Default is False.
+    tests : sequence of str, optional
+        Tests to run, any of 'adf' and 'kpss'. Default is both.
+    regression : str, optional
+        Deterministic terms passed to both tests. Default is 'c'.
+    adf_significance_level, kpss_significance_level : float, optional
+        Significance levels for the stationarity flags. Default is 0.05.
+    max_workers : int, optional
+        Process pool size. None uses the CPU count; 1 runs in-process.
+    cache_dir : Path, optional
+        Directory for a persistent on-disk cache. None keeps results in
+        memory only.
+    use_cache : bool, optional
+        Whether to read and write the cache. Default is True.
+
+    Returns:
+    --------
+    pd.DataFrame
+        One row per window, indexed by the window's last date, with
+        'window_start' and '{test}_statistic', '{test}_p_value',
+        '{test}_stationary' columns for each test.
+
+    Raises:
+    -------
+    ValueError
+        If window/step are invalid, an unknown test is requested or a test
+        does not support ``regression``.
+    """
+    tests = tuple(tests)
+    unknown = [t for t in tests if t not in VALID_TESTS]
+    if unknown or not tests:
+        raise ValueError(f"tests must be a non-empty subset of {VALID_TESTS}, got {tests}")
+    for test in tests:
+        if regression not in VALID_REGRESSIONS[test]:
+            raise ValueError(
+                f"regression for {test} must be one of {VALID_REGRESSIONS[test]}, got {regression}"
+            )
+    if window < 10:
+        raise ValueError(f"window must be at least 10 observations, got {window}")
+    if step < 1:
+        raise ValueError(f"step must be a positive integer, got {step}")
+
+    series = pd.Series(series).dropna()
+    spec = (
+        'rolling_stationarity', window, step, expanding, tests, regression,
+        adf_significance_level, kpss_significance_level,
+    )
+    key = _fingerprint(series, spec)
+
+    if use_cache:
+        cached = _cache_get(key, cache_dir)
+        if cached is not None:
+            return cached.copy()
+
+    values = series.to_numpy(dtype=np.float64)
+    bounds = _window_bounds(len(values), window, step, expanding)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if max_workers <= 1 or len(bounds) < _MIN_WINDOWS_FOR_POOL:
+        raw = _run_window_chunk(values, bounds, tests, regression)
+    else:
+        chunks = np.array_split(bounds, max_workers * 4)
+        chunks = [chunk for chunk in chunks if len(chunk)]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            parts = list(executor.map(
+                _run_window_chunk,
+                [values] * len(chunks),
+                chunks,
+                [tests] * len(chunks),
+                [regression] * len(chunks),
+            ))
+        raw = np.vstack(parts) if parts else np.empty((0, 2 * len(tests)))
+
+    result = pd.DataFrame(
+        {'window_start': series.index[bounds[:, 0]] if len(bounds) else series.index[:0]},
+        index=series.index[bounds[:, 1] - 1] if len(bounds) else series.index[:0],
+    )
+    levels = {'adf': adf_significance_level, 'kpss': kpss_significance_level}
+    for j, test in enumerate(tests):
+        p_values = raw[:, 2 * j + 1]
+        result[f'{test}_statistic'] = raw[:, 2 * j]
+        result[f'{test}_p_value'] = p_values
+        if test == 'adf':
+            result[f'{test}_stationary'] = p_values < levels[test]
+        else:
+            result[f'{test}_stationary'] = p_values >= levels[test]
+
+    if use_cache:
+        _cache_put(key, result, cache_dir)
+
+    return result.copy()
+
+
+def expanding_stationarity_tests(series: pd.Series, min_window: int, **kwargs) -> pd.DataFrame:
+    """Shortcut for ``rolling_stationarity_tests(..., expanding=True)``."""
+    return rolling_stationarity_tests(series, min_window, expanding=True, **kwargs)
+
+
+def summarize_stationarity(results: pd.DataFrame) -> Dict[str, float]:
+    """
+    Share of windows flagged stationary by each test.
+
+    Parameters:
+    -----------
+    results : pd.DataFrame
+        Output of ``rolling_stationarity_tests``.
+
+    Returns:
+    --------
+    Dict[str, float]
+        Mapping of test name to fraction of windows judged stationary.
+    """
+    tests: List[str] = [c[:-len('_stationary')] for c in results.columns if c.endswith('_stationary')]
+    return {test: float(results[f'{test}_stationary'].mean()) for test in tests}
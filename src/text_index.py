@@ -0,0 +1,131 @@
+"""
+In-memory full-text index over event names and descriptions.
+
+Keyword filters ("OPEC", "sanctions", "pandemic") are answered from an
+inverted index instead of a ``str.contains`` scan: every token maps to a
+sorted array of event row positions, prefix queries binary-search the
+sorted vocabulary, and multi-word queries intersect the posting lists
+smallest first.
+"""
+
+import bisect
+import re
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+TEXT_INDEX_COLUMNS = ("Event", "Description")
+VALID_MATCH_MODES = ("all", "any")
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+_PREFIX_CACHE_SIZE = 4096
+
+
+def tokenize(text) -> List[str]:
+    """Lower-case word tokens of ``text`` ('COVID-19' -> ['covid', '19'])."""
+    if not isinstance(text, str):
+        return []
+    return _TOKEN_PATTERN.findall(text.casefold())
+
+
+class EventTextIndex:
+    """
+    Inverted index from tokens to event row positions.
+
+    Parameters:
+    -----------
+    events_df : pd.DataFrame
+        Events, e.g. from ``load_events_data``.
+    columns : sequence of str, optional
+        Text columns to index. Default is 'Event' and 'Description'
+        (whichever exist).
+    """
+
+    def __init__(self, events_df: pd.DataFrame, columns: Sequence[str] = TEXT_INDEX_COLUMNS):
+        self.events = events_df
+        self.columns = [column for column in columns if column in events_df.columns]
+
+        rows_by_term: Dict[str, List[int]] = defaultdict(list)
+        texts = zip(*(events_df[column].tolist() for column in self.columns))
+        for row, values in enumerate(texts):
+            for term in set(token for value in values for token in tokenize(value)):
+                rows_by_term[term].append(row)
+
+        self.terms = sorted(rows_by_term)
+        self._postings = {
+            term: np.asarray(rows, dtype=np.int64) for term, rows in rows_by_term.items()
+        }
+        self._empty = np.empty(0, dtype=np.int64)
+        self._prefix_cached = lru_cache(maxsize=_PREFIX_CACHE_SIZE)(self._prefix_union)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def __repr__(self) -> str:
+        return f"EventTextIndex(n_events={len(self)}, n_terms={len(self.terms)})"
+
+    def postings(self, term: str) -> np.ndarray:
+        """Sorted row positions of events containing ``term`` exactly."""
+        return self._postings.get(term.casefold(), self._empty)
+
+    def _prefix_union(self, prefix: str) -> np.ndarray:
+        lo = bisect.bisect_left(self.terms, prefix)
+        hi = bisect.bisect_left(self.terms, prefix + "\U0010ffff")
+        if hi - lo == 1:
+            return self._postings[self.terms[lo]]
+        if hi == lo:
+            return self._empty
+        return np.unique(np.concatenate([self._postings[term] for term in self.terms[lo:hi]]))
+
+    def prefix_postings(self, prefix: str) -> np.ndarray:
+        """Sorted row positions of events with a token starting with ``prefix``."""
+        return self._prefix_cached(prefix.casefold())
+
+    def search(self, query: str, prefix: bool = True, match: str = "all") -> np.ndarray:
+        """
+        Row positions of events matching a keyword query.
+
+        Parameters:
+        -----------
+        query : str
+            Free text; it is tokenized like the indexed columns. An empty
+            query matches every event.
+        prefix : bool, optional
+            Whether each query token matches any token it is a prefix of
+            ('sanction' matches 'sanctions'). Default is True.
+        match : str, optional
+            'all' to require every query token, 'any' for at least one.
+            Default is 'all'.
+
+        Returns:
+        --------
+        np.ndarray
+            Sorted row positions into ``events``.
+        """
+        if match not in VALID_MATCH_MODES:
+            raise ValueError(f"match must be one of {VALID_MATCH_MODES}, got {match}")
+
+        tokens = tokenize(query)
+        if not tokens:
+            return np.arange(len(self.events))
+
+        lookup = self.prefix_postings if prefix else self.postings
+        lists = [lookup(token) for token in dict.fromkeys(tokens)]
+        if match == "any":
+            return np.unique(np.concatenate(lists))
+
+        # Intersect smallest first so the running result shrinks fastest
+        lists.sort(key=len)
+        result = lists[0]
+        for postings in lists[1:]:
+            if len(result) == 0:
+                break
+            result = np.intersect1d(result, postings, assume_unique=True)
+        return result
+
+    def filter(self, query: str, prefix: bool = True, match: str = "all") -> pd.DataFrame:
+        """Rows of ``events`` matching ``query`` (see ``search``)."""
+        return self.events.iloc[self.search(query, prefix=prefix, match=match)]
@@ -0,0 +1,15 @@
+"""
+Shared pytest configuration.
+
+The dashboard backend modules import each other as top-level modules (as
+when app.py is run from its own directory), so that directory is put on
+the import path for their tests.
+"""
+
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent / "dashboard" / "backend"
+
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
@@ -0,0 +1,72 @@
+"""
+Unit tests for the dashboard API client helpers.
+"""
+
+import io
+import urllib.request
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from src.api_client import fetch_prices, read_arrow_stream
+from src.constants import ARROW_STREAM_MIMETYPE
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def arrow_body():
+    """Arrow stream of three prices split over two record batches, with a null return."""
+    batch = pa.RecordBatch.from_arrays(
+        [
+            pa.array(pd.to_datetime(['2020-01-02', '2020-01-03', '2020-01-06']).values),
+            pa.array([66.25, 68.6, 69.0]),
+            pa.array([None, 0.0349, 0.0058], type=pa.float64()),
+        ],
+        names=['Date', 'Price', 'log_return'],
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_batch(batch.slice(0, 2))
+        writer.write_batch(batch.slice(2))
+    return sink.getvalue().to_pybytes()
+
+
+class TestReadArrowStream:
+    """Test cases for read_arrow_stream function."""
+    
+    def test_read_bytes(self, arrow_body):
+        """Test that every batch is read and Date becomes the index."""
+        df = read_arrow_stream(arrow_body)
+        
+        assert isinstance(df.index, pd.DatetimeIndex)
+        assert df.index.name == 'Date'
+        assert df['Price'].tolist() == [66.25, 68.6, 69.0]
+        assert np.isnan(df['log_return'].iloc[0])
+    
+    def test_read_file_like(self, arrow_body):
+        """Test reading from a file-like object such as an HTTP response."""
+        df = read_arrow_stream(io.BytesIO(arrow_body))
+        
+        assert len(df) == 3
+
+
+class TestFetchPrices:
+    """Test cases for fetch_prices function."""
+    
+    def test_fetch_prices_request(self, arrow_body, monkeypatch):
+        """Test the request URL and Accept header."""
+        seen = {}
+        
+        def fake_urlopen(request, timeout):
+            seen['url'] = request.full_url
+            seen['accept'] = request.get_header('Accept')
+            return io.BytesIO(arrow_body)
+        
+        monkeypatch.setattr(urllib.request, 'urlopen', fake_urlopen)
+        df = fetch_prices('http://api:5000/', start_date='2020-01-01', fields=['Date', 'Price'])
+        
+        assert seen['url'] == 'http://api:5000/prices?format=arrow&start_date=2020-01-01&fields=Date%2CPrice'
+        assert seen['accept'] == ARROW_STREAM_MIMETYPE
+        assert len(df) == 3
@@ -0,0 +1,300 @@
+"""
+Tests for the dashboard API routes, run against small generated data files.
+"""
+
+import json
+import sys
+import time
+
+import pytest
+import numpy as np
+import pandas as pd
+
+import src.constants
+from jobs import JobManager
+from src.api_client import read_arrow_stream
+from src.constants import ARROW_STREAM_MIMETYPE
+from tests.test_jobs import FAIL_DRAWS, fake_fit
+
+
+@pytest.fixture(scope="module")
+def api(tmp_path_factory):
+    """The ``app`` module loaded from temporary price, event and change point files."""
+    data_dir = tmp_path_factory.mktemp("data")
+    dates = pd.bdate_range("2019-01-01", "2021-12-31")
+    rng = np.random.default_rng(0)
+    prices = 60 * np.exp(np.cumsum(rng.normal(0, 0.02, size=len(dates))))
+    pd.DataFrame({"Date": dates.strftime("%d-%b-%y"), "Price": prices.round(2)}).to_csv(
+        data_dir / "prices.csv", index=False
+    )
+    pd.DataFrame({
+        "Date": ["2019-03-15", "2020-03-09", "2020-04-20", "2021-06-01", "2020-03-09"],
+        "Event": ["Sanctions", "Price war", "Negative futures", "OPEC+ deal", "Market crash"],
+        "Description": ["Export sanctions", "Saudi price war", "WTI below zero", "Output cut", "Equities fall"],
+    }).to_csv(data_dir / "events.csv", index=False)
+    pd.DataFrame({
+        "change_date": ["2020-03-06", "2021-01-04"],
+        "mu_1": [0.001, -0.002],
+        "mu_2": [-0.004, 0.003],
+    }).to_csv(data_dir / "change_points.csv", index=False)
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(src.constants, "BRENT_OIL_PRICES_CSV", data_dir / "prices.csv")
+        mp.setattr(src.constants, "KEY_EVENTS_CSV", data_dir / "events.csv")
+        mp.setattr(src.constants, "CHANGE_POINTS_CSV", data_dir / "change_points.csv")
+        mp.setattr(src.constants, "PROCESSED_DATA_DIR", data_dir)
+        sys.modules.pop("app", None)
+        import app
+        assert app.data is None and app.change_point_store is None and app.job_manager is None
+        app.create_app()
+        try:
+            yield app
+        finally:
+            app.change_point_store.stop()
+            app.job_manager.shutdown()
+            sys.modules.pop("app", None)
+
+
+@pytest.fixture
+def client(api):
+    api.response_cache.invalidate()
+    return api.app.test_client()
+
+
+class TestLoadData:
+    """Test cases for load_data."""
+    
+    def test_reload_publishes_new_state(self, api, client):
+        """Test that a reload swaps in a new DataState and invalidates the cache."""
+        before = api.data
+        version = api.response_cache.version
+        
+        response = client.post("/reload")
+        
+        assert response.status_code == 200
+        assert api.data is not before
+        assert isinstance(api.data, api.DataState)
+        assert api.response_cache.version > version
+        assert response.get_json()["data_version"] == api.response_cache.version
+    
+    def test_state_is_immutable(self, api):
+        """Test that the published state cannot be modified in place."""
+        with pytest.raises(Exception):
+            api.data.price_payload = None
+        with pytest.raises(TypeError):
+            api.data.level_payloads["daily"] = None
+    
+    def test_etag_survives_reload(self, api, client):
+        """Test that reloading unchanged data keeps ETags valid."""
+        etag = client.get("/prices").headers["ETag"]
+        client.post("/reload")
+        
+        assert client.get("/prices", headers={"If-None-Match": etag}).status_code == 304
+
+
+class TestPrices:
+    """Test cases for the /prices route."""
+    
+    def test_full_range(self, api, client):
+        """Test that /prices serves every loaded price."""
+        body = json.loads(client.get("/prices").data)
+        
+        assert body["count"] == len(api.data.df_prices)
+        assert body["data"][-1]["Price"] == api.data.df_prices["Price"].iloc[-1]
+    
+    def test_ohlc_max_points(self, client):
+        """Test that OHLC requests never exceed max_points and 400 when no level fits."""
+        body = json.loads(client.get("/prices?max_points=20&agg=ohlc").data)
+        
+        assert body["resolution"] == "quarterly"
+        assert body["count"] <= 20
+        assert client.get("/prices?max_points=5&agg=ohlc").status_code == 400
+    
+    def test_arrow_round_trip(self, api, client):
+        """Test that the Arrow body reads back into the loaded prices for a range."""
+        pytest.importorskip("pyarrow")
+        response = client.get("/prices?format=arrow&start_date=2020-03-02&end_date=2020-03-31&fields=Date,Price")
+        
+        assert response.status_code == 200
+        assert response.mimetype == ARROW_STREAM_MIMETYPE
+        result = read_arrow_stream(response.data)
+        expected = api.data.df_prices.loc["2020-03-02":"2020-03-31", "Price"]
+        np.testing.assert_array_equal(result["Price"].to_numpy(), expected.to_numpy())
+        assert (result.index == expected.index).all()
+    
+    def test_json_and_arrow_cached_separately(self, api, client):
+        """Test that JSON and Arrow responses for one URL are distinct cache entries."""
+        pytest.importorskip("pyarrow")
+        hits = api.response_cache.hits
+        json_response = client.get("/prices")
+        arrow_response = client.get("/prices", headers={"Accept": ARROW_STREAM_MIMETYPE})
+        
+        assert len(api.response_cache) == 2
+        assert json_response.headers["ETag"] != arrow_response.headers["ETag"]
+        assert "Accept" in arrow_response.headers["Vary"]
+        assert client.get("/prices").data == json_response.data
+        assert client.get("/prices", headers={"Accept": ARROW_STREAM_MIMETYPE}).data == arrow_response.data
+        assert api.response_cache.hits == hits + 2
+    
+    def test_arrow_rejects_json_only_arguments(self, client):
+        """Test that Arrow requests with paging or downsampling get a 400."""
+        pytest.importorskip("pyarrow")
+        
+        assert client.get("/prices?format=arrow&limit=10").status_code == 400
+        assert client.get("/prices?format=arrow&max_points=10").status_code == 400
+        assert client.get("/prices?format=xml").status_code == 400
+
+
+class TestEvents:
+    """Test cases for the /events route."""
+    
+    def test_all_events_in_file_order(self, api, client):
+        """Test that unfiltered events are served in their original order."""
+        body = json.loads(client.get("/events").data)
+        
+        assert [event["Event"] for event in body["data"]] == api.data.df_events["Event"].tolist()
+    
+    def test_range_search_and_fields(self, client):
+        """Test date ranges, keyword search and field projection without paging."""
+        in_range = json.loads(client.get("/events?start_date=2020-01-01&end_date=2020-12-31").data)
+        searched = json.loads(client.get("/events?q=price&start_date=2020-01-01&fields=Event").data)
+        
+        assert [event["Event"] for event in in_range["data"]] == ["Price war", "Negative futures", "Market crash"]
+        assert searched["data"] == [{"Event": "Price war"}]
+    
+    def test_pages(self, client):
+        """Test that paging returns events in date order and ends without a cursor."""
+        first = json.loads(client.get("/events?limit=3").data)
+        second = json.loads(client.get(f"/events?limit=3&after={first['next_cursor']}").data)
+        
+        dates = [event["Date"] for event in first["data"] + second["data"]]
+        assert dates == sorted(dates) and len(dates) == 5
+        assert second["next_cursor"] is None
+        assert client.get("/events?after=bogus").status_code == 400
+
+
+class TestDashboard:
+    """Test cases for the /dashboard route."""
+    
+    PARTS = {
+        "prices": "/prices",
+        "changepoints": "/changepoints",
+        "events": "/events",
+        "associations": "/associations?window_days=30",
+        "metrics": "/metrics",
+    }
+    
+    @pytest.mark.parametrize("query", ["", "start_date=2020-01-01&end_date=2020-06-30"])
+    def test_parts_match_routes(self, api, client, query):
+        """Test that every embedded part equals the individual route's response."""
+        body = json.loads(client.get(f"/dashboard?{query}").data)
+        api.response_cache.invalidate()
+        
+        assert body["status"] == "success"
+        assert set(body) == {"status", *self.PARTS}
+        for name, route in self.PARTS.items():
+            if query and name in ("prices", "events"):
+                route = f"{route}?{query}"
+            assert body[name] == json.loads(client.get(route).data), name
+    
+    def test_parts_shared_with_routes(self, api, client):
+        """Test that the individual routes are served from the entries /dashboard stored."""
+        client.get("/dashboard")
+        hits = api.response_cache.hits
+        
+        for route in self.PARTS.values():
+            client.get(route)
+        assert api.response_cache.hits == hits + len(self.PARTS)
+    
+    def test_reuses_route_entries(self, api, client):
+        """Test that /dashboard takes parts already cached by the routes."""
+        prices = client.get("/prices").data
+        hits = api.response_cache.hits
+        
+        body = json.loads(client.get("/dashboard").data)
+        assert api.response_cache.hits == hits + 1
+        assert body["prices"] == json.loads(prices)
+    
+    def test_reload_during_build(self, api, client, monkeypatch):
+        """Test that parts built from data replaced by a reload mid-request are not stored."""
+        events_body = api.events_body
+        
+        def reload_then_build(state, *args, **kwargs):
+            api.response_cache.invalidate()
+            return events_body(state, *args, **kwargs)
+        
+        monkeypatch.setattr(api, "events_body", reload_then_build)
+        assert client.get("/dashboard").status_code == 200
+        assert len(api.response_cache) == 0
+    
+    def test_invalid_window(self, client):
+        """Test that a malformed window_days gets a 400."""
+        assert client.get("/dashboard?window_days=abc").status_code == 400
+
+
+class TestJobs:
+    """Test cases for the /jobs routes, with a stubbed fit function."""
+    
+    @pytest.fixture
+    def jobs_client(self, api, client, tmp_path, monkeypatch):
+        manager = JobManager(tmp_path / "jobs", fit=fake_fit)
+        monkeypatch.setattr(api, "job_manager", manager)
+        yield client
+        manager.shutdown()
+    
+    def wait(self, client, job_id):
+        deadline = time.monotonic() + 60
+        while True:
+            job = client.get(f"/jobs/{job_id}").get_json()["job"]
+            if job["status"] in ("completed", "failed", "cancelled") or time.monotonic() > deadline:
+                return job
+            time.sleep(0.01)
+    
+    def test_submit_and_poll(self, api, jobs_client):
+        """Test that a submitted fit is accepted, completes, and is then returned at once."""
+        params = {"start_date": "2020-01-01", "end_date": "2020-12-31", "draws": 10, "tune": 10}
+        response = jobs_client.post("/jobs", json=params)
+        
+        assert response.status_code == 202
+        job_id = response.get_json()["job"]["id"]
+        job = self.wait(jobs_client, job_id)
+        assert job["status"] == "completed"
+        expected = api.data.df_prices.loc["2020-01-01":"2020-12-31", "log_return"].dropna()
+        assert job["result"]["observations"] == len(expected)
+        assert job["params"]["draws"] == 10
+        
+        again = jobs_client.post("/jobs", json=params)
+        assert again.status_code == 200
+        assert again.get_json()["job"]["id"] == job_id
+    
+    def test_failed_fit(self, jobs_client):
+        """Test that a fit raising an error is reported as failed."""
+        job_id = jobs_client.post("/jobs", json={"draws": FAIL_DRAWS}).get_json()["job"]["id"]
+        
+        job = self.wait(jobs_client, job_id)
+        assert job["status"] == "failed"
+        assert "sampler diverged" in job["error"]
+    
+    @pytest.mark.parametrize("body", [
+        {"draws": "many"},
+        {"draws": 10.5},
+        {"draws": True},
+        {"hdi_prob": "0.9"},
+        {"draws": -1},
+        {"hdi_prob": 1.5},
+        {"chains": 4},
+        {"start_date": "not a date"},
+        [1, 2],
+    ])
+    def test_invalid_parameters(self, jobs_client, body):
+        """Test that unknown keys, wrong types and invalid values get a 400."""
+        response = jobs_client.post("/jobs", json=body)
+        
+        assert response.status_code == 400
+        assert response.get_json()["status"] == "error"
+    
+    def test_unknown_job(self, jobs_client):
+        """Test that unknown or malformed job ids get a 404."""
+        assert jobs_client.get("/jobs/" + "0" * 24).status_code == 404
+        assert jobs_client.get("/jobs/not-a-job").status_code == 404
+        assert jobs_client.delete("/jobs/" + "0" * 24).status_code == 404
@@ -0,0 +1,112 @@
+"""
+Unit tests for the Arrow IPC export of the price history.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from werkzeug.datastructures import MIMEAccept, MultiDict
+
+from src.api_client import read_arrow_stream
+from src.constants import ARROW_STREAM_MIMETYPE
+
+pa = pytest.importorskip("pyarrow")
+
+from arrow_export import ArrowPrices, negotiate_format  # noqa: E402
+
+
+@pytest.fixture
+def price_df():
+    """Prices with a leading NaN return, as loaded by the API."""
+    dates = pd.bdate_range('2020-01-01', periods=30, name='Date').as_unit('ns')
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'Price': 60 + rng.normal(0, 1, size=30)}, index=dates)
+    df['log_return'] = np.log(df['Price']).diff()
+    return df
+
+
+class TestNegotiateFormat:
+    """Test cases for negotiate_format function."""
+    
+    @pytest.mark.parametrize('args, accept, expected', [
+        ({}, [], 'json'),
+        ({}, [('*/*', 1)], 'json'),
+        ({}, [(ARROW_STREAM_MIMETYPE, 1)], 'arrow'),
+        ({}, [('application/json', 0.5), (ARROW_STREAM_MIMETYPE, 1)], 'arrow'),
+        ({}, [('application/json', 1), (ARROW_STREAM_MIMETYPE, 0.5)], 'json'),
+        ({'format': 'arrow'}, [('application/json', 1)], 'arrow'),
+        ({'format': 'json'}, [(ARROW_STREAM_MIMETYPE, 1)], 'json'),
+    ])
+    def test_negotiation(self, args, accept, expected):
+        """Test that an explicit format wins over Accept, which defaults to JSON."""
+        assert negotiate_format(MultiDict(args), MIMEAccept(accept)) == expected
+    
+    def test_invalid_format(self):
+        """Test that an unknown format raises ValueError."""
+        with pytest.raises(ValueError):
+            negotiate_format(MultiDict({'format': 'csv'}), MIMEAccept([]))
+
+
+class TestArrowPrices:
+    """Test cases for ArrowPrices class."""
+    
+    def test_round_trip(self, price_df):
+        """Test that the encoded stream reads back into the same frame, NaN as null."""
+        prices = ArrowPrices(price_df)
+        body = prices.encode()
+        
+        table = pa.ipc.open_stream(body).read_all()
+        assert table.column('log_return').null_count == 1
+        assert table.column('Price').null_count == 0
+        result = read_arrow_stream(body)
+        pd.testing.assert_frame_equal(result, price_df, check_freq=False)
+    
+    def test_range_and_fields(self, price_df):
+        """Test that a date range and projection match the sliced frame."""
+        prices = ArrowPrices(price_df)
+        
+        result = read_arrow_stream(prices.encode('2020-01-06', '2020-01-17', fields=('Date', 'Price')))
+        expected = price_df.loc['2020-01-06':'2020-01-17', ['Price']]
+        pd.testing.assert_frame_equal(result, expected, check_freq=False)
+        assert list(read_arrow_stream(prices.encode(fields=('Price',))).columns) == ['Price']
+    
+    def test_empty_range(self, price_df):
+        """Test that a range without rows gives an empty stream with the schema."""
+        result = read_arrow_stream(ArrowPrices(price_df).encode('2021-01-01', '2021-12-31'))
+        
+        assert len(result) == 0
+        assert list(result.columns) == ['Price', 'log_return']
+    
+    def test_record_batches(self, price_df):
+        """Test that the stream is split into batches of at most batch_rows."""
+        body = ArrowPrices(price_df, batch_rows=8).encode()
+        
+        batches = list(pa.ipc.open_stream(body))
+        assert [batch.num_rows for batch in batches] == [8, 8, 8, 6]
+    
+    def test_select_is_zero_copy(self, price_df):
+        """Test that a range selection shares the loaded buffers."""
+        prices = ArrowPrices(price_df)
+        batch = prices.select('2020-01-06', '2020-01-17')
+        
+        full = prices.batch.column('Price').buffers()[1]
+        sliced = batch.column('Price').buffers()[1]
+        assert sliced.address == full.address
+        assert batch.num_rows == 10
+    
+    def test_unsorted_frame(self, price_df):
+        """Test that an unsorted frame is exported in date order."""
+        shuffled = price_df.sample(frac=1, random_state=0)
+        
+        assert ArrowPrices(shuffled).encode() == ArrowPrices(price_df).encode()
+    
+    def test_invalid_arguments(self, price_df):
+        """Test validation of fields and batch_rows."""
+        prices = ArrowPrices(price_df)
+        
+        with pytest.raises(ValueError):
+            prices.encode(fields=('Date', 'Volume'))
+        with pytest.raises(ValueError):
+            prices.encode(fields=())
+        with pytest.raises(ValueError):
+            ArrowPrices(price_df, batch_rows=0)
@@ -0,0 +1,133 @@
+"""
+Unit tests for the hot-reloaded change point store.
+"""
+
+import json
+import time
+
+import pytest
+import pandas as pd
+
+from change_points import EXAMPLE_CHANGE_POINTS, ChangePointStore
+from response_cache import ResponseCache
+from src.data_loader import load_change_points
+
+
+def write_change_points(path, dates):
+    pd.DataFrame({
+        'change_date': dates,
+        'mu_1': [0.001] * len(dates),
+        'mu_2': [-0.002] * len(dates),
+    }).to_csv(path, index=False)
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "change_points.csv"
+    write_change_points(path, ['2008-09-15', '2020-03-09'])
+    return path
+
+
+class TestChangePointStore:
+    """Test cases for ChangePointStore class."""
+    
+    def test_initial_load(self, csv_path):
+        """Test that the file is loaded into a snapshot with a pre-encoded body."""
+        store = ChangePointStore(csv_path, load_change_points)
+        snapshot = store.snapshot
+        
+        assert snapshot.version == 1
+        assert snapshot.source == str(csv_path)
+        assert snapshot.dates == ('2008-09-15', '2020-03-09')
+        body = json.loads(snapshot.body)
+        assert body['count'] == 2
+        assert body['data'][0] == {'date': '2008-09-15', 'mu_1': 0.001, 'mu_2': -0.002}
+    
+    def test_example_without_file(self, tmp_path):
+        """Test that the example change points are served until a file exists."""
+        store = ChangePointStore(tmp_path / "missing.csv", load_change_points)
+        
+        assert store.snapshot.source == "example"
+        assert len(store.snapshot.dates) == len(EXAMPLE_CHANGE_POINTS)
+    
+    def test_reload_on_change(self, csv_path):
+        """Test that refresh publishes a new snapshot only when the file changed."""
+        store = ChangePointStore(csv_path, load_change_points)
+        
+        assert store.refresh() is False
+        write_change_points(csv_path, ['2008-09-15', '2014-11-27', '2020-03-09'])
+        assert store.refresh() is True
+        assert store.snapshot.version == 2
+        assert store.snapshot.dates == ('2008-09-15', '2014-11-27', '2020-03-09')
+        assert store.refresh() is False
+    
+    def test_snapshot_swap(self, csv_path):
+        """Test that a reader holding the old snapshot keeps a consistent view."""
+        store = ChangePointStore(csv_path, load_change_points)
+        old = store.snapshot
+        old_body = old.body
+        
+        write_change_points(csv_path, ['2022-02-24'])
+        store.refresh()
+        
+        assert store.snapshot is not old
+        assert old.dates == ('2008-09-15', '2020-03-09')
+        assert old.body == old_body
+        with pytest.raises(Exception):
+            old.version = 5
+    
+    def test_on_swap_invalidates_cache(self, csv_path):
+        """Test that publishing a snapshot calls on_swap, e.g. to invalidate cached responses."""
+        cache = ResponseCache()
+        swapped = []
+        
+        def on_swap(snapshot):
+            swapped.append(snapshot)
+            cache.invalidate()
+        
+        store = ChangePointStore(csv_path, load_change_points, on_swap=on_swap)
+        cache.put("/changepoints", store.snapshot.body, "application/json", cache.version)
+        version = cache.version
+        
+        write_change_points(csv_path, ['2022-02-24'])
+        store.refresh()
+        
+        assert swapped[-1] is store.snapshot
+        assert cache.version == version + 1
+        assert cache.get("/changepoints") is None
+        assert store.refresh() is False
+        assert swapped[-1] is store.snapshot and len(swapped) == 2
+    
+    def test_bad_file_keeps_snapshot(self, csv_path):
+        """Test that a file failing to load leaves the previous snapshot in place."""
+        store = ChangePointStore(csv_path, load_change_points)
+        old = store.snapshot
+        
+        csv_path.write_text("not,a,change,point,file\n1,2,3,4,5\n")
+        
+        assert store.refresh() is False
+        assert store.snapshot is old
+        assert store.stats()['last_error'].startswith('ValueError')
+        write_change_points(csv_path, ['2022-02-24'])
+        assert store.refresh() is True
+        assert store.stats()['last_error'] is None
+    
+    def test_watcher_hot_reload(self, csv_path):
+        """Test that the watcher thread picks up a changed file."""
+        store = ChangePointStore(csv_path, load_change_points, poll_interval=0.01)
+        store.start()
+        try:
+            assert store.stats()['watching']
+            write_change_points(csv_path, ['2022-02-24'])
+            deadline = time.monotonic() + 5
+            while store.snapshot.version == 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert store.snapshot.dates == ('2022-02-24',)
+        finally:
+            store.stop()
+        assert not store.stats()['watching']
+    
+    def test_invalid_poll_interval(self, csv_path):
+        """Test that a non-positive poll interval raises ValueError."""
+        with pytest.raises(ValueError):
+            ChangePointStore(csv_path, load_change_points, poll_interval=0)
@@ -0,0 +1,58 @@
+"""
+Unit tests for response compression helpers.
+"""
+
+import gzip
+
+import pytest
+from werkzeug.datastructures import Accept
+
+from compression import BROTLI, GZIP, SUPPORTED_ENCODINGS, brotli, compress, negotiate_encoding
+
+
+class TestNegotiateEncoding:
+    """Test cases for negotiate_encoding function."""
+    
+    @pytest.mark.parametrize('accept, available, expected', [
+        ([], (BROTLI, GZIP), None),
+        ([('gzip', 1)], (BROTLI, GZIP), GZIP),
+        ([('gzip', 1), ('br', 1)], (BROTLI, GZIP), BROTLI),
+        ([('gzip', 1), ('br', 0.5)], (BROTLI, GZIP), GZIP),
+        ([('br', 1)], (GZIP,), None),
+        ([('*', 1)], (BROTLI, GZIP), BROTLI),
+        ([('identity', 1)], (BROTLI, GZIP), None),
+    ])
+    def test_negotiation(self, accept, available, expected):
+        """Test quality values, server preference and unsupported encodings."""
+        assert negotiate_encoding(Accept(accept), available) == expected
+    
+    def test_default_prefers_brotli_when_installed(self):
+        """Test the default preference order."""
+        expected = BROTLI if brotli is not None else GZIP
+        
+        assert SUPPORTED_ENCODINGS[0] == expected
+        assert negotiate_encoding(Accept([('gzip', 1), ('br', 1)])) == expected
+
+
+class TestCompress:
+    """Test cases for compress function."""
+    
+    def test_gzip_round_trip(self):
+        """Test that gzip output decompresses and is deterministic."""
+        body = b'{"data":[' + b'1.5,' * 1000 + b'2]}'
+        
+        assert gzip.decompress(compress(body, GZIP)) == body
+        assert compress(body, GZIP) == compress(body, GZIP)
+    
+    def test_brotli_round_trip(self):
+        """Test that brotli output decompresses."""
+        if brotli is None:
+            pytest.skip("brotli is not installed")
+        body = b'{"data":[' + b'1.5,' * 1000 + b'2]}'
+        
+        assert brotli.decompress(compress(body, BROTLI)) == body
+    
+    def test_unknown_encoding(self):
+        """Test that an unsupported encoding raises ValueError."""
+        with pytest.raises(ValueError):
+            compress(b"body", "deflate")
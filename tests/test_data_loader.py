@@ -8,7 +8,7 @@ from pathlib import Path
 import tempfile
 import csv
 
-from src.data_loader import load_brent_data, load_events_data
+from src.data_loader import load_brent_data, load_change_points, load_events_data
 from src.config import DataConfig
 
 
@@ -100,3 +100,52 @@ class TestLoadEventsData:
         with pytest.raises(FileNotFoundError):
             load_events_data(data_path=Path("nonexistent_file.csv"))
 
+
+
+class TestLoadChangePoints:
+    """Test cases for load_change_points function."""
+    
+    def test_load_change_points_association_table(self, tmp_path):
+        """Test that the notebook 04 association table collapses to one row per change point."""
+        path = tmp_path / "associations.csv"
+        pd.DataFrame({
+            'change_point_date': ['2020-03-08', '2008-09-15', '2020-03-08'],
+            'event_date': ['2020-03-06', '2008-09-15', '2020-03-11'],
+            'event': ['OPEC+ talks collapse', 'Lehman Brothers', 'WHO pandemic'],
+            'mu_1': [0.0003, 0.0001, 0.0003],
+            'mu_2': [-0.0015, -0.0005, -0.0015],
+            'impact_pct': [-0.18, -0.06, -0.18],
+        }).to_csv(path, index=False)
+        
+        df = load_change_points(data_path=path)
+        
+        assert list(df['change_date']) == [pd.Timestamp('2008-09-15'), pd.Timestamp('2020-03-08')]
+        assert list(df.columns) == ['change_date', 'mu_1', 'mu_2', 'impact_pct']
+        assert df['mu_2'].tolist() == [-0.0005, -0.0015]
+    
+    def test_load_change_points_model_results(self, tmp_path):
+        """Test loading one row per change point with a change point index."""
+        path = tmp_path / "change_points.csv"
+        pd.DataFrame({
+            'change_date': ['2014-11-27'],
+            'change_point_index': [6500],
+            'sigma': [0.025],
+        }).to_csv(path, index=False)
+        
+        df = load_change_points(data_path=path)
+        
+        assert df['change_index'].tolist() == [6500]
+        assert df['sigma'].tolist() == [0.025]
+    
+    def test_load_change_points_missing_date_column(self, tmp_path):
+        """Test that a file without a change point date column is rejected."""
+        path = tmp_path / "change_points.csv"
+        pd.DataFrame({'mu_1': [0.1]}).to_csv(path, index=False)
+        
+        with pytest.raises(ValueError, match="change_date"):
+            load_change_points(data_path=path)
+    
+    def test_load_change_points_file_not_found(self):
+        """Test that FileNotFoundError is raised for non-existent file."""
+        with pytest.raises(FileNotFoundError):
+            load_change_points(data_path=Path("nonexistent_file.csv"))
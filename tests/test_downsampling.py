@@ -0,0 +1,198 @@
+"""
+Unit tests for price downsampling utilities.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from src.downsampling import (
+    PricePyramid,
+    lttb,
+    lttb_indices,
+    resample_ohlc,
+)
+
+
+def reference_lttb(x, y, n_out):
+    """Textbook LTTB implementation used as a reference."""
+    every = (len(x) - 2) / (n_out - 2)
+    a = 0
+    selected = [0]
+    for i in range(n_out - 2):
+        avg_start = int(np.floor((i + 1) * every)) + 1
+        avg_end = min(int(np.floor((i + 2) * every)) + 1, len(x))
+        avg_x = x[avg_start:avg_end].mean()
+        avg_y = y[avg_start:avg_end].mean()
+        lo = int(np.floor(i * every)) + 1
+        hi = int(np.floor((i + 1) * every)) + 1
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        selected.append(a)
+    selected.append(len(x) - 1)
+    return np.array(selected)
+
+
+@pytest.fixture
+def price_df():
+    dates = pd.bdate_range('2000-01-03', periods=1500)
+    rng = np.random.default_rng(0)
+    prices = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, size=1500)))
+    return pd.DataFrame({'Price': prices}, index=dates)
+
+
+class TestResampleOhlc:
+    """Test cases for resample_ohlc function."""
+    
+    def test_matches_pandas_resample(self, price_df):
+        """Test that monthly OHLC matches pandas resample().ohlc()."""
+        ohlc = resample_ohlc(price_df['Price'], 'M')
+        expected = price_df['Price'].resample('MS').ohlc()
+        
+        assert ohlc.index.equals(expected.index)
+        np.testing.assert_allclose(
+            ohlc[['Open', 'High', 'Low', 'Close']].to_numpy(), expected.to_numpy()
+        )
+        assert ohlc['Count'].sum() == len(price_df)
+    
+    def test_empty_series(self):
+        """Test that an empty series yields an empty frame."""
+        prices = pd.Series([], index=pd.DatetimeIndex([]), dtype=float)
+        
+        assert resample_ohlc(prices, 'W').empty
+
+
+class TestLttb:
+    """Test cases for LTTB downsampling."""
+    
+    @pytest.mark.parametrize("n_out", [3, 10, 100, 700])
+    def test_matches_reference(self, price_df, n_out):
+        """Test that the prefix-sum LTTB matches the textbook algorithm."""
+        x = np.arange(len(price_df), dtype=float)
+        y = price_df['Price'].to_numpy()
+        
+        np.testing.assert_array_equal(lttb_indices(x, y, n_out), reference_lttb(x, y, n_out))
+    
+    def test_lttb_series(self, price_df):
+        """Test that lttb keeps endpoints and returns n_out points."""
+        sampled = lttb(price_df['Price'], 200)
+        
+        assert len(sampled) == 200
+        assert sampled.index[0] == price_df.index[0]
+        assert sampled.index[-1] == price_df.index[-1]
+        assert sampled.index.is_monotonic_increasing
+    
+    def test_no_downsampling_needed(self, price_df):
+        """Test that n_out >= n returns every point."""
+        assert len(lttb(price_df['Price'].iloc[:50], 100)) == 50
+    
+    def test_invalid_n_out(self, price_df):
+        """Test that n_out < 3 raises ValueError."""
+        with pytest.raises(ValueError, match="n_out"):
+            lttb(price_df['Price'], 2)
+
+
+class TestPricePyramid:
+    """Test cases for PricePyramid."""
+    
+    def test_levels(self, price_df):
+        """Test that all default levels are built."""
+        pyramid = PricePyramid(price_df)
+        
+        assert pyramid.resolutions[0] == 'daily'
+        assert pyramid.ohlc_resolutions == ['weekly', 'monthly', 'quarterly']
+        assert pyramid.lttb_targets == [250, 500, 1000, 2000]
+        assert len(pyramid.level('lttb_500')) == 500
+        assert len(pyramid.level('lttb_2000')) == len(price_df)
+    
+    def test_query_date_range(self, price_df):
+        """Test that queries match boolean-mask filtering."""
+        pyramid = PricePyramid(price_df)
+        start, end = pd.Timestamp('2002-03-15'), pd.Timestamp('2003-06-30')
+        
+        daily = pyramid.query('daily', start, end)
+        expected = price_df[(price_df.index >= start) & (price_df.index <= end)]
+        pd.testing.assert_frame_equal(daily, expected)
+        
+        monthly = pyramid.query('monthly', start, end)
+        assert monthly.index.min() >= start and monthly.index.max() <= end
+        assert pyramid.count('monthly', start, end) == len(monthly)
+        
+        assert len(pyramid.query('quarterly')) == len(pyramid.level('quarterly'))
+    
+    def test_query_empty_range(self, price_df):
+        """Test that an inverted range returns no rows."""
+        pyramid = PricePyramid(price_df)
+        
+        assert pyramid.query('daily', '2003-01-01', '2002-01-01').empty
+    
+    def test_unknown_resolution(self, price_df):
+        """Test that unknown resolutions raise ValueError."""
+        pyramid = PricePyramid(price_df)
+        
+        with pytest.raises(ValueError, match="resolution"):
+            pyramid.query('hourly')
+    
+    def test_downsample_lttb_bounded(self, price_df):
+        """Test that LTTB downsampling never exceeds max_points."""
+        pyramid = PricePyramid(price_df)
+        
+        for max_points in [3, 100, 300, 750, 1499]:
+            result = pyramid.downsample(max_points)
+            assert len(result) == max_points
+            assert result.index.is_monotonic_increasing
+            assert result.index[0] == price_df.index[0]
+            assert result.index[-1] == price_df.index[-1]
+    
+    def test_downsample_lttb_uses_daily_when_it_fits(self, price_df):
+        """Test that short ranges return the daily rows unchanged."""
+        pyramid = PricePyramid(price_df)
+        
+        resolution, positions = pyramid.plan(500, '2002-01-01', '2002-06-30')
+        
+        assert resolution == 'daily'
+        pd.testing.assert_frame_equal(
+            pyramid.downsample(500, '2002-01-01', '2002-06-30'),
+            pyramid.query('daily', '2002-01-01', '2002-06-30'),
+        )
+    
+    def test_downsample_lttb_coarse_level(self, price_df):
+        """Test that long ranges start from a precomputed LTTB level."""
+        pyramid = PricePyramid(price_df)
+        
+        resolution, positions = pyramid.plan(200)
+        
+        assert resolution == 'lttb_250'
+        assert len(positions) == 200
+    
+    def test_downsample_ohlc(self, price_df):
+        """Test that OHLC picks the finest level that fits."""
+        pyramid = PricePyramid(price_df)
+        
+        assert pyramid.plan(400, agg='ohlc')[0] == 'weekly'
+        assert pyramid.plan(100, agg='ohlc')[0] == 'monthly'
+        assert pyramid.plan(30, agg='ohlc')[0] == 'quarterly'
+        result = pyramid.downsample(100, '2001-01-01', '2002-12-31', agg='ohlc')
+        assert list(result.columns) == ['Open', 'High', 'Low', 'Close', 'Count']
+        assert len(result) <= 100
+    
+    def test_ohlc_never_exceeds_max_points(self, price_df):
+        """Test that OHLC raises instead of returning more than max_points buckets."""
+        pyramid = PricePyramid(price_df)
+        quarters = pyramid.count('quarterly')
+        
+        assert len(pyramid.plan(quarters, agg='ohlc')[1]) == quarters
+        with pytest.raises(ValueError, match="too small"):
+            pyramid.plan(quarters - 1, agg='ohlc')
+        with pytest.raises(ValueError, match="too small"):
+            pyramid.downsample(5, agg='ohlc')
+        assert len(pyramid.plan(5, '2001-01-01', '2001-12-31', agg='ohlc')[1]) <= 5
+    
+    def test_downsample_invalid(self, price_df):
+        """Test validation of agg and max_points."""
+        pyramid = PricePyramid(price_df)
+        
+        with pytest.raises(ValueError, match="agg"):
+            pyramid.downsample(100, agg='mean')
+        with pytest.raises(ValueError):
+            pyramid.downsample(2)
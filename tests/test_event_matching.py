@@ -3,13 +3,17 @@ Unit tests for event matching functionality.
 """
 
 import pytest
+import numpy as np
 import pandas as pd
 from datetime import timedelta
 
 from src.event_matching import (
+    EventIndex,
     match_events_to_change_point,
     find_nearest_event,
     associate_change_points_with_events,
+    associate_posterior_with_events,
+    window_sensitivity,
 )
 from src.config import EventMatchingConfig
 
@@ -129,3 +133,258 @@ class TestAssociateChangePointsWithEvents:
         assert 'event_date' in associations.columns
         assert 'days_from_change' in associations.columns
 
+    
+    def test_associate_preserves_loop_semantics(self):
+        """Test rows, order and placeholders of the vectorized interval join."""
+        change_points_df = pd.DataFrame({
+            'change_date': pd.to_datetime(['2020-01-15', '2020-03-01', '2020-06-15'])
+        })
+        
+        # Deliberately unsorted; matches keep the original row order
+        events_df = pd.DataFrame({
+            'Date': pd.to_datetime(['2020-06-20', '2020-01-20', '2020-01-10', '2020-06-10']),
+            'Event': ['E1', 'E2', 'E3', 'E4'],
+            'Description': ['D1', 'D2', 'D3', 'D4'],
+        })
+        
+        associations = associate_change_points_with_events(
+            change_points_df, events_df, window_days=10
+        )
+        
+        assert list(associations.columns) == [
+            'change_point_date', 'event_date', 'event', 'description', 'days_from_change'
+        ]
+        assert associations['event'].tolist() == ['E2', 'E3', 'No major recorded event', 'E1', 'E4']
+        assert associations['days_from_change'].iloc[[0, 1, 3, 4]].tolist() == [5, -5, 5, -5]
+        unmatched = associations.iloc[2]
+        assert pd.isna(unmatched['event_date'])
+        assert pd.isna(unmatched['description'])
+        assert pd.isna(unmatched['days_from_change'])
+    
+    def test_associate_window_is_inclusive(self):
+        """Test that events exactly window_days away are matched."""
+        change_points_df = pd.DataFrame({'change_date': pd.to_datetime(['2020-01-31'])})
+        events_df = pd.DataFrame({
+            'Date': pd.to_datetime(['2020-01-01', '2020-03-01', '2020-03-02']),
+            'Event': ['Start', 'End', 'Outside'],
+        })
+        
+        associations = associate_change_points_with_events(
+            change_points_df, events_df, window_days=30
+        )
+        
+        assert associations['event'].tolist() == ['Start', 'End']
+        assert associations['description'].tolist() == ['', '']
+
+
+class TestEventIndex:
+    """Test cases for the EventIndex sorted index."""
+    
+    @pytest.fixture
+    def events_df(self):
+        """Unsorted events with a duplicated date."""
+        return pd.DataFrame({
+            'Date': pd.to_datetime([
+                '2020-03-01', '2020-01-10', '2020-01-20', '2020-01-10', '2020-06-01'
+            ]),
+            'Event': ['E0', 'E1', 'E2', 'E3', 'E4'],
+        })
+    
+    def test_window_matches_dataframe_path(self, events_df):
+        """Test that window queries match the DataFrame-based function."""
+        index = EventIndex(events_df)
+        
+        for date in pd.to_datetime(['2020-01-15', '2020-02-15', '2020-05-01', '2021-01-01']):
+            expected = match_events_to_change_point(date, events_df, window_days=30)
+            result = match_events_to_change_point(date, index, window_days=30)
+            assert result['Event'].tolist() == expected['Event'].tolist()
+            if not expected.empty:
+                assert result['days_from_change'].tolist() == expected['days_from_change'].tolist()
+    
+    def test_window_counts(self, events_df):
+        """Test batched window counts."""
+        index = EventIndex(events_df)
+        
+        counts = index.window_counts(pd.to_datetime(['2020-01-15', '2020-12-31']), window_days=10)
+        
+        assert counts.tolist() == [3, 0]
+    
+    def test_nearest_k(self, events_df):
+        """Test that nearest_k returns the closest events first."""
+        index = EventIndex(events_df)
+        
+        nearest = index.nearest_k(pd.to_datetime(['2020-01-19', '2020-05-20']), k=2)
+        
+        assert nearest.shape == (2, 2)
+        assert events_df['Event'].iloc[nearest[0]].tolist() == ['E2', 'E1']
+        assert events_df['Event'].iloc[nearest[1]].tolist() == ['E4', 'E0']
+    
+    def test_nearest_k_invalid(self, events_df):
+        """Test that a non-positive k raises."""
+        with pytest.raises(ValueError):
+            EventIndex(events_df).nearest_k(pd.to_datetime(['2020-01-01']), k=0)
+    
+    def test_find_nearest_event_matches_dataframe_path(self, events_df):
+        """Test nearest-within-window against find_nearest_event, ties included."""
+        index = EventIndex(events_df)
+        rng = np.random.default_rng(0)
+        dates = pd.Timestamp('2019-12-01') + pd.to_timedelta(rng.integers(0, 240, 50), unit='D')
+        
+        for date in dates:
+            expected = find_nearest_event(date, events_df, window_days=15)
+            result = find_nearest_event(date, index, window_days=15)
+            if expected is None:
+                assert result is None
+            else:
+                assert result['Event'] == expected['Event']
+                assert result['days_from_change'] == expected['days_from_change']
+    
+    def test_nearest_within_window_no_match(self, events_df):
+        """Test that dates without events in the window get -1 and NaN."""
+        positions, days = EventIndex(events_df).nearest_within_window(
+            pd.to_datetime(['2019-01-01']), window_days=5
+        )
+        
+        assert positions.tolist() == [-1]
+        assert np.isnan(days[0])
+    
+    def test_associate_accepts_index(self, events_df):
+        """Test that associations are identical with a prebuilt index."""
+        change_points_df = pd.DataFrame({
+            'change_date': pd.to_datetime(['2020-01-15', '2020-04-01', '2020-09-01'])
+        })
+        
+        expected = associate_change_points_with_events(change_points_df, events_df, window_days=30)
+        result = associate_change_points_with_events(
+            change_points_df, EventIndex(events_df), window_days=30
+        )
+        
+        pd.testing.assert_frame_equal(result, expected)
+    
+    def test_requires_date_column(self):
+        """Test that an events frame without 'Date' raises."""
+        with pytest.raises(ValueError, match="Date"):
+            EventIndex(pd.DataFrame({'Event': ['E1']}))
+
+
+class TestAssociatePosteriorWithEvents:
+    """Test cases for associate_posterior_with_events function."""
+    
+    @pytest.fixture
+    def returns_dates(self):
+        """Daily dates for 100 returns."""
+        return pd.date_range('2020-01-01', periods=100, freq='D')
+    
+    def test_matches_per_sample_loop(self, returns_dates):
+        """Test that probabilities equal the fraction of samples near each event."""
+        rng = np.random.default_rng(1)
+        tau_samples = rng.integers(30, 70, 8000)
+        events_df = pd.DataFrame({
+            'Date': pd.to_datetime(['2020-02-01', '2020-03-15', '2019-06-01', '2020-02-20']),
+            'Event': ['E1', 'E2', 'E3', 'E4'],
+        })
+        
+        result = associate_posterior_with_events(
+            tau_samples, returns_dates, events_df, window_days=5
+        )
+        
+        change_dates = returns_dates[tau_samples]
+        expected = [
+            np.mean(np.abs((change_dates - date).days) <= 5) for date in events_df['Date']
+        ]
+        assert result['event'].tolist() == ['E1', 'E2', 'E3', 'E4']
+        np.testing.assert_allclose(result['posterior_probability'], expected)
+        assert result['posterior_probability'].iloc[2] == 0.0
+    
+    def test_point_mass(self, returns_dates):
+        """Test that a degenerate posterior gives probability 1 inside the window."""
+        events_df = pd.DataFrame({
+            'Date': pd.to_datetime(['2020-01-11', '2020-01-25']),
+            'Event': ['Near', 'Far'],
+        })
+        
+        result = associate_posterior_with_events(
+            np.full(100, 10), returns_dates, events_df, window_days=1
+        )
+        
+        assert result['posterior_probability'].tolist() == [1.0, 0.0]
+    
+    def test_missing_event_date(self, returns_dates):
+        """Test that events without a date get NaN."""
+        events_df = pd.DataFrame({'Date': [pd.Timestamp('2020-01-05'), pd.NaT], 'Event': ['A', 'B']})
+        
+        result = associate_posterior_with_events([4, 5], returns_dates, events_df)
+        
+        assert result['posterior_probability'].iloc[0] == 1.0
+        assert np.isnan(result['posterior_probability'].iloc[1])
+    
+    def test_tau_out_of_range(self, returns_dates):
+        """Test that indices outside returns_dates raise."""
+        events_df = pd.DataFrame({'Date': pd.to_datetime(['2020-01-05'])})
+        
+        with pytest.raises(ValueError):
+            associate_posterior_with_events([100], returns_dates, events_df)
+        with pytest.raises(ValueError):
+            associate_posterior_with_events([], returns_dates, events_df)
+
+
+class TestWindowSensitivity:
+    """Test cases for window_sensitivity function."""
+    
+    @pytest.fixture
+    def change_points_df(self):
+        """Three change points."""
+        return pd.DataFrame({
+            'change_date': pd.to_datetime(['2020-01-15', '2020-03-01', '2020-06-15'])
+        })
+    
+    @pytest.fixture
+    def events_df(self):
+        """Unsorted events at varying distances from the change points."""
+        return pd.DataFrame({
+            'Date': pd.to_datetime([
+                '2020-06-20', '2020-01-20', '2020-01-10', '2020-02-20', '2020-05-01'
+            ]),
+            'Event': ['E1', 'E2', 'E3', 'E4', 'E5'],
+        })
+    
+    def test_matches_single_window_functions(self, change_points_df, events_df):
+        """Test every (window, change point) against the single-window functions."""
+        windows = [3, 5, 10, 30, 60]
+        
+        result = window_sensitivity(change_points_df, events_df, windows=windows)
+        
+        assert len(result) == len(windows) * len(change_points_df)
+        for row in result.itertuples(index=False):
+            matched = match_events_to_change_point(
+                row.change_point_date, events_df, window_days=row.window_days
+            )
+            nearest = find_nearest_event(
+                row.change_point_date, events_df, window_days=row.window_days
+            )
+            assert row.match_count == len(matched)
+            if nearest is None:
+                assert pd.isna(row.nearest_event)
+                assert pd.isna(row.days_from_change)
+            else:
+                assert row.nearest_event == nearest['Event']
+                assert row.days_from_change == nearest['days_from_change']
+    
+    def test_pivot_table(self, change_points_df, events_df):
+        """Test the windows x change points count table."""
+        result = window_sensitivity(change_points_df, events_df, windows=[7, 30])
+        
+        table = result.pivot(index='window_days', columns='change_point_date', values='match_count')
+        
+        assert table.values.tolist() == [[2, 0, 1], [2, 1, 1]]
+    
+    def test_default_windows(self, change_points_df, events_df):
+        """Test that the default sweep covers 7 to 90 days."""
+        result = window_sensitivity(change_points_df, events_df)
+        
+        assert sorted(result['window_days'].unique()) == [7, 14, 30, 60, 90]
+    
+    def test_negative_window(self, change_points_df, events_df):
+        """Test that negative windows raise."""
+        with pytest.raises(ValueError):
+            window_sensitivity(change_points_df, events_df, windows=[-1])
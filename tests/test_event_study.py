@@ -0,0 +1,100 @@
+"""
+Unit tests for the event-study engine.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from src.event_study import event_day_positions, event_study, gather_event_returns
+
+
+@pytest.fixture
+def returns():
+    """Random daily returns on business days."""
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range('2015-01-01', periods=600)
+    return pd.Series(rng.normal(0, 0.02, len(dates)), index=dates, name='Price')
+
+
+@pytest.fixture
+def events_df():
+    """Events on a weekend, a trading day, near the start and past the end."""
+    return pd.DataFrame({
+        'Date': pd.to_datetime(['2016-03-05', '2016-06-15', '2015-01-01', '2030-01-01']),
+        'Event': ['Weekend', 'Midweek', 'Early', 'Future'],
+    })
+
+
+class TestEventDayPositions:
+    """Test cases for event_day_positions function."""
+    
+    def test_day_zero_is_next_trading_day(self, returns, events_df):
+        """Test that weekend events map to the following Monday."""
+        positions = event_day_positions(returns.index, events_df['Date'])
+        
+        assert returns.index[positions[0]] == pd.Timestamp('2016-03-07')
+        assert returns.index[positions[1]] == pd.Timestamp('2016-06-15')
+        assert positions[3] == -1
+
+
+class TestGatherEventReturns:
+    """Test cases for gather_event_returns function."""
+    
+    def test_gather_matrix(self, returns, events_df):
+        """Test shape, values and NaN padding of the gathered matrix."""
+        matrix = gather_event_returns(returns, events_df['Date'], -2, 2)
+        
+        assert matrix.shape == (4, 5)
+        assert list(matrix.columns) == [-2, -1, 0, 1, 2]
+        position = returns.index.get_loc(pd.Timestamp('2016-06-15'))
+        np.testing.assert_allclose(matrix.iloc[1], returns.iloc[position - 2:position + 3])
+        assert matrix.iloc[2, :2].isna().all()
+        assert matrix.iloc[3].isna().all()
+
+
+class TestEventStudy:
+    """Test cases for event_study function."""
+    
+    def test_matches_direct_computation(self, returns, events_df):
+        """Test ARs, CARs and t-stats against a per-event computation."""
+        result = event_study(returns, events_df, event_windows=[(-1, 1), (0, 5)],
+                             estimation_window=(-120, -11))
+        
+        position = returns.index.get_loc(pd.Timestamp('2016-06-15'))
+        estimation = returns.iloc[position - 120:position - 10]
+        abnormal = returns.iloc[position - 1:position + 6] - estimation.mean()
+        
+        np.testing.assert_allclose(result.abnormal_returns.iloc[1], abnormal)
+        assert result.car.iloc[1]['[-1, +1]'] == pytest.approx(abnormal.iloc[:3].sum())
+        assert result.car.iloc[1]['[+0, +5]'] == pytest.approx(abnormal.iloc[1:].sum())
+        expected_t = abnormal.iloc[1:].sum() / (estimation.std() * np.sqrt(6))
+        assert result.t_stats.iloc[1]['[+0, +5]'] == pytest.approx(expected_t)
+        assert result.events['estimation_obs'].iloc[1] == 110
+    
+    def test_insufficient_history(self, returns, events_df):
+        """Test that events without enough estimation data get NaN."""
+        result = event_study(returns, events_df)
+        
+        assert result.car.iloc[2].isna().all()
+        assert result.car.iloc[3].isna().all()
+        assert pd.isna(result.events['day_zero'].iloc[3])
+        assert result.car.iloc[:2].notna().all().all()
+    
+    def test_summary(self, returns, events_df):
+        """Test cross-sectional summary per window."""
+        result = event_study(returns, events_df, event_windows=[(-1, 1), (-5, 5)])
+        summary = result.summary()
+        
+        assert list(summary.index) == ['[-1, +1]', '[-5, +5]']
+        assert summary['n_events'].tolist() == [2, 2]
+        assert summary['mean_car'].iloc[0] == pytest.approx(result.car.iloc[:2, 0].mean())
+    
+    def test_invalid_windows(self, returns, events_df):
+        """Test validation of window specifications."""
+        with pytest.raises(ValueError):
+            event_study(returns, events_df, event_windows=[(5, -5)])
+        with pytest.raises(ValueError):
+            event_study(returns, events_df, event_windows=[(-5, 5)], estimation_window=(-100, -5))
+        with pytest.raises(ValueError, match="Date"):
+            event_study(returns, events_df.rename(columns={'Date': 'When'}))
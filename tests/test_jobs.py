@@ -0,0 +1,185 @@
+"""
+Unit tests for the asynchronous model fit jobs, with a stubbed fit function.
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+import numpy as np
+import pandas as pd
+
+import jobs
+from jobs import JobCancelled, JobManager, JobQueueFull
+from src.config import BayesianModelConfig
+
+FAIL_DRAWS = 13
+BLOCK_TUNE = 7
+TIMEOUT = 60
+
+
+def fake_fit(returns, date_keys, config_fields, progress_path, cancel_path):
+    """Stand-in for fit_change_point: instant, failing or blocking by config."""
+    if config_fields['draws'] == FAIL_DRAWS:
+        raise RuntimeError("sampler diverged")
+    release = Path(progress_path).parent / "release"
+    while config_fields['tune'] == BLOCK_TUNE and not release.exists():
+        if Path(cancel_path).exists():
+            raise JobCancelled()
+        time.sleep(0.01)
+    if Path(cancel_path).exists():
+        raise JobCancelled()
+    return {"observations": len(returns), "first_date": str(pd.Timestamp(date_keys[0]).date())}
+
+
+def wait_until(predicate):
+    deadline = time.monotonic() + TIMEOUT
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise TimeoutError("job did not reach the expected state")
+        time.sleep(0.01)
+
+
+def wait_finished(manager, job):
+    wait_until(lambda: manager.describe(job)["status"] in jobs.FINISHED_STATUSES)
+    return manager.describe(job)
+
+
+@pytest.fixture
+def returns():
+    dates = pd.bdate_range('2020-01-01', periods=50)
+    return pd.Series(np.random.default_rng(0).normal(0, 0.01, size=50), index=dates)
+
+
+@pytest.fixture
+def make_manager(tmp_path):
+    """Factory of JobManagers on one store, shut down (and unblocked) after the test."""
+    managers = []
+    
+    def make(**kwargs):
+        manager = JobManager(tmp_path / "jobs", fit=fake_fit, **kwargs)
+        managers.append(manager)
+        return manager
+    
+    yield make
+    (tmp_path / "jobs").mkdir(parents=True, exist_ok=True)
+    (tmp_path / "jobs" / "release").touch()
+    for manager in managers:
+        manager.shutdown()
+
+
+class TestJobManager:
+    """Test cases for JobManager class."""
+    
+    def test_completes_and_stores(self, make_manager, returns):
+        """Test that a job completes and its result is written to the store."""
+        manager = make_manager()
+        job = manager.submit(returns, BayesianModelConfig(draws=10, tune=10))
+        
+        described = wait_finished(manager, job)
+        assert described["status"] == "completed"
+        assert described["progress"] == 1.0
+        assert described["result"] == {"observations": 50, "first_date": "2020-01-01"}
+        assert described["params"]["observations"] == 50
+        assert (manager.store_dir / f"{job.id}.json").exists()
+        assert manager.stats()["completed"] == 1
+    
+    def test_dedup_by_content_hash(self, make_manager, returns):
+        """Test that identical inputs share a job and different inputs do not."""
+        manager = make_manager()
+        config = BayesianModelConfig(draws=10, tune=10)
+        job = manager.submit(returns, config)
+        
+        assert manager.submit(returns.copy(), BayesianModelConfig(draws=10, tune=10)) is job
+        assert manager.submit(returns.iloc[1:], config).id != job.id
+        assert manager.submit(returns, BayesianModelConfig(draws=11, tune=10)).id != job.id
+        assert JobManager.job_id(returns, config) == job.id
+    
+    def test_reload_from_store(self, make_manager, returns):
+        """Test that a new manager serves stored results without running the fit."""
+        config = BayesianModelConfig(draws=10, tune=10)
+        first = make_manager()
+        job = first.submit(returns, config)
+        result = wait_finished(first, job)["result"]
+        
+        second = make_manager()
+        stored = second.get(job.id)
+        assert stored.status == "completed"
+        assert stored.result == result
+        resubmitted = second.submit(returns, config)
+        assert resubmitted.status == "completed"
+        assert resubmitted.result == result
+        assert second._executor is None
+    
+    def test_failed(self, make_manager, returns):
+        """Test that an exception in the fit marks the job failed and allows a retry."""
+        manager = make_manager()
+        config = BayesianModelConfig(draws=FAIL_DRAWS, tune=10)
+        job = manager.submit(returns, config)
+        
+        described = wait_finished(manager, job)
+        assert described["status"] == "failed"
+        assert described["error"] == "RuntimeError: sampler diverged"
+        assert described["result"] is None
+        assert not (manager.store_dir / f"{job.id}.json").exists()
+        assert manager.submit(returns, config) is not job
+    
+    def test_store_failure_marks_failed(self, make_manager, returns, monkeypatch):
+        """Test that a result that cannot be stored fails the job instead of leaving it queued."""
+        def broken_write(path, payload):
+            raise OSError("disk full")
+        
+        monkeypatch.setattr(jobs, "_write_json", broken_write)
+        manager = make_manager()
+        job = manager.submit(returns, BayesianModelConfig(draws=10, tune=10))
+        
+        described = wait_finished(manager, job)
+        assert described["status"] == "failed"
+        assert "disk full" in described["error"]
+    
+    def test_cancel_running(self, make_manager, returns):
+        """Test that a running job stops at its next cancellation check."""
+        manager = make_manager()
+        job = manager.submit(returns, BayesianModelConfig(draws=10, tune=BLOCK_TUNE))
+        wait_until(lambda: manager.describe(job)["status"] == "running")
+        
+        assert manager.cancel(job.id) is job
+        described = wait_finished(manager, job)
+        assert described["status"] == "cancelled"
+        assert described["result"] is None
+        assert manager.cancel(job.id).status == "cancelled"
+    
+    def test_queue_full_and_cancel_queued(self, make_manager, returns):
+        """Test the pending limit and that cancelling a queued job frees its slot."""
+        manager = make_manager(max_pending=2)
+        running = manager.submit(returns, BayesianModelConfig(draws=10, tune=BLOCK_TUNE))
+        queued = manager.submit(returns, BayesianModelConfig(draws=10, tune=BLOCK_TUNE, random_seed=1))
+        
+        with pytest.raises(JobQueueFull):
+            manager.submit(returns, BayesianModelConfig(draws=10, tune=10))
+        
+        manager.cancel(queued.id)
+        assert wait_finished(manager, queued)["status"] == "cancelled"
+        later = manager.submit(returns, BayesianModelConfig(draws=10, tune=10))
+        
+        (manager.store_dir / "release").touch()
+        assert wait_finished(manager, running)["status"] == "completed"
+        assert wait_finished(manager, later)["status"] == "completed"
+        assert manager.stats() == {"queued": 0, "running": 0, "completed": 2, "failed": 0, "cancelled": 1}
+    
+    def test_unknown_and_invalid_ids(self, make_manager):
+        """Test that unknown or malformed job ids return None."""
+        manager = make_manager()
+        
+        assert manager.get("0" * 24) is None
+        assert manager.get("../../etc/passwd") is None
+        assert manager.cancel("0" * 24) is None
+    
+    def test_invalid_arguments(self, make_manager, returns):
+        """Test validation of pool sizes and of the returns."""
+        with pytest.raises(ValueError):
+            make_manager(max_workers=0)
+        with pytest.raises(ValueError):
+            make_manager(max_pending=0)
+        with pytest.raises(ValueError):
+            make_manager().submit(returns.iloc[:1], BayesianModelConfig())
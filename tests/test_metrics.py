@@ -0,0 +1,173 @@
+"""
+Unit tests for the dashboard API's summary metrics.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from metrics import MetricsSnapshot, RangeMetrics, _ArgExtremum, _Moments
+
+
+@pytest.fixture(scope="module")
+def price_data():
+    """Prices, log returns, 30-day volatility and event dates, as loaded by the API."""
+    dates = pd.bdate_range('2000-01-03', periods=700, name='Date')
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({'Price': (60 * np.exp(np.cumsum(rng.normal(0, 0.02, size=700)))).round(1)}, index=dates)
+    df['log_return'] = np.log(df['Price']).diff()
+    rolling_vol = df['log_return'].rolling(30).std()
+    event_dates = pd.to_datetime(['2000-02-01', '2000-06-15', None, '2001-03-01', '2001-03-01', '2002-01-02'])
+    return df, rolling_vol, pd.Series(event_dates)
+
+
+def none_if_nan(value):
+    return None if pd.isna(value) else float(value)
+
+
+def reference_metrics(df, rolling_vol, event_dates, start, end):
+    """The /metrics statistics of [start, end] computed with pandas."""
+    window = df.loc[start:end]
+    vol = rolling_vol.loc[start:end]
+    price, ret = window['Price'], window['log_return']
+    
+    def idx(series, largest):
+        if series.isna().all():
+            return None
+        return (series.idxmax() if largest else series.idxmin()).strftime('%Y-%m-%d')
+    
+    dates = event_dates.dropna()
+    return {
+        "price_statistics": {
+            "mean": none_if_nan(price.mean()), "std": none_if_nan(price.std()),
+            "min": none_if_nan(price.min()), "max": none_if_nan(price.max()),
+            "min_date": idx(price, False), "max_date": idx(price, True),
+        },
+        "returns_statistics": {
+            "mean": none_if_nan(ret.mean()), "std": none_if_nan(ret.std()),
+            "min": none_if_nan(ret.min()), "max": none_if_nan(ret.max()),
+        },
+        "volatility_statistics": {
+            "mean_30day": none_if_nan(vol.mean()), "max_30day": none_if_nan(vol.max()),
+            "max_vol_date": idx(vol, True),
+        },
+        "date_range": {
+            "start": window.index.min().strftime('%Y-%m-%d') if len(window) else None,
+            "end": window.index.max().strftime('%Y-%m-%d') if len(window) else None,
+            "total_days": (window.index.max() - window.index.min()).days if len(window) else 0,
+            "total_observations": len(window),
+        },
+        "total_events": int(((dates >= start) & (dates <= end)).sum()),
+    }
+
+
+def assert_metrics_equal(result, expected):
+    assert result.keys() == expected.keys()
+    for section, values in expected.items():
+        if not isinstance(values, dict):
+            assert result[section] == values, section
+            continue
+        for name, value in values.items():
+            if isinstance(value, float):
+                assert result[section][name] == pytest.approx(value, rel=1e-9, abs=1e-12), (section, name)
+            else:
+                assert result[section][name] == value, (section, name)
+
+
+class TestMoments:
+    """Test cases for the _Moments prefix sums."""
+    
+    def test_matches_pandas(self):
+        """Test mean and std of random slices, skipping NaN like pandas."""
+        rng = np.random.default_rng(0)
+        values = 1e4 + rng.normal(0, 1, size=300)
+        values[rng.choice(300, 30, replace=False)] = np.nan
+        moments = _Moments(values)
+        
+        for lo, hi in rng.integers(0, 301, size=(200, 2)):
+            lo, hi = int(min(lo, hi)), int(max(lo, hi))
+            mean, std = moments.mean_std(lo, hi)
+            series = pd.Series(values[lo:hi])
+            assert mean == (pytest.approx(series.mean(), rel=1e-12) if series.count() else None)
+            assert std == (pytest.approx(series.std(), rel=1e-6) if series.count() > 1 else None)
+
+
+class TestArgExtremum:
+    """Test cases for the _ArgExtremum sparse table."""
+    
+    @pytest.mark.parametrize('largest', [False, True])
+    def test_matches_numpy(self, largest):
+        """Test random ranges with ties and NaN against a direct scan."""
+        rng = np.random.default_rng(1)
+        values = rng.integers(0, 20, size=257).astype(float)
+        values[rng.choice(257, 40, replace=False)] = np.nan
+        table = _ArgExtremum(values, largest=largest)
+        
+        for lo, hi in rng.integers(0, 258, size=(300, 2)):
+            lo, hi = int(min(lo, hi)), int(max(lo, hi))
+            window = pd.Series(values[lo:hi])
+            if window.isna().all():
+                assert table.query(lo, hi) is None
+            else:
+                expected = window.idxmax() if largest else window.idxmin()
+                assert table.query(lo, hi) == lo + expected
+    
+    def test_ties_go_to_earlier_position(self):
+        """Test that equal extrema resolve to the first occurrence."""
+        values = np.array([3.0, 1.0, 3.0, 1.0])
+        
+        assert _ArgExtremum(values, largest=True).query(0, 4) == 0
+        assert _ArgExtremum(values, largest=False).query(0, 4) == 1
+        assert _ArgExtremum(values, largest=False).query(2, 4) == 3
+
+
+class TestRangeMetrics:
+    """Test cases for RangeMetrics class."""
+    
+    def test_random_ranges_match_pandas(self, price_data):
+        """Test random date ranges against pandas on the sliced frame."""
+        df, rolling_vol, event_dates = price_data
+        metrics = RangeMetrics(df, rolling_vol, event_dates)
+        rng = np.random.default_rng(2)
+        span = pd.date_range(df.index[0] - pd.Timedelta(days=10), df.index[-1] + pd.Timedelta(days=10))
+        
+        for a, b in rng.integers(0, len(span), size=(100, 2)):
+            start, end = span[min(a, b)], span[max(a, b)]
+            expected = reference_metrics(df, rolling_vol, event_dates, start, end)
+            assert_metrics_equal(metrics.compute(start, end), expected)
+    
+    def test_single_day(self, price_data):
+        """Test a one-observation range: std is None and the day is its own extremum."""
+        df, rolling_vol, event_dates = price_data
+        day = df.index[100]
+        result = RangeMetrics(df, rolling_vol, event_dates).compute(day, day)
+        
+        assert_metrics_equal(result, reference_metrics(df, rolling_vol, event_dates, day, day))
+        assert result["price_statistics"]["std"] is None
+        assert result["price_statistics"]["min_date"] == day.strftime('%Y-%m-%d')
+        assert result["date_range"]["total_days"] == 0
+    
+    @pytest.mark.parametrize('start, end', [
+        ('2000-01-08', '2000-01-09'),
+        ('1990-01-01', '1999-12-31'),
+        ('2005-01-01', '2006-01-01'),
+        ('2001-01-10', '2001-01-01'),
+    ])
+    def test_empty_range(self, price_data, start, end):
+        """Test that ranges without observations give None statistics."""
+        df, rolling_vol, event_dates = price_data
+        result = RangeMetrics(df, rolling_vol, event_dates).compute(start, end)
+        
+        assert all(value is None for value in result["price_statistics"].values())
+        assert all(value is None for value in result["returns_statistics"].values())
+        assert all(value is None for value in result["volatility_statistics"].values())
+        assert result["date_range"] == {"start": None, "end": None, "total_days": 0, "total_observations": 0}
+        assert result["total_events"] == 0
+    
+    def test_full_range_matches_snapshot(self, price_data):
+        """Test that an unbounded range equals the full-history snapshot."""
+        df, rolling_vol, event_dates = price_data
+        result = RangeMetrics(df, rolling_vol, event_dates).compute()
+        snapshot = MetricsSnapshot.build(df, rolling_vol, event_dates.count()).to_dict()
+        
+        assert_metrics_equal(result, snapshot)
@@ -0,0 +1,118 @@
+"""
+Unit tests for online rolling statistics.
+"""
+
+import json
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from src.online import (
+    OnlineRollingMean,
+    OnlineRollingVolatility,
+    RollingWindowStatistics,
+)
+from src.preprocessing import calculate_rolling_mean, calculate_rolling_volatility
+
+
+@pytest.fixture
+def returns():
+    rng = np.random.default_rng(0)
+    return pd.Series(rng.normal(0, 0.02, size=500))
+
+
+class TestRollingWindowStatistics:
+    """Test cases for RollingWindowStatistics."""
+    
+    @pytest.mark.parametrize("window", [1, 2, 30])
+    def test_matches_batch_functions(self, returns, window):
+        """Test that streaming results match the batch pandas versions."""
+        estimator = RollingWindowStatistics(window)
+        streamed = estimator.update_many(returns)
+        
+        np.testing.assert_allclose(
+            streamed['mean'], calculate_rolling_mean(returns, window), atol=1e-12
+        )
+        np.testing.assert_allclose(
+            streamed['std'], calculate_rolling_volatility(returns, window), atol=1e-12
+        )
+    
+    def test_nan_in_window(self, returns):
+        """Test that windows containing NaN yield NaN like pandas."""
+        values = returns.copy()
+        values.iloc[100] = np.nan
+        streamed = RollingWindowStatistics(10).update_many(values)
+        
+        np.testing.assert_allclose(
+            streamed['std'], values.rolling(10).std(), atol=1e-12
+        )
+    
+    def test_stable_for_large_offsets(self):
+        """Test numerical stability for values with a large common offset."""
+        rng = np.random.default_rng(1)
+        values = 1e6 + rng.normal(0, 1e-3, size=20000)
+        estimator = RollingWindowStatistics(50)
+        for value in values:
+            estimator.update(value)
+        
+        assert np.isclose(estimator.std, values[-50:].std(ddof=1), rtol=1e-6)
+    
+    def test_from_series_warm_start(self, returns):
+        """Test that warming up from history matches streaming from scratch."""
+        warm = RollingWindowStatistics.from_series(returns, 30)
+        
+        assert np.isclose(warm.std, returns.iloc[-30:].std())
+        assert np.isclose(warm.mean, returns.iloc[-30:].mean())
+    
+    def test_invalid_window(self):
+        """Test that non-positive windows raise ValueError."""
+        with pytest.raises(ValueError, match="window"):
+            RollingWindowStatistics(0)
+
+
+class TestOnlineEstimators:
+    """Test cases for OnlineRollingMean and OnlineRollingVolatility."""
+    
+    def test_rolling_mean_update(self):
+        """Test that OnlineRollingMean.value is the mean after each update."""
+        estimator = OnlineRollingMean(3)
+        results = [estimator.update(v).value for v in [1.0, 2.0, 3.0, 4.0]]
+        
+        assert np.isnan(results[0]) and np.isnan(results[1])
+        assert results[2:] == [2.0, 3.0]
+    
+    def test_update_price(self):
+        """Test that update_price feeds log returns."""
+        prices = pd.Series([100.0, 101.0, 99.0, 102.0, 103.0, 101.5])
+        estimator = OnlineRollingVolatility(3)
+        results = [estimator.update_price(p).value for p in prices]
+        expected = calculate_rolling_volatility(np.log(prices).diff().dropna(), 3)
+        
+        assert np.isnan(results[0])
+        np.testing.assert_allclose(results[1:], expected, atol=1e-12)
+    
+    @pytest.mark.parametrize('cls, statistic', [
+        (RollingWindowStatistics, 'mean'),
+        (OnlineRollingMean, 'mean'),
+        (OnlineRollingVolatility, 'std'),
+    ])
+    def test_update_returns_estimator(self, cls, statistic):
+        """Test that every estimator's update chains and value is its statistic."""
+        estimator = cls(2)
+        
+        assert estimator.update(1.0).update(3.0) is estimator
+        assert estimator.value == getattr(estimator, statistic)
+    
+    def test_state_round_trip(self, returns):
+        """Test that serialized state restores an identical estimator."""
+        estimator = OnlineRollingVolatility.from_series(returns.iloc[:300], 30)
+        estimator.last_price = 80.0
+        
+        restored = OnlineRollingVolatility.from_dict(
+            json.loads(json.dumps(estimator.to_dict()))
+        )
+        
+        assert restored.last_price == 80.0
+        for value in returns.iloc[300:350]:
+            assert np.isclose(estimator.update(value).value, restored.update(value).value)
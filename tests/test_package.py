@@ -0,0 +1,66 @@
+"""
+Unit tests for package-level imports.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from src.constants import PROJECT_ROOT
+
+HEAVY_MODULES = ("pymc", "arviz", "pytensor", "statsmodels")
+
+
+def _import_time_modules(statement: str) -> set:
+    """Return the set of modules imported by ``statement`` according to -X importtime."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = set()
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        name = line.rsplit("|", 1)[1].strip()
+        modules.add(name.split(".")[0])
+    return modules
+
+
+class TestLazyImports:
+    """Test cases for lazy loading of heavy submodules."""
+    
+    def test_import_package_skips_heavy_modules(self):
+        """Test that importing the package does not import PyMC and friends."""
+        modules = _import_time_modules("import src")
+        
+        assert "src" in modules
+        for heavy in HEAVY_MODULES:
+            assert heavy not in modules
+    
+    def test_lightweight_functions_skip_heavy_modules(self):
+        """Test that data loading and preprocessing helpers stay lightweight."""
+        modules = _import_time_modules(
+            "from src import load_brent_data, calculate_returns, load_events_data"
+        )
+        
+        for heavy in HEAVY_MODULES:
+            assert heavy not in modules
+    
+    def test_public_api_unchanged(self):
+        """Test that every name in __all__ is still resolvable."""
+        import src
+        
+        for name in src.__all__:
+            assert hasattr(src, name)
+        assert "build_change_point_model" in dir(src)
+    
+    def test_unknown_attribute_raises(self):
+        """Test that unknown attributes raise AttributeError."""
+        import src
+        
+        with pytest.raises(AttributeError):
+            src.does_not_exist
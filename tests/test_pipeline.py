@@ -0,0 +1,136 @@
+"""
+Unit tests for the memoized analysis pipeline.
+"""
+
+import csv
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from src.config import DataConfig, EventMatchingConfig, PreprocessingConfig, ProjectConfig
+from src.constants import RETURN_METHOD_SIMPLE
+from src.pipeline import Pipeline, Stage, default_stages
+
+
+def fake_model_stage(model_config, returns):
+    """Stand-in for MCMC sampling: the change point is the largest move."""
+    return {'tau': int(np.argmax(np.abs(returns.values)))}
+
+
+def fake_extract_stage(model_config, trace, returns):
+    return {'change_point_date': returns.index[trace['tau']], 'change_point_index': trace['tau']}
+
+
+@pytest.fixture
+def project_config(tmp_path):
+    prices_path = tmp_path / 'prices.csv'
+    with open(prices_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Date', 'Price'])
+        for day, price in zip(range(1, 29), np.linspace(20, 30, 28)):
+            writer.writerow([f'{day:02d}-Feb-99', f'{price:.2f}'])
+        writer.writerow(['01-Mar-99', '45.00'])
+        writer.writerow(['02-Mar-99', '45.50'])
+    
+    events_path = tmp_path / 'events.csv'
+    pd.DataFrame({
+        'Date': ['1999-02-25', '1999-06-01'],
+        'Event': ['Supply shock', 'Unrelated'],
+        'Description': ['Desc1', 'Desc2'],
+    }).to_csv(events_path, index=False)
+    
+    data = DataConfig(brent_oil_prices_path=prices_path, key_events_path=events_path)
+    return ProjectConfig(data=data)
+
+
+@pytest.fixture
+def pipeline(project_config, tmp_path):
+    pipe = Pipeline(project_config, cache_dir=tmp_path / 'cache')
+    pipe.replace_stage('model', func=fake_model_stage)
+    pipe.replace_stage('extract', func=fake_extract_stage)
+    return pipe
+
+
+class TestPipeline:
+    """Test cases for the Pipeline runner."""
+    
+    def test_default_stage_order(self):
+        """Test that default stages are in dependency order."""
+        names = [stage.name for stage in default_stages()]
+        
+        assert names == ['load', 'returns', 'model', 'extract', 'associate']
+    
+    def test_full_run(self, pipeline):
+        """Test that a first run executes every stage and reports timings."""
+        result = pipeline.run()
+        
+        assert result.executed == pipeline.stages
+        assert result['extract']['change_point_date'] == pd.Timestamp('1999-03-01')
+        associations = result['associate']
+        assert associations['event'].tolist() == ['Supply shock']
+        
+        summary = result.summary()
+        assert list(summary.index) == pipeline.stages
+        assert (summary['seconds'] >= 0).all()
+    
+    def test_rerun_uses_cache(self, pipeline):
+        """Test that an unchanged rerun executes nothing."""
+        first = pipeline.run()
+        second = pipeline.run()
+        
+        assert second.executed == []
+        assert second.keys == first.keys
+    
+    def test_persisted_outputs(self, pipeline, project_config, tmp_path):
+        """Test that a fresh Pipeline reuses outputs persisted on disk."""
+        pipeline.run()
+        
+        fresh = Pipeline(project_config, cache_dir=tmp_path / 'cache')
+        fresh.replace_stage('model', func=fake_model_stage)
+        fresh.replace_stage('extract', func=fake_extract_stage)
+        
+        assert fresh.run().executed == []
+    
+    def test_config_change_reruns_downstream_only(self, pipeline):
+        """Test that changing a config section reruns only affected stages."""
+        pipeline.run()
+        pipeline.config.event_matching = EventMatchingConfig(window_days=1)
+        
+        result = pipeline.run()
+        
+        assert result.executed == ['associate']
+        assert result['associate']['event'].tolist() == ['No major recorded event']
+    
+    def test_preprocessing_change_invalidates_chain(self, pipeline):
+        """Test that upstream changes propagate through dependency keys."""
+        pipeline.run()
+        pipeline.config.preprocessing = PreprocessingConfig(return_method=RETURN_METHOD_SIMPLE)
+        
+        assert pipeline.run().executed == ['returns', 'model', 'extract', 'associate']
+    
+    def test_input_file_change(self, pipeline, project_config):
+        """Test that editing a data file reruns the whole chain."""
+        pipeline.run()
+        with open(project_config.data.key_events_path, 'a') as f:
+            f.write('1999-03-02,Another event,Desc3\n')
+        
+        result = pipeline.run()
+        
+        assert result.executed == pipeline.stages
+        assert len(result['associate']) == 2
+    
+    def test_targets_and_force(self, pipeline):
+        """Test running a subset of stages and forcing recomputation."""
+        result = pipeline.run(targets=['returns'])
+        assert list(result.outputs) == ['load', 'returns']
+        
+        result = pipeline.run(targets=['returns'], force=['returns'])
+        assert result.executed == ['returns']
+    
+    def test_unknown_dependency(self, project_config):
+        """Test that stages with unknown dependencies are rejected."""
+        pipe = Pipeline(project_config, stages=[], persist=False)
+        
+        with pytest.raises(ValueError, match="unknown stages"):
+            pipe.add_stage(Stage('returns', fake_model_stage, ('load',)))
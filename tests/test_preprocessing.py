@@ -10,6 +10,8 @@ from src.preprocessing import (
     calculate_returns,
     calculate_rolling_volatility,
     calculate_rolling_mean,
+    build_features,
+    calculate_multi_window_volatility,
 )
 from src.config import PreprocessingConfig
 from src.constants import RETURN_METHOD_LOG, RETURN_METHOD_SIMPLE
@@ -112,3 +114,111 @@ class TestRollingMean:
         # Later values should be non-NaN
         assert not rolling.iloc[5:].isna().any()
 
+
+
+class TestBuildFeatures:
+    """Test cases for build_features function."""
+    
+    @pytest.fixture
+    def price_df(self):
+        dates = pd.date_range('2020-01-01', periods=300, freq='D')
+        rng = np.random.default_rng(0)
+        prices = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, size=300)))
+        return pd.DataFrame({'Price': prices}, index=dates)
+    
+    def test_matches_individual_functions(self, price_df):
+        """Test that fused features match the per-call pandas functions."""
+        features = build_features(price_df, windows=[5, 30])
+        log_returns = np.log(price_df['Price']).diff()
+        
+        assert features.index.equals(price_df.index)
+        pd.testing.assert_series_equal(
+            features['log_return'].iloc[1:],
+            calculate_returns(price_df, method=RETURN_METHOD_LOG),
+            check_names=False,
+        )
+        pd.testing.assert_series_equal(
+            features['simple_return'].iloc[1:],
+            calculate_returns(price_df, method=RETURN_METHOD_SIMPLE),
+            check_names=False,
+        )
+        for window in [5, 30]:
+            pd.testing.assert_series_equal(
+                features[f'volatility_{window}'],
+                calculate_rolling_volatility(log_returns, window=window),
+                check_names=False,
+                atol=1e-10,
+            )
+            pd.testing.assert_series_equal(
+                features[f'price_mean_{window}'],
+                calculate_rolling_mean(price_df['Price'], window=window),
+                check_names=False,
+            )
+    
+    def test_annualized_columns(self, price_df):
+        """Test annualized volatility and mean return columns."""
+        features = build_features(price_df, windows=[30], annualization_factor=252)
+        
+        np.testing.assert_allclose(
+            features['volatility_30_annualized'],
+            features['volatility_30'] * np.sqrt(252),
+        )
+        expected_mean = features['log_return'].rolling(30).mean() * 252
+        np.testing.assert_allclose(
+            features['return_mean_30_annualized'], expected_mean, atol=1e-12
+        )
+    
+    def test_window_from_config(self, price_df):
+        """Test that the default window comes from PreprocessingConfig."""
+        config = PreprocessingConfig(rolling_window=10)
+        features = build_features(price_df, config=config)
+        
+        assert 'volatility_10' in features.columns
+    
+    def test_window_longer_than_data(self, price_df):
+        """Test that an oversized window yields all-NaN columns."""
+        features = build_features(price_df.iloc[:5], windows=[10])
+        
+        assert features['volatility_10'].isna().all()
+        assert features['price_mean_10'].isna().all()
+    
+    def test_invalid_window(self, price_df):
+        """Test that non-positive windows raise ValueError."""
+        with pytest.raises(ValueError, match="windows"):
+            build_features(price_df, windows=[0])
+    
+    def test_missing_price_column(self):
+        """Test that ValueError is raised when Price column is missing."""
+        with pytest.raises(ValueError, match="Price"):
+            build_features(pd.DataFrame({'OtherColumn': [1.0, 2.0]}))
+
+
+class TestMultiWindowVolatility:
+    """Test cases for calculate_multi_window_volatility function."""
+    
+    def test_matches_looped_rolling_volatility(self):
+        """Test that batched volatility matches one call per window."""
+        dates = pd.date_range('2020-01-01', periods=400, freq='D')
+        rng = np.random.default_rng(0)
+        returns = pd.Series(rng.normal(0, 0.02, size=400), index=dates)
+        returns.iloc[0] = np.nan
+        windows = [5, 10, 21, 30, 63, 126, 252]
+        
+        result = calculate_multi_window_volatility(returns, windows)
+        
+        assert list(result.columns) == windows
+        assert result.index.equals(returns.index)
+        for window in windows:
+            pd.testing.assert_series_equal(
+                result[window],
+                calculate_rolling_volatility(returns, window=window),
+                check_names=False,
+                atol=1e-10,
+            )
+    
+    def test_empty_windows(self):
+        """Test that an empty window list raises ValueError."""
+        returns = pd.Series([0.01, -0.02, 0.03])
+        
+        with pytest.raises(ValueError, match="windows"):
+            calculate_multi_window_volatility(returns, [])
@@ -0,0 +1,282 @@
+"""
+Unit tests for the dashboard API response cache.
+"""
+
+import gzip
+
+import numpy as np
+import pytest
+from flask import Flask, Response
+from werkzeug.datastructures import MultiDict
+
+from compression import GZIP, MIN_COMPRESS_BYTES, brotli
+from response_cache import ResponseCache
+
+LARGE_BODY = b'{"data":[' + b'61.25,' * 2000 + b'0]}'
+RANDOM_BODY = np.random.default_rng(0).bytes(4 * MIN_COMPRESS_BYTES)
+
+
+@pytest.fixture
+def cache():
+    return ResponseCache(max_entries=3)
+
+
+@pytest.fixture
+def client(cache):
+    """Test client of an app with a cached route that counts its calls."""
+    app = Flask(__name__)
+    app.calls = 0
+    
+    @app.route("/items")
+    @cache.cached
+    def items():
+        app.calls += 1
+        return Response(b'{"n":%d}' % app.calls, mimetype="application/json")
+    
+    @app.route("/large")
+    @cache.cached
+    def large():
+        app.calls += 1
+        return Response(LARGE_BODY, mimetype="application/json")
+    
+    @app.route("/random")
+    @cache.cached
+    def random():
+        return Response(RANDOM_BODY, mimetype="application/octet-stream")
+    
+    @app.route("/missing")
+    @cache.cached
+    def missing():
+        app.calls += 1
+        return Response(b'{"status":"error"}', status=404, mimetype="application/json")
+    
+    client = app.test_client()
+    client.app = app
+    return client
+
+
+class TestMakeKey:
+    """Test cases for ResponseCache.make_key."""
+    
+    def test_normalized(self):
+        """Test that argument order and empty values do not change the key."""
+        first = ResponseCache.make_key("/prices", MultiDict([("b", "2"), ("a", "1"), ("c", "")]))
+        second = ResponseCache.make_key("/prices", MultiDict([("a", "1"), ("b", "2")]))
+        
+        assert first == second
+        assert first != ResponseCache.make_key("/prices", MultiDict([("a", "2"), ("b", "2")]))
+        assert first != ResponseCache.make_key("/events", MultiDict([("a", "1"), ("b", "2")]))
+
+
+class TestResponseCache:
+    """Test cases for ResponseCache storage."""
+    
+    def test_lru_bound(self, cache):
+        """Test that the least recently used entry is evicted beyond max_entries."""
+        for name in "abc":
+            cache.put(name, name.encode(), "application/json", cache.version)
+        cache.get("a")
+        cache.put("d", b"d", "application/json", cache.version)
+        
+        assert len(cache) == 3
+        assert cache.get("b") is None
+        assert [cache.get(name).body for name in "acd"] == [b"a", b"c", b"d"]
+    
+    def test_put_after_invalidate(self, cache):
+        """Test that a body computed against an old version is returned but not stored."""
+        version = cache.version
+        assert cache.invalidate() == version + 1
+        
+        entry = cache.put("a", b"stale", "application/json", version)
+        assert entry.body == b"stale"
+        assert cache.get("a") is None
+        assert len(cache) == 0
+    
+    def test_invalidate_drops_entries(self, cache):
+        """Test that invalidate empties the cache."""
+        cache.put("a", b"a", "application/json", cache.version)
+        cache.invalidate()
+        
+        assert cache.get("a") is None
+    
+    def test_etag_follows_body(self, cache):
+        """Test that ETags depend on the body only, not on the version or instance."""
+        first = cache.put("a", b"body", "application/json", cache.version)
+        cache.invalidate()
+        second = ResponseCache().put("a", b"body", "application/json", 0)
+        
+        assert first.etag == second.etag
+        assert cache.put("a", b"other", "application/json", cache.version).etag != first.etag
+    
+    def test_invalid_max_entries(self):
+        """Test that a non-positive capacity raises ValueError."""
+        with pytest.raises(ValueError):
+            ResponseCache(max_entries=0)
+
+
+class TestCachedView:
+    """Test cases for the ResponseCache.cached decorator."""
+    
+    def test_hit_skips_view(self, client, cache):
+        """Test that a repeated request is served from the cache."""
+        first = client.get("/items")
+        second = client.get("/items")
+        
+        assert first.data == second.data == b'{"n":1}'
+        assert client.app.calls == 1
+        assert cache.stats()["hits"] == 1
+        assert first.headers["Cache-Control"] == "no-cache"
+    
+    def test_not_modified(self, client):
+        """Test that a matching If-None-Match gets an empty 304."""
+        etag = client.get("/items").headers["ETag"]
+        response = client.get("/items", headers={"If-None-Match": etag})
+        
+        assert response.status_code == 304
+        assert response.data == b""
+        assert response.headers["ETag"] == etag
+        assert client.get("/items", headers={"If-None-Match": '"other"'}).status_code == 200
+    
+    def test_etag_changes_after_invalidate(self, client, cache):
+        """Test that an ETag from before a reload no longer matches a changed body."""
+        etag = client.get("/items").headers["ETag"]
+        cache.invalidate()
+        response = client.get("/items", headers={"If-None-Match": etag})
+        
+        assert response.status_code == 200
+        assert response.data == b'{"n":2}'
+    
+    def test_errors_not_cached(self, client, cache):
+        """Test that non-200 responses pass through uncached."""
+        assert client.get("/missing").status_code == 404
+        assert client.get("/missing").status_code == 404
+        
+        assert client.app.calls == 2
+        assert len(cache) == 0
+        assert "ETag" not in client.get("/missing").headers
+
+
+class TestGetOrBuild:
+    """Test cases for ResponseCache.get_or_build."""
+    
+    def test_builds_once(self, cache):
+        """Test that the body is built on a miss and reused afterwards."""
+        calls = []
+        
+        def build():
+            calls.append(1)
+            return b'{"n":1}'
+        
+        first = cache.get_or_build("/items", MultiDict(), build)
+        second = cache.get_or_build("/items", MultiDict([("unused", "")]), build)
+        
+        assert first == second == b'{"n":1}'
+        assert len(calls) == 1
+    
+    def test_shared_with_cached_route(self, client, cache):
+        """Test that a built entry is served by the route, and the route's entry is reused."""
+        cache.get_or_build("/items", MultiDict(), lambda: b'{"n":"built"}')
+        
+        assert client.get("/items").data == b'{"n":"built"}'
+        assert client.app.calls == 0
+        
+        client.get("/large")
+        assert cache.get_or_build("/large", MultiDict(), lambda: b"unused") == LARGE_BODY
+    
+    def test_not_stored_after_invalidate(self, cache):
+        """Test that a body built while the data was reloaded is returned but not stored."""
+        def build():
+            cache.invalidate()
+            return b"stale"
+        
+        assert cache.get_or_build("/items", MultiDict(), build) == b"stale"
+        assert len(cache) == 0
+    
+    def test_not_stored_for_stale_version(self, cache):
+        """Test that a body built from data older than the current version is not stored."""
+        version = cache.version
+        cache.invalidate()
+        
+        assert cache.get_or_build("/items", MultiDict(), lambda: b"stale", version=version) == b"stale"
+        assert len(cache) == 0
+        assert cache.get_or_build("/items", MultiDict(), lambda: b"fresh", version=cache.version) == b"fresh"
+        assert len(cache) == 1
+    
+    def test_media_type_in_key(self):
+        """Test that entries of different media types do not collide."""
+        cache = ResponseCache(media_types=("application/json", "text/csv"))
+        cache.get_or_build("/items", MultiDict(), lambda: b"json")
+        
+        assert cache.get_or_build("/items", MultiDict(), lambda: b"csv", mimetype="text/csv") == b"csv"
+        assert cache.get_or_build("/items", MultiDict(), lambda: b"other") == b"json"
+
+
+class TestCompression:
+    """Test cases for compressed responses from the cache."""
+    
+    def test_gzip_variant(self, client, cache):
+        """Test that gzip is applied with a suffixed ETag and compressed once."""
+        plain = client.get("/large")
+        first = client.get("/large", headers={"Accept-Encoding": "gzip"})
+        second = client.get("/large", headers={"Accept-Encoding": "gzip"})
+        
+        assert "Content-Encoding" not in plain.headers
+        assert first.headers["Content-Encoding"] == GZIP
+        assert gzip.decompress(first.data) == plain.data == LARGE_BODY
+        assert first.headers["ETag"] == plain.headers["ETag"][:-1] + '-gzip"'
+        assert second.data == first.data
+        assert cache.stats()["compressions"] == 1
+        assert client.app.calls == 1
+    
+    def test_vary(self, client):
+        """Test that responses vary on Accept-Encoding whether or not they are compressed."""
+        for path in ["/items", "/large"]:
+            for headers in [{}, {"Accept-Encoding": "gzip"}]:
+                assert "Accept-Encoding" in client.get(path, headers=headers).headers["Vary"]
+    
+    def test_brotli_preferred(self, client):
+        """Test that brotli is chosen over gzip when installed and accepted."""
+        if brotli is None:
+            pytest.skip("brotli is not installed")
+        response = client.get("/large", headers={"Accept-Encoding": "gzip, br"})
+        
+        assert response.headers["Content-Encoding"] == "br"
+        assert response.headers["ETag"].endswith('-br"')
+        assert brotli.decompress(response.data) == LARGE_BODY
+    
+    def test_variant_not_modified(self, client):
+        """Test that the variant ETag revalidates only for the same encoding."""
+        etag = client.get("/large", headers={"Accept-Encoding": "gzip"}).headers["ETag"]
+        
+        same = client.get("/large", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+        other = client.get("/large", headers={"If-None-Match": etag})
+        assert same.status_code == 304
+        assert other.status_code == 200
+        assert other.data == LARGE_BODY
+    
+    def test_small_body_not_compressed(self, client, cache):
+        """Test that bodies under MIN_COMPRESS_BYTES are sent as is."""
+        response = client.get("/items", headers={"Accept-Encoding": "gzip"})
+        
+        assert "Content-Encoding" not in response.headers
+        assert not response.headers["ETag"].endswith('-gzip"')
+        assert cache.stats()["compressions"] == 0
+    
+    def test_incompressible_body(self, client, cache):
+        """Test that a body that would not shrink is sent as is, and only tried once."""
+        for _ in range(2):
+            response = client.get("/random", headers={"Accept-Encoding": "gzip"})
+            assert "Content-Encoding" not in response.headers
+            assert response.data == RANDOM_BODY
+        
+        assert cache.stats()["compressions"] == 1
+    
+    def test_compression_disabled(self):
+        """Test that compression=False serves identity without Vary: Accept-Encoding."""
+        cache = ResponseCache(compression=False)
+        app = Flask(__name__)
+        app.add_url_rule("/large", "large", cache.cached(lambda: Response(LARGE_BODY, mimetype="application/json")))
+        response = app.test_client().get("/large", headers={"Accept-Encoding": "gzip"})
+        
+        assert "Content-Encoding" not in response.headers
+        assert "Accept-Encoding" not in response.headers.get("Vary", "")
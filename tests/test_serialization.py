@@ -0,0 +1,212 @@
+"""
+Unit tests for the dashboard API's pre-encoded JSON serialization.
+"""
+
+import json
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from serialization import (
+    JsonRecords,
+    PricePayload,
+    SortedPager,
+    decode_cursor,
+    encode_cursor,
+    parse_fields,
+)
+
+
+@pytest.fixture
+def price_df():
+    """Prices with a missing return, as loaded by the API."""
+    dates = pd.bdate_range('2020-01-01', periods=40, name='Date')
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'Price': 60 + rng.normal(0, 1, size=40).round(2)}, index=dates)
+    df['log_return'] = np.log(df['Price']).diff()
+    return df
+
+
+@pytest.fixture
+def events_df():
+    """Events out of date order, with a shared date and a missing date."""
+    return pd.DataFrame({
+        'Date': pd.to_datetime(['2020-03-01', '2020-01-15', None, '2020-01-15', '2020-02-10']),
+        'Event': ['C', 'A', 'Undated', 'B', 'D'],
+        'Impact': [1.5, np.nan, 2.0, 3, 4],
+    })
+
+
+def expected_prices(df, fields=None):
+    """Reference /prices records built with json.dumps."""
+    records = [
+        {'Date': date.strftime('%Y-%m-%d'), 'Price': price, 'log_return': None if np.isnan(ret) else ret}
+        for date, price, ret in zip(df.index, df['Price'], df['log_return'])
+    ]
+    if fields is not None:
+        records = [{name: record[name] for name in fields} for record in records]
+    return records
+
+
+class TestParseFields:
+    """Test cases for parse_fields function."""
+    
+    def test_parse(self):
+        """Test splitting, stripping and de-duplication."""
+        assert parse_fields(None) is None
+        assert parse_fields('') is None
+        assert parse_fields(' Date, Price,,Date ') == ('Date', 'Price')
+
+
+class TestCursor:
+    """Test cases for encode_cursor and decode_cursor."""
+    
+    @pytest.mark.parametrize('key, row', [(0, 0), (1577836800000000000, 12), (-86400000000000, 3)])
+    def test_round_trip(self, key, row):
+        """Test that a cursor decodes to the key and row it was built from."""
+        cursor = encode_cursor(key, row, 'prices')
+        
+        assert decode_cursor(cursor, 'prices') == (key, row)
+        assert '=' not in cursor
+    
+    @pytest.mark.parametrize('cursor', ['', 'not a cursor', '!!!!', 'MTIzNDU2', 'YTpiOmM'])
+    def test_malformed(self, cursor):
+        """Test that malformed cursors raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, 'prices')
+    
+    def test_other_scope(self):
+        """Test that a cursor of another listing raises ValueError."""
+        with pytest.raises(ValueError, match='does not belong'):
+            decode_cursor(encode_cursor(0, 0, 'events'), 'prices')
+
+
+class TestJsonRecords:
+    """Test cases for JsonRecords class."""
+    
+    def test_matches_json_dumps(self, events_df):
+        """Test that encoded records parse to the same values as json.dumps output."""
+        records = JsonRecords(events_df)
+        body = records.encode_positions(range(len(events_df)))
+        
+        expected = {
+            'status': 'success',
+            'count': 5,
+            'data': [
+                {'Date': '2020-03-01', 'Event': 'C', 'Impact': 1.5},
+                {'Date': '2020-01-15', 'Event': 'A', 'Impact': None},
+                {'Date': None, 'Event': 'Undated', 'Impact': 2.0},
+                {'Date': '2020-01-15', 'Event': 'B', 'Impact': 3.0},
+                {'Date': '2020-02-10', 'Event': 'D', 'Impact': 4.0},
+            ],
+        }
+        assert json.loads(body) == expected
+        assert body == json.dumps(expected, separators=(',', ':')).encode()
+    
+    def test_fields_projection(self, events_df):
+        """Test that fields select and order the record keys."""
+        records = JsonRecords(events_df)
+        
+        data = json.loads(records.encode_positions([1], fields=('Event', 'Date')))['data']
+        assert list(data[0].items()) == [('Event', 'A'), ('Date', '2020-01-15')]
+        with pytest.raises(ValueError):
+            records.rows(('Date', 'Missing'))
+        with pytest.raises(ValueError):
+            records.rows(())
+
+
+class TestPricePayload:
+    """Test cases for PricePayload class."""
+    
+    def test_full_range_matches_json_dumps(self, price_df):
+        """Test that the full-range body equals the json.dumps encoding."""
+        payload = PricePayload(price_df)
+        expected = {'status': 'success', 'count': 40, 'data': expected_prices(price_df)}
+        
+        assert payload.encode() == json.dumps(expected, separators=(',', ':')).encode()
+    
+    def test_range_and_fields(self, price_df):
+        """Test that a date range and projection match the sliced frame."""
+        payload = PricePayload(price_df)
+        
+        result = json.loads(payload.encode('2020-01-06', '2020-01-17', fields=('Date', 'Price')))
+        expected = expected_prices(price_df.loc['2020-01-06':'2020-01-17'], fields=('Date', 'Price'))
+        assert result['count'] == 10
+        assert result['data'] == expected
+    
+    def test_unsorted_frame(self, price_df):
+        """Test that an unsorted frame is served in date order."""
+        shuffled = price_df.sample(frac=1, random_state=0)
+        
+        assert PricePayload(shuffled).encode() == PricePayload(price_df).encode()
+    
+    def test_pages_cover_range(self, price_df):
+        """Test that following next_cursor visits every record once and ends without a cursor."""
+        payload = PricePayload(price_df)
+        
+        data, after, pages = [], None, 0
+        while True:
+            page = json.loads(payload.encode_page('2020-01-03', '2020-02-20', after=after, limit=7))
+            data.extend(page['data'])
+            pages += 1
+            after = page['next_cursor']
+            if after is None:
+                break
+        
+        assert data == expected_prices(price_df.loc['2020-01-03':'2020-02-20'])
+        assert pages == int(np.ceil(len(data) / 7))
+        assert page['count'] == len(data) - 7 * (pages - 1)
+    
+    def test_single_page_has_no_cursor(self, price_df):
+        """Test that a page reaching the end of the range has no next_cursor."""
+        payload = PricePayload(price_df)
+        
+        assert json.loads(payload.encode_page(limit=40))['next_cursor'] is None
+        assert json.loads(payload.encode_page(limit=100))['next_cursor'] is None
+        assert json.loads(payload.encode_page(limit=39))['next_cursor'] is not None
+    
+    def test_bad_cursors(self, price_df, events_df):
+        """Test that malformed, foreign and forged cursors raise ValueError."""
+        payload = PricePayload(price_df)
+        events_pager = SortedPager(JsonRecords(events_df).keys, scope='events')
+        _, events_cursor = events_pager.page(limit=1)
+        forged = encode_cursor(int(payload.keys[3]), 4, 'prices')
+        
+        for cursor in ['garbage', events_cursor, forged]:
+            with pytest.raises(ValueError):
+                payload.encode_page(after=cursor, limit=5)
+    
+    def test_invalid_limit(self, price_df):
+        """Test that a non-positive limit raises ValueError."""
+        with pytest.raises(ValueError):
+            PricePayload(price_df).encode_page(limit=0)
+
+
+class TestSortedPager:
+    """Test cases for SortedPager class."""
+    
+    def test_date_order_with_ties(self, events_df):
+        """Test that records are ordered by date, then row, without undated rows."""
+        pager = SortedPager(JsonRecords(events_df).keys)
+        
+        assert pager.order.tolist() == [1, 3, 4, 0]
+    
+    def test_pages_split_ties(self, events_df):
+        """Test that paging through records sharing a date loses none of them."""
+        pager = SortedPager(JsonRecords(events_df).keys, scope='events')
+        
+        positions, after = pager.page(limit=1)
+        seen = positions.tolist()
+        while after is not None:
+            positions, after = pager.page(after=after, limit=1)
+            seen.extend(positions.tolist())
+        assert seen == [1, 3, 4, 0]
+    
+    def test_subset_rejects_outside_cursor(self, events_df):
+        """Test that a cursor for a record outside a filtered listing raises ValueError."""
+        keys = JsonRecords(events_df).keys
+        _, after = SortedPager(keys, scope='events').page(limit=1)
+        
+        with pytest.raises(ValueError):
+            SortedPager(keys, np.array([0, 4]), scope='events').page(after=after)
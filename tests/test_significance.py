@@ -0,0 +1,107 @@
+"""
+Unit tests for the event alignment significance test.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from src.event_matching import associate_change_points_with_events
+from src.significance import event_alignment_test
+
+
+@pytest.fixture
+def events_df():
+    """Fifty events spread over twenty years."""
+    rng = np.random.default_rng(0)
+    dates = pd.date_range('2000-01-01', '2019-12-31', freq='D')
+    return pd.DataFrame({
+        'Date': dates[np.sort(rng.choice(len(dates), 50, replace=False))],
+        'Event': [f'E{i}' for i in range(50)],
+    })
+
+
+@pytest.fixture
+def change_points_df(events_df):
+    """One change point next to an event and one far from any event."""
+    dates = events_df['Date']
+    widest = dates.diff().idxmax()
+    far = dates.iloc[widest - 1] + (dates.iloc[widest] - dates.iloc[widest - 1]) / 2
+    return pd.DataFrame({'change_date': [dates.iloc[10] + pd.Timedelta(days=2), far.normalize()]})
+
+
+class TestEventAlignmentTest:
+    """Test cases for event_alignment_test function."""
+    
+    def test_observed_matches_associations(self, change_points_df, events_df):
+        """Test that observed statistics agree with associate_change_points_with_events."""
+        result = event_alignment_test(change_points_df, events_df, n_replicates=100)
+        associations = associate_change_points_with_events(change_points_df, events_df)
+        
+        matched = associations.dropna(subset=['days_from_change'])
+        grouped = matched.groupby('change_point_date')['days_from_change']
+        counts = grouped.count().reindex(result['change_point_date'], fill_value=0)
+        assert result['observed_matches'].tolist() == counts.tolist()
+        assert result['observed_mean_abs_days'].iloc[0] == grouped.apply(lambda d: d.abs().mean()).iloc[0]
+        assert np.isnan(result['observed_mean_abs_days'].iloc[1])
+    
+    def test_p_values(self, change_points_df, events_df):
+        """Test p-value ranges and the unmatched change point."""
+        result = event_alignment_test(change_points_df, events_df, n_replicates=2000)
+        
+        assert result['count_p_value'].between(0, 1).all()
+        assert result['days_p_value'].iloc[0] < 0.1
+        assert result['count_p_value'].iloc[1] == 1.0
+        assert result['days_p_value'].iloc[1] == 1.0
+    
+    @pytest.mark.parametrize('method', ['shift', 'uniform'])
+    def test_null_mean_matches(self, change_points_df, events_df, method):
+        """Test that the null mean match count equals events x window / period."""
+        result = event_alignment_test(
+            change_points_df, events_df, n_replicates=20000, method=method, window_days=30
+        )
+        
+        span = (events_df['Date'].max() - events_df['Date'].min()).days + 1
+        expected = len(events_df) * 61 / span
+        np.testing.assert_allclose(result['null_mean_matches'], expected, rtol=0.05)
+    
+    def test_shift_null_matches_brute_force(self, change_points_df, events_df):
+        """Test the batched shift null against a direct per-replicate count."""
+        result = event_alignment_test(change_points_df, events_df, n_replicates=5000, random_seed=3)
+        
+        start = events_df['Date'].min()
+        span = (events_df['Date'].max() - start).days + 1
+        event_days = (events_df['Date'] - start).dt.days.to_numpy()
+        cp_days = (change_points_df['change_date'] - start).dt.days.to_numpy()
+        offsets = np.random.default_rng(1).integers(0, span, 5000)
+        shifted = (event_days[None, :] + offsets[:, None]) % span
+        counts = (np.abs(shifted[:, :, None] - cp_days[None, None, :]) <= 30).sum(axis=1)
+        
+        np.testing.assert_allclose(result['null_mean_matches'], counts.mean(axis=0), rtol=0.1)
+    
+    def test_reproducible(self, change_points_df, events_df):
+        """Test that the same seed gives the same result."""
+        first = event_alignment_test(change_points_df, events_df, n_replicates=500, random_seed=7)
+        second = event_alignment_test(change_points_df, events_df, n_replicates=500, random_seed=7)
+        
+        pd.testing.assert_frame_equal(first, second)
+    
+    def test_empty_change_points(self, events_df):
+        """Test that no change points give an empty result with the usual columns."""
+        empty = pd.DataFrame({'change_date': pd.to_datetime([])})
+        result = event_alignment_test(empty, events_df, n_replicates=100)
+        
+        assert len(result) == 0
+        assert list(result.columns) == [
+            'change_point_date', 'observed_matches', 'observed_mean_abs_days',
+            'null_mean_matches', 'count_p_value', 'days_p_value',
+        ]
+    
+    def test_invalid_arguments(self, change_points_df, events_df):
+        """Test validation of method, replicates and study period."""
+        with pytest.raises(ValueError):
+            event_alignment_test(change_points_df, events_df, method='bootstrap')
+        with pytest.raises(ValueError):
+            event_alignment_test(change_points_df, events_df, n_replicates=0)
+        with pytest.raises(ValueError):
+            event_alignment_test(change_points_df, events_df, start='2015-01-01')
@@ -0,0 +1,135 @@
+"""
+Unit tests for stationarity testing functionality.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from src import stationarity
+from src.stationarity import (
+    expanding_stationarity_tests,
+    rolling_stationarity_tests,
+    run_adf_test,
+    run_kpss_test,
+    run_stationarity_tests,
+    summarize_stationarity,
+)
+
+
+@pytest.fixture
+def returns():
+    dates = pd.bdate_range('2000-01-03', periods=400)
+    rng = np.random.default_rng(0)
+    return pd.Series(rng.normal(0, 0.02, size=400), index=dates)
+
+
+@pytest.fixture
+def prices(returns):
+    return 50 * np.exp(returns.cumsum())
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    stationarity.clear_stationarity_cache()
+    yield
+    stationarity.clear_stationarity_cache()
+
+
+class TestFullSeriesTests:
+    """Test cases for full-series ADF and KPSS tests."""
+    
+    def test_adf_on_returns(self, returns):
+        """Test that white-noise returns are judged stationary by ADF."""
+        result = run_adf_test(returns)
+        
+        assert result['is_stationary']
+        assert result['p_value'] < 0.05
+        assert set(result['critical_values']) == {'1%', '5%', '10%'}
+    
+    def test_kpss_on_returns(self, returns):
+        """Test that white-noise returns are judged stationary by KPSS."""
+        result = run_kpss_test(returns)
+        
+        assert result['is_stationary']
+    
+    def test_combined_conclusion(self, returns, prices):
+        """Test combined ADF/KPSS conclusions."""
+        assert run_stationarity_tests(returns)['conclusion'] == 'stationary'
+        assert run_stationarity_tests(prices)['conclusion'] == 'non-stationary'
+
+
+class TestRollingStationarityTests:
+    """Test cases for rolling and expanding window tests."""
+    
+    def test_rolling_windows(self, prices):
+        """Test rolling window output layout and values."""
+        result = rolling_stationarity_tests(prices, window=100, step=50, max_workers=1)
+        
+        assert len(result) == 7  # window ends at 100, 150, ..., 400
+        assert result.index[0] == prices.index[99]
+        assert result['window_start'].iloc[1] == prices.index[50]
+        
+        expected = run_adf_test(prices.iloc[50:150])
+        assert np.isclose(result['adf_statistic'].iloc[1], expected['statistic'])
+        assert result['adf_stationary'].iloc[1] == expected['is_stationary']
+    
+    def test_expanding_windows(self, returns):
+        """Test that expanding windows all start at the first observation."""
+        result = expanding_stationarity_tests(returns, 200, step=100, tests=['kpss'], max_workers=1)
+        
+        assert (result['window_start'] == returns.index[0]).all()
+        assert list(result.columns) == ['window_start', 'kpss_statistic', 'kpss_p_value', 'kpss_stationary']
+    
+    def test_process_pool_matches_serial(self, returns):
+        """Test that the process pool gives the same results as in-process runs."""
+        serial = rolling_stationarity_tests(returns, window=50, step=4, max_workers=1, use_cache=False)
+        pooled = rolling_stationarity_tests(returns, window=50, step=4, max_workers=2, use_cache=False)
+        
+        pd.testing.assert_frame_equal(serial, pooled)
+    
+    def test_memory_cache(self, prices, monkeypatch):
+        """Test that a repeated call is served from cache."""
+        first = rolling_stationarity_tests(prices, window=100, step=50, max_workers=1)
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("windows should not be recomputed")
+        
+        monkeypatch.setattr(stationarity, '_run_window_chunk', fail)
+        second = rolling_stationarity_tests(prices, window=100, step=50, max_workers=1)
+        
+        pd.testing.assert_frame_equal(first, second)
+        with pytest.raises(AssertionError):
+            rolling_stationarity_tests(prices * 2, window=100, step=50, max_workers=1)
+    
+    def test_disk_cache(self, prices, tmp_path, monkeypatch):
+        """Test that results persist to and load from cache_dir."""
+        first = rolling_stationarity_tests(prices, window=100, step=50, max_workers=1, cache_dir=tmp_path)
+        stationarity.clear_stationarity_cache()
+        monkeypatch.setattr(stationarity, '_run_window_chunk', None)
+        
+        second = rolling_stationarity_tests(prices, window=100, step=50, max_workers=1, cache_dir=tmp_path)
+        
+        assert len(list(tmp_path.glob('*.pkl'))) == 1
+        pd.testing.assert_frame_equal(first, second)
+    
+    def test_summarize(self, returns):
+        """Test the share-of-windows summary."""
+        result = rolling_stationarity_tests(returns, window=100, step=100, max_workers=1)
+        summary = summarize_stationarity(result)
+        
+        assert set(summary) == {'adf', 'kpss'}
+        assert 0 <= summary['adf'] <= 1
+    
+    def test_invalid_arguments(self, returns):
+        """Test argument validation."""
+        with pytest.raises(ValueError, match="tests"):
+            rolling_stationarity_tests(returns, window=50, tests=['pp'])
+        with pytest.raises(ValueError, match="window"):
+            rolling_stationarity_tests(returns, window=5)
+        with pytest.raises(ValueError, match="step"):
+            rolling_stationarity_tests(returns, window=50, step=0)
+        with pytest.raises(ValueError, match="regression for kpss"):
+            rolling_stationarity_tests(returns, window=50, regression='n')
+        with pytest.raises(ValueError, match="regression for adf"):
+            rolling_stationarity_tests(returns, window=50, tests=['adf'], regression='x')
@@ -0,0 +1,86 @@
+"""
+Unit tests for the event full-text index.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from src.event_matching import EventIndex, associate_change_points_with_events
+from src.text_index import EventTextIndex, tokenize
+
+
+@pytest.fixture
+def events_df():
+    """Small event catalogue."""
+    return pd.DataFrame({
+        'Date': pd.to_datetime(['2008-09-15', '2014-11-27', '2020-03-11', '2018-05-08', '2022-02-24']),
+        'Event': ['Financial crisis', 'OPEC keeps output', 'COVID-19 pandemic',
+                  'US sanctions on Iran', 'Russia invades Ukraine'],
+        'Description': ['Lehman collapse', 'OPEC declines production cut', 'WHO declares pandemic',
+                        'Sanction reimposed', 'Western sanctions follow'],
+    })
+
+
+class TestTokenize:
+    """Test cases for tokenize function."""
+    
+    def test_tokenize(self):
+        """Test lower-casing and splitting on punctuation."""
+        assert tokenize("COVID-19 Pandemic, OPEC+") == ['covid', '19', 'pandemic', 'opec']
+    
+    def test_tokenize_non_string(self):
+        """Test that missing values produce no tokens."""
+        assert tokenize(np.nan) == []
+
+
+class TestEventTextIndex:
+    """Test cases for EventTextIndex class."""
+    
+    def test_exact_and_prefix_search(self, events_df):
+        """Test exact postings and prefix matching."""
+        index = EventTextIndex(events_df)
+        
+        assert index.postings('OPEC').tolist() == [1]
+        assert index.search('sanctions', prefix=False).tolist() == [3, 4]
+        assert index.search('sanction').tolist() == [3, 4]
+        assert index.search('pan').tolist() == [2]
+    
+    def test_intersection_and_union(self, events_df):
+        """Test 'all' and 'any' match modes."""
+        index = EventTextIndex(events_df)
+        
+        assert index.search('sanctions iran').tolist() == [3]
+        assert index.search('opec pandemic').tolist() == []
+        assert index.search('opec pandemic', match='any').tolist() == [1, 2]
+    
+    def test_matches_str_contains(self, events_df):
+        """Test agreement with a word-prefix str.contains scan."""
+        index = EventTextIndex(events_df)
+        text = (events_df['Event'] + ' ' + events_df['Description']).str.lower()
+        
+        for query in ['opec', 'sanc', 'cr', 'ukraine', 'w']:
+            expected = np.flatnonzero(text.str.contains(r'\b' + query, regex=True))
+            assert index.search(query).tolist() == expected.tolist()
+    
+    def test_empty_query_and_filter(self, events_df):
+        """Test that an empty query matches everything and filter returns rows."""
+        index = EventTextIndex(events_df)
+        
+        assert len(index.search('')) == len(events_df)
+        assert index.filter('crisis')['Event'].tolist() == ['Financial crisis']
+    
+    def test_invalid_match_mode(self, events_df):
+        """Test that an unknown match mode raises."""
+        with pytest.raises(ValueError):
+            EventTextIndex(events_df).search('opec', match='some')
+    
+    def test_event_index_search(self, events_df):
+        """Test keyword-filtered association through EventIndex.search."""
+        change_points_df = pd.DataFrame({'change_date': pd.to_datetime(['2018-05-01', '2022-03-01'])})
+        
+        subset = EventIndex(events_df).search('sanctions')
+        associations = associate_change_points_with_events(change_points_df, subset, window_days=30)
+        
+        assert len(subset) == 2
+        assert associations['event'].tolist() == ['US sanctions on Iran', 'Russia invades Ukraine']
@@ -0,0 +1,156 @@
+"""
+Unit tests for EWMA and GARCH volatility models.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+
+import src.volatility
+from src.volatility import (
+    calculate_ewma_volatility,
+    calculate_garch_volatility,
+    fit_garch,
+    garch_log_likelihood,
+    garch_variance,
+)
+
+
+def simulate_garch(n, omega, alpha, beta, seed=0):
+    """Simulate a GARCH(1,1) return series."""
+    rng = np.random.default_rng(seed)
+    returns = np.empty(n)
+    variance = omega / (1 - alpha - beta)
+    for t in range(n):
+        returns[t] = np.sqrt(variance) * rng.standard_normal()
+        variance = omega + alpha * returns[t] ** 2 + beta * variance
+    dates = pd.bdate_range('2000-01-03', periods=n)
+    return pd.Series(returns, index=dates)
+
+
+def reference_garch_variance(returns, omega, alpha, beta):
+    """Straightforward loop implementation of the GARCH(1,1) recursion."""
+    eps = returns - returns.mean()
+    variance = np.empty(len(eps))
+    variance[0] = eps.var()
+    for t in range(1, len(eps)):
+        variance[t] = omega + alpha * eps[t - 1] ** 2 + beta * variance[t - 1]
+    return variance
+
+
+@pytest.fixture
+def garch_returns():
+    return simulate_garch(3000, omega=2e-5, alpha=0.08, beta=0.9)
+
+
+class TestEwmaVolatility:
+    """Test cases for calculate_ewma_volatility function."""
+    
+    def test_matches_pandas_ewm(self, garch_returns):
+        """Test that the linear-filter EWMA matches pandas ewm."""
+        vol = calculate_ewma_volatility(garch_returns, decay=0.94)
+        expected = np.sqrt((garch_returns ** 2).ewm(alpha=0.06, adjust=False).mean())
+        
+        assert isinstance(vol, pd.Series)
+        np.testing.assert_allclose(vol, expected, rtol=1e-10)
+    
+    def test_multiple_decays(self, garch_returns):
+        """Test batch evaluation over several decay factors."""
+        vol = calculate_ewma_volatility(garch_returns, decay=[0.9, 0.94, 0.97])
+        
+        assert isinstance(vol, pd.DataFrame)
+        assert vol.shape == (len(garch_returns), 3)
+        np.testing.assert_allclose(vol[0.94], calculate_ewma_volatility(garch_returns))
+    
+    def test_leading_nan_skipped(self, garch_returns):
+        """Test that NaN returns are skipped and kept as NaN."""
+        returns = garch_returns.copy()
+        returns.iloc[0] = np.nan
+        vol = calculate_ewma_volatility(returns)
+        
+        assert np.isnan(vol.iloc[0])
+        assert not vol.iloc[1:].isna().any()
+    
+    def test_invalid_decay(self, garch_returns):
+        """Test that decay outside (0, 1) raises ValueError."""
+        with pytest.raises(ValueError, match="decay"):
+            calculate_ewma_volatility(garch_returns, decay=1.0)
+
+
+class TestGarch:
+    """Test cases for GARCH(1,1) filter, likelihood and fit."""
+    
+    def test_variance_matches_recursion(self, garch_returns):
+        """Test that the unrolled filter matches the plain recursion."""
+        values = garch_returns.to_numpy()
+        
+        np.testing.assert_allclose(
+            garch_variance(values, 2e-5, 0.08, 0.9),
+            reference_garch_variance(values, 2e-5, 0.08, 0.9),
+            rtol=1e-9,
+        )
+    
+    def test_batched_parameters(self, garch_returns):
+        """Test that many parameter sets are evaluated at once."""
+        values = garch_returns.to_numpy()
+        omegas = np.array([1e-5, 2e-5, 3e-5])
+        alphas = np.array([0.05, 0.08, 0.1])
+        betas = np.array([0.9, 0.9, 0.85])
+        
+        variance = garch_variance(values, omegas, alphas, betas)
+        
+        assert variance.shape == (3, len(values))
+        for i in range(3):
+            np.testing.assert_allclose(
+                variance[i],
+                reference_garch_variance(values, omegas[i], alphas[i], betas[i]),
+                rtol=1e-9,
+            )
+    
+    def test_log_likelihood(self, garch_returns):
+        """Test the Gaussian log-likelihood and invalid parameter handling."""
+        values = garch_returns.to_numpy()
+        variance = reference_garch_variance(values, 2e-5, 0.08, 0.9)
+        eps = values - values.mean()
+        expected = -0.5 * np.sum(np.log(2 * np.pi) + np.log(variance) + eps ** 2 / variance)
+        
+        assert np.isclose(garch_log_likelihood(values, 2e-5, 0.08, 0.9), expected)
+        
+        batch = garch_log_likelihood(values, [2e-5, -1.0, 2e-5], [0.08, 0.08, 0.5], [0.9, 0.9, 0.6])
+        assert np.isclose(batch[0], expected)
+        assert np.isneginf(batch[1]) and np.isneginf(batch[2])
+    
+    def test_log_likelihood_chunked(self, garch_returns, monkeypatch):
+        """Test that chunking over parameter sets and distinct betas matches one-by-one evaluation."""
+        values = garch_returns.to_numpy()[:300]
+        rng = np.random.default_rng(0)
+        omegas = rng.uniform(1e-6, 5e-5, size=40)
+        alphas = rng.uniform(0.01, 0.15, size=40)
+        betas = rng.choice([0.7, 0.8, 0.85, 0.9, 0.95, 0.99], size=40)
+        betas[::7] = rng.uniform(0.5, 0.8, size=len(betas[::7]))
+        betas[5] = 1.5
+        expected = [garch_log_likelihood(values, o, a, b) for o, a, b in zip(omegas, alphas, betas)]
+        
+        monkeypatch.setattr(src.volatility, "_GARCH_CHUNK_SIZE", 3)
+        result = garch_log_likelihood(values, omegas, alphas, betas)
+        
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+        assert np.isneginf(result[5])
+    
+    def test_fit_recovers_parameters(self, garch_returns):
+        """Test that the grid fit recovers simulated parameters."""
+        fitted = fit_garch(garch_returns)
+        
+        assert abs(fitted['alpha'] - 0.08) < 0.05
+        assert abs(fitted['beta'] - 0.9) < 0.06
+        assert fitted['persistence'] < 1
+        assert fitted['omega'] > 0
+    
+    def test_calculate_garch_volatility(self, garch_returns):
+        """Test conditional volatility series from fitted parameters."""
+        params = {'omega': 2e-5, 'alpha': 0.08, 'beta': 0.9}
+        vol = calculate_garch_volatility(garch_returns, params=params)
+        
+        assert isinstance(vol, pd.Series)
+        assert vol.index.equals(garch_returns.index)
+        assert (vol > 0).all()